@@ -0,0 +1,98 @@
+# coding: utf-8
+'''Standalone benchmarks, run from the repository root, for example:
+
+    python -m benchmarks.sqlite_wal
+
+Each script prints its own measurements.  They are not part of the test
+suite and need the full requirements installed.  Scripts that talk to a
+database build fresh `application.db` and `info.db` files in a temporary
+directory from the scripts in `evechem_api/data`.
+'''
+import os
+import sqlite3
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, 'evechem_api', 'data')
+
+MASTER_KEY = 'benchmark-master-key'
+TOWER_TYPE = 12235 # Amarr Control Tower
+SILO_TYPE = 14343
+HARVESTER_TYPE = 16221 # Moon Harvesting Array
+MOON_MATERIAL = 16634 # Atmospheric Gases
+
+
+def load_script(path, name):
+    '''Runs the sql script `name` from evechem_api/data on the database at `path`.'''
+    connection = sqlite3.connect(path)
+    try:
+        with open(os.path.join(DATA_DIR, name)) as f:
+            connection.executescript(f.read())
+        connection.commit()
+    finally:
+        connection.close()
+
+def use_databases(directory, wal=True):
+    '''use_databases(directory, wal)
+
+    Creates fresh databases in `directory` and points the table maps at them
+    through the environment.  Must run before the first database access.
+    Returns the path of `application.db`.
+    '''
+    application = os.path.join(directory, 'application.db')
+    info = os.path.join(directory, 'info.db')
+    load_script(application, 'application.sql')
+    load_script(info, 'info.sql')
+
+    os.environ['EVECHEM_APPLICATION_DB_URL'] = 'sqlite:///' + application
+    os.environ['EVECHEM_APPLICATION_DB_WAL'] = '1' if wal else '0'
+    os.environ['EVECHEM_INFO_DB_URL'] = 'sqlite:///file:{}?mode=ro&immutable=1&uri=true'.format(info)
+    return application
+
+def seed(path, towers=1, processes=1, equipment=0):
+    '''seed(path, towers, processes, equipment)
+
+    Adds an operation with `MASTER_KEY` to the database at `path`, with
+    `towers` towers, `processes` processes per tower and `equipment` silos per
+    process.  Returns the `(tower_id, [process_id])` pairs.
+    '''
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute("INSERT INTO operations (id, name, public_name) VALUES (1, 'bench', 'bench')")
+        connection.execute("INSERT INTO keys (value, permission, operation_id, name) VALUES (?, 'master', 1, 'bench')", (MASTER_KEY,))
+
+        tree = []
+        equipment_id = 1
+        for t in range(1, towers + 1):
+            connection.execute(
+                'INSERT INTO towers (id, op_id, type, name, online, sov, cycles_at, stront_count, fuel_count, fuel_last_update) '
+                'VALUES (?, 1, ?, ?, 1, 0, 0, 0, 10000, ?)',
+                (t, TOWER_TYPE, 'tower {}'.format(t), int(time.time())))
+            process_ids = []
+            for p in range(processes):
+                process_id = t * 1000 + p
+                connection.execute('INSERT INTO processes (id, tower_id) VALUES (?, ?)', (process_id, t))
+                connection.executemany(
+                    'INSERT INTO equipment (id, type, name, process_id, last_updated, resource, contains, online) '
+                    'VALUES (?, ?, ?, ?, 0, NULL, 0, 1)',
+                    [(equipment_id + e, SILO_TYPE, 'silo', process_id) for e in range(equipment)])
+                equipment_id += equipment
+                process_ids.append(process_id)
+            tree.append((t, process_ids))
+        connection.commit()
+    finally:
+        connection.close()
+    return tree
+
+def best_of(function, repeat=5):
+    '''Smallest wall time in seconds of `repeat` calls to `function`.'''
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def report(name, value, unit):
+    number = '{:>12}' if isinstance(value, int) else '{:>12.3f}'
+    print(('{:<48} ' + number + ' {}').format(name, value, unit))
@@ -0,0 +1,83 @@
+# coding: utf-8
+'''Create throughput: random ids allocated before insert against the old
+insert, commit, shift the id, commit again.
+
+Towers are created one per transaction both ways, then equipment is created
+in batches with one `allocate` call per batch, as the bulk endpoints do.
+
+    python -m benchmarks.id_allocation [--creates 2000] [--batch 100]
+'''
+import argparse
+import random
+import shutil
+import tempfile
+import time
+
+from sqlalchemy.exc import IntegrityError
+
+from . import SILO_TYPE, TOWER_TYPE, report, seed, use_databases
+
+
+def double_commit(session, Tower, count):
+    '''The create path before `maps.ids`: two write transactions per row.'''
+    collisions = 0
+    for i in range(count):
+        tower = Tower(op_id=1, type=TOWER_TYPE, name='tower')
+        session.add(tower)
+        session.commit()
+        try:
+            tower.id += random.randint(0, 999)
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            collisions += 1
+    return collisions
+
+def allocated(session, Tower, allocator, count):
+    for i in range(count):
+        session.add(Tower(id=allocator.next(session), op_id=1, type=TOWER_TYPE, name='tower'))
+        session.commit()
+
+def allocated_batches(session, Equipment, allocator, process_id, count, batch):
+    for start in range(0, count, batch):
+        size = min(batch, count - start)
+        session.add_all([
+            Equipment(id=equipment_id, type=SILO_TYPE, name='silo', process_id=process_id)
+            for equipment_id in allocator.allocate(session, size)])
+        session.commit()
+
+def timed(name, function, count):
+    start = time.perf_counter()
+    result = function()
+    report(name, count / (time.perf_counter() - start), 'creates/sec')
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--creates', type=int, default=2000)
+    parser.add_argument('--batch', type=int, default=100)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        path = use_databases(directory)
+        (tower_id, (process_id,)), = seed(path)
+
+        from evechem_api.maps import application_map, ids
+        session = application_map.Session()
+
+        collisions = timed('towers, insert + commit + shift id + commit',
+            lambda: double_commit(session, application_map.Tower, args.creates), args.creates)
+        report('  id collisions', collisions, 'creates')
+        timed('towers, allocated id + one commit',
+            lambda: allocated(session, application_map.Tower, ids.towers, args.creates), args.creates)
+        timed('equipment, {} allocated ids per commit'.format(args.batch),
+            lambda: allocated_batches(session, application_map.Equipment, ids.equipment,
+                process_id, args.creates, args.batch), args.creates)
+
+        application_map.Session.remove()
+    finally:
+        shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+# coding: utf-8
+'''Encoding throughput of `info_reactions_get` and the equipment listing.
+
+Each body is encoded as connexion renders it (indented, keys sorted) by:
+
+    legacy   the stdlib encoder calling `default()` once per model, as before
+             `encoder.to_primitive`
+    flatten  `encoder.JSONEncoder`, flattening the tree before encoding
+    stdlib   `encoder.dumps` without orjson
+    orjson   `encoder.dumps` with orjson, if it is installed
+
+    python -m benchmarks.json_encoding [--equipment 10000]
+'''
+import argparse
+import json
+import shutil
+import tempfile
+
+from connexion.decorators import produces
+from six import iteritems
+
+from evechem_api import encoder, rows
+from evechem_api.models.base_model_ import Model
+from evechem_api.models.equipment import Equipment
+from evechem_api.models.link import Link
+
+from . import best_of, report, use_databases
+from .model_memory import listing
+
+
+class LegacyJSONEncoder(produces.JSONEncoder):
+    '''The encoder before `to_primitive`: one `default()` call per model.'''
+    include_nulls = False
+
+    def default(self, o):
+        if isinstance(o, Model):
+            dikt = {}
+            for attr, _ in iteritems(o.swagger_types):
+                value = getattr(o, attr)
+                if value is None and not self.include_nulls:
+                    continue
+                dikt[o.attribute_map[attr]] = value
+            return dikt
+        return produces.JSONEncoder.default(self, o)
+
+
+def flask_dumps(cls):
+    # flask.json.dumps with the app's encoder and default settings
+    return lambda o: (json.dumps(o, indent=2, sort_keys=True, cls=cls) + '\n').encode('ascii')
+
+def dumps_without_orjson(o):
+    orjson, encoder.orjson = encoder.orjson, None
+    try:
+        return encoder.dumps(o)
+    finally:
+        encoder.orjson = orjson
+
+def reactions():
+    from evechem_api.controllers import info_controller
+    from evechem_api.maps import info_catalog
+
+    directory = tempfile.mkdtemp()
+    try:
+        use_databases(directory)
+        info_catalog.load()
+    finally:
+        shutil.rmtree(directory)
+    # undecorated, so the body is built rather than served pre-rendered, and
+    # as models rather than row dicts
+    enabled, rows.ENABLED = rows.ENABLED, False
+    try:
+        return info_controller.info_reactions_get.__wrapped__()[0]
+    finally:
+        rows.ENABLED = enabled
+
+def measure(name, data):
+    backends = [
+        ('legacy', flask_dumps(LegacyJSONEncoder)),
+        ('flatten', flask_dumps(encoder.JSONEncoder)),
+        ('stdlib', dumps_without_orjson),
+    ]
+    if encoder.orjson is not None:
+        backends.append(('orjson', encoder.dumps))
+
+    expected = backends[0][1](data)
+    for backend, dumps in backends:
+        assert dumps(data) == expected, backend
+        seconds = best_of(lambda: dumps(data))
+        report('{} {}'.format(name, backend), len(expected) / seconds / 1e6, 'MB/sec')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--equipment', type=int, default=10000)
+    args = parser.parse_args()
+
+    measure('info_reactions_get', reactions())
+    measure('equipment listing', listing(args.equipment, Equipment, Link))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+# coding: utf-8
+'''Memory and allocations of a 10k-equipment listing.
+
+Builds the `Equipment` models (three `Link`s each) that the equipment
+listing returns and measures them with tracemalloc.  `legacy` models add the
+per-instance `swagger_types`/`attribute_map` dicts and `__dict__` the
+generated models carried before they used `__slots__`; `dicts` is the
+direct row-to-dict path of `evechem_api.rows`.
+
+    python -m benchmarks.model_memory [--equipment 10000]
+'''
+import argparse
+import gc
+import time
+import tracemalloc
+
+from evechem_api.models.equipment import Equipment
+from evechem_api.models.link import Link
+
+from . import report
+
+
+class LegacyEquipment(Equipment):
+    '''An `Equipment` laid out like the models before `__slots__`.'''
+
+    def __init__(self, **kwargs):
+        self.swagger_types = dict(Equipment.swagger_types)
+        self.attribute_map = dict(Equipment.attribute_map)
+        super(LegacyEquipment, self).__init__(**kwargs)
+
+class LegacyLink(Link):
+    def __init__(self, **kwargs):
+        self.swagger_types = dict(Link.swagger_types)
+        self.attribute_map = dict(Link.attribute_map)
+        super(LegacyLink, self).__init__(**kwargs)
+
+
+def listing(count, equipment, link):
+    return [
+        equipment(
+            id=i, type=14343, name='silo {}'.format(i), resource=16634,
+            contains=i, last_updated=1500000000, online=True,
+            inputs=[link(source=i + 1, material=16634)],
+            outputs=[link(target=i + 2, material=16634), link(target=i + 3, material=16634)])
+        for i in range(count)]
+
+def measure(name, build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    snapshot = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    blocks = sum(stat.count for stat in snapshot.statistics('filename'))
+    report('{} retained'.format(name), current / 1e6, 'MB')
+    report('{} peak'.format(name), peak / 1e6, 'MB')
+    report('{} live allocations'.format(name), blocks, 'blocks')
+    report('{} build time'.format(name), elapsed * 1000, 'ms')
+    del result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--equipment', type=int, default=10000)
+    args = parser.parse_args()
+
+    measure('legacy', lambda: listing(args.equipment, LegacyEquipment, LegacyLink))
+    measure('slots', lambda: listing(args.equipment, Equipment, Link))
+    measure('dicts', lambda: listing(args.equipment, dict, dict))
+
+if __name__ == '__main__':
+    main()
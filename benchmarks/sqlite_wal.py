@@ -0,0 +1,82 @@
+# coding: utf-8
+'''Concurrent read/write throughput of the starbase endpoints, WAL against
+the rollback journal.
+
+One writer process PATCHes equipment while reader processes list the same
+process's equipment, each through its own app and test client, for a fixed
+time.  The run is repeated with `EVECHEM_APPLICATION_DB_WAL=0`, which keeps
+the other pragmas but leaves sqlite on its rollback journal.
+
+    python -m benchmarks.sqlite_wal [--readers 4] [--seconds 5]
+'''
+import argparse
+import json
+import multiprocessing
+import shutil
+import tempfile
+import time
+
+from . import MASTER_KEY, report, seed, use_databases
+
+EQUIPMENT = 20
+
+
+def _worker(role, tower_id, process_id, start, stop):
+    from evechem_api import create_app
+
+    client = create_app(warm=False).app.test_client()
+    url = '/towers/{}/processes/{}/equipment/'.format(tower_id, process_id)
+    while time.time() < start:
+        time.sleep(0.001)
+
+    done = 0
+    failed = 0
+    while time.time() < stop:
+        if role == 'write':
+            equipment_id = done % EQUIPMENT + 1
+            response = client.patch(
+                '{}{}/?api_key={}'.format(url, equipment_id, MASTER_KEY),
+                data=json.dumps({'last_updated': int(time.time() * 1000) + done}),
+                content_type='application/json')
+        else:
+            response = client.get('{}?api_key={}'.format(url, MASTER_KEY))
+        if response.status_code == 200:
+            done += 1
+        else:
+            failed += 1
+    return role, done, failed
+
+def run(wal, readers, seconds):
+    directory = tempfile.mkdtemp()
+    try:
+        path = use_databases(directory, wal=wal)
+        (tower_id, (process_id,)), = seed(path, equipment=EQUIPMENT)
+
+        # leave time for every worker to build its app before the clock starts
+        start = time.time() + 5
+        stop = start + seconds
+        roles = ['write'] + ['read'] * readers
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(len(roles)) as pool:
+            results = pool.starmap(_worker, [(role, tower_id, process_id, start, stop) for role in roles])
+    finally:
+        shutil.rmtree(directory)
+
+    journal = 'wal' if wal else 'rollback'
+    for role in ('read', 'write'):
+        done = sum(r[1] for r in results if r[0] == role)
+        failed = sum(r[2] for r in results if r[0] == role)
+        report('{} {}s/sec'.format(journal, role), done / float(seconds), 'requests/sec')
+        report('{} failed {}s'.format(journal, role), failed, 'requests')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=5)
+    args = parser.parse_args()
+
+    for wal in (False, True):
+        run(wal, args.readers, args.seconds)
+
+if __name__ == '__main__':
+    main()
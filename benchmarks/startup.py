@@ -0,0 +1,78 @@
+# coding: utf-8
+'''Cold start: the time a fresh worker process takes to import the package,
+build the app and answer its first request.
+
+Each run is a new interpreter.  `lazy` is the default `create_app()`;
+`eager` migrates and warms the static responses at startup, and imports
+every controller up front, as the app did before the factory.  The first
+request lists the operation's towers; a request to /info/towers/ follows.
+
+    python -m benchmarks.startup [--runs 5]
+'''
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from . import MASTER_KEY, ROOT, report, seed, use_databases
+
+PHASES = ('import', 'create_app', 'first request', 'info request')
+
+
+def child(mode):
+    start = time.perf_counter()
+    import evechem_api
+    imported = time.perf_counter()
+
+    if mode == 'eager':
+        app = evechem_api.create_app(migrate=True, warm=True)
+        from evechem_api.controllers import info_controller, operation_controller, starbase_controller
+    else:
+        app = evechem_api.create_app()
+    created = time.perf_counter()
+
+    client = app.app.test_client()
+    assert client.get('/towers/?api_key=' + MASTER_KEY).status_code == 200
+    first = time.perf_counter()
+    assert client.get('/info/towers/').status_code == 200
+    info = time.perf_counter()
+
+    print(json.dumps([imported - start, created - imported, first - created, info - first]))
+
+def run(mode, runs):
+    timings = []
+    for _ in range(runs):
+        directory = tempfile.mkdtemp()
+        try:
+            path = use_databases(directory)
+            seed(path)
+            output = subprocess.check_output(
+                [sys.executable, '-m', 'benchmarks.startup', '--child', mode],
+                cwd=ROOT, env=dict(os.environ))
+        finally:
+            shutil.rmtree(directory)
+        timings.append(json.loads(output.decode('utf-8').splitlines()[-1]))
+
+    for phase, values in zip(PHASES, zip(*timings)):
+        report('{} {}'.format(mode, phase), statistics.median(values) * 1000, 'ms')
+    report('{} total'.format(mode), statistics.median(sum(t) for t in timings) * 1000, 'ms')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--child', choices=('lazy', 'eager'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+    for mode in ('eager', 'lazy'):
+        run(mode, args.runs)
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,72 @@
+import os
+import sys
+
 import connexion
 from .encoder import JSONEncoder
+from .maps import application_map, database, info_map, info_catalog
+from .resolver import LazyResolver
+from . import static_responses
+
+
+def _flag(name, value):
+    if value is None:
+        value = os.environ.get(name, '0') != '0'
+    return value
+
+def migrate_database():
+    '''Brings application.db up to the current schema version.'''
+    database.migrate(application_map.get_engine())
+
+def create_app(migrate=None, warm=None):
+    '''create_app(migrate, warm)
+
+    Builds the connexion app without touching a database: controllers are
+    imported on their first request and the engines are created on first
+    use.  Migrations are a deploy step (`python -m evechem_api migrate`);
+    `migrate` (or `EVECHEM_MIGRATE=1`) runs them here instead.  `warm` (or
+    `EVECHEM_WARM=1`) reads the info catalog and renders the static /info
+    responses up front rather than on their first request.
+    '''
+    if _flag('EVECHEM_MIGRATE', migrate):
+        migrate_database()
+
+    app = connexion.App(__name__, specification_dir='./swagger/')
+    app.app.json_encoder = JSONEncoder
+
+    @app.app.teardown_appcontext
+    def remove_sessions(exception=None):
+        '''Close the sessions used while handling the request.'''
+        application_map.Session.remove()
+        info_map.Session.remove()
+
+    app.add_api('swagger.yaml',
+        arguments={'title': 'No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)'},
+        resolver=LazyResolver())
+
+    if _flag('EVECHEM_WARM', warm):
+        # the info catalog is static, read it once before serving any requests
+        info_catalog.load()
+        # registers the cached /info controllers, then renders them
+        from .controllers import info_controller
+        static_responses.cache.warm()
+
+    return app
+
+
+_app = None
+
+def _get_app():
+    global _app
+    if _app is None:
+        _app = create_app()
+    return _app
 
-app = connexion.App(__name__, specification_dir='./swagger/')
-app.app.json_encoder = JSONEncoder
-app.add_api('swagger.yaml', arguments={'title': 'No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)'})
+if sys.version_info >= (3, 7):
+    # `evechem_api.app` is built on first access, so importing a submodule
+    # (the maps, the models) does not build the whole app
+    def __getattr__(name):
+        if name == 'app':
+            return _get_app()
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+else:
+    app = _get_app()
@@ -0,0 +1,22 @@
+# coding: utf-8
+'''Deploy commands, run as `python -m evechem_api <command>`:
+
+    migrate    bring application.db up to the current schema version
+'''
+import argparse
+
+from . import migrate_database
+
+COMMANDS = {
+    'migrate': migrate_database,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m evechem_api')
+    parser.add_argument('command', choices=sorted(COMMANDS))
+    args = parser.parse_args()
+    COMMANDS[args.command]()
+
+if __name__ == '__main__':
+    main()
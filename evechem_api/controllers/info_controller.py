@@ -12,8 +12,84 @@ from typing import List, Dict
 from six import iteritems
 from ..util import deserialize_date, deserialize_datetime
 
-from evechem_api.maps import info_map
-from sqlalchemy.orm import aliased
+from evechem_api.maps import info_catalog
+from .. import pagination, rows, static_responses
+
+# model fields selectable with `fields=`, in model order
+MATERIAL_FIELDS = ('group', 'name', 'type', 'volume')
+EQUIPMENT_FIELDS = ('allowed_groups', 'capacity', 'fitting', 'group', 'name', 'type')
+REACTION_FIELDS = ('type', 'name', 'outputs', 'inputs')
+
+FITTING_FIELDS = ('cpu', 'powergrid')
+REACTION_MATERIAL_FIELDS = ('type', 'name', 'amount')
+
+
+def _material_info(row, fields=MATERIAL_FIELDS):
+    values = dict(
+        type=row.type,
+        group=row.group_id,
+        name=row.name,
+        volume=row.volume)
+    return rows.build(MaterialInfo, values, fields)
+
+def _equipment_info(row, fields=EQUIPMENT_FIELDS):
+    values = dict(
+        type=row.type,
+        name=row.name,
+        group=row.group_id,
+        capacity=row.capacity)
+    if 'fitting' in fields:
+        values['fitting'] = rows.build(EquipmentInfoFitting, dict(
+            cpu=row.cpu,
+            powergrid=row.powergrid), FITTING_FIELDS)
+    if 'allowed_groups' in fields:
+        values['allowed_groups'] = list(row.allowed_groups)
+    return rows.build(EquipmentInfo, values, fields)
+
+def _reaction_materials(materials):
+    return [
+        rows.build(ReactionMaterial, dict(type=m.type, name=m.name, amount=m.amount), REACTION_MATERIAL_FIELDS)
+        for m in materials]
+
+def _reaction(row, fields=REACTION_FIELDS):
+    values = dict(
+        type=row.type,
+        name=row.name)
+    # nested reaction materials are only built when asked for
+    if 'inputs' in fields:
+        values['inputs'] = _reaction_materials(row.inputs)
+    if 'outputs' in fields:
+        values['outputs'] = _reaction_materials(row.outputs)
+    return rows.build(Reaction, values, fields)
+
+def _listing(all_rows, sorted_rows, build, available, fields, limit, after):
+    '''_listing(all_rows, sorted_rows, build, available, fields, limit, after)
+    NOTE: Helper Function for other controllers, not independent.
+
+    Builds a listing response from catalog `all_rows`.  A paged request reads
+    `sorted_rows` (ordered by type id) instead and gets the next page cursor
+    in its headers.
+    '''
+    fields = pagination.selected(fields, available)
+    if not pagination.paged(limit, after):
+        return [build(row, fields) for row in all_rows], 200
+
+    page = sorted_rows.page(limit, after)
+    headers = pagination.next_headers([row.type for row in page], limit)
+    return [build(row, fields) for row in page], 200, headers
+
+def _tower_info(row):
+    return TowerInfo(
+        type=row.type,
+        fuel_bay=row.fuel_bay,
+        stront_bay=row.stront_bay,
+        name=row.name,
+        storage_mult=row.storage_mult,
+        cpu=row.cpu,
+        powergrid=row.powergrid,
+        fuel_usage=row.fuel_usage,
+        stront_usage=row.stront_usage,
+        fuel_type=row.fuel_type)
 
 def _material_by_group(*group_ids):
     """
@@ -33,25 +109,11 @@ def _material_by_group(*group_ids):
     :rtype: List[MaterialInfo]
     """
 
-    session = info_map.Session()
-    if len(group_ids) > 0:
-        q = session.query(info_map.Material).filter(info_map.Material.group_id.in_(group_ids))
-    else:
-        q = session.query(info_map.Material)
-
-    mats = q.all() # return all rows from result
+    mats = info_catalog.load().materials_in(*group_ids)
     if len(mats) == 0:
         return None
 
-    materials = []
-    for mat in mats:
-        materials.append( MaterialInfo(
-            type=mat.type,
-            group=mat.group_id,
-            name=mat.name,
-            volume=mat.volume))
-
-    return materials
+    return [_material_info(mat) for mat in mats]
 
 def _equipment_by_group(*group_ids):
     """
@@ -71,32 +133,11 @@ def _equipment_by_group(*group_ids):
     :rtype: List[Equipment]
 
     """
-    session = info_map.Session()
-    equipment_list = []
-    if len(group_ids) == 0:
-        q = session.query(info_map.Equipment)
-    else:
-        q = session.query(info_map.Equipment).filter(info_map.Equipment.group_id.in_(group_ids))
-
-    q_equipment_list = q.all()
-
-    if len(q_equipment_list) == 0:
+    equipment = info_catalog.load().equipment_in(*group_ids)
+    if len(equipment) == 0:
         return None
 
-    for q_equipment in q_equipment_list:
-        equipment = EquipmentInfo(
-            type=q_equipment.type,
-            name=q_equipment.name,
-            group=q_equipment.group_id,
-            capacity=q_equipment.capacity,
-            fitting=EquipmentInfoFitting(
-                cpu=q_equipment.cpu,
-                powergrid=q_equipment.powergrid),
-            allowed_groups=[g.group_id for g in q_equipment.groups])
-
-        equipment_list.append(equipment)
-
-    return equipment_list
+    return [_equipment_info(row) for row in equipment]
 
 def _reaction_by_group(*group_ids):
     """
@@ -115,41 +156,11 @@ def _reaction_by_group(*group_ids):
 
     :rtype: List[Reaction]
     """
-    session = info_map.Session()
-    reactions = []
-    if len(group_ids) == 0:
-        q = session.query(info_map.Reaction)
-    else:
-        q = session.query(info_map.Reaction).filter(info_map.Reaction.group_id.in_(group_ids))
-    q_reactions = q.all()
-    if len(q_reactions) == 0:
+    reactions = info_catalog.load().reactions_in(*group_ids)
+    if len(reactions) == 0:
         return None
 
-    for q_reaction in q_reactions:
-
-        outputs = []
-        inputs = []
-        for row in q_reaction.materials:
-            reaction_mat = ReactionMaterial(
-                type=row.material_id,
-                name=row.material.name,
-                amount=row.quantity
-                )
-
-            if row.is_input:
-                inputs.append(reaction_mat)
-            else:
-                outputs.append(reaction_mat)
-
-        reaction = Reaction(
-            type=q_reaction.type,
-            name=q_reaction.name,
-            inputs=inputs,
-            outputs=outputs) 
-
-        reactions.append(reaction)
-
-    return reactions
+    return [_reaction(row) for row in reactions]
 
 def _reaction_by_type(type_id):
     """
@@ -163,47 +174,33 @@ def _reaction_by_type(type_id):
 
     :rtype: List[Reaction]
     """
-    session = info_map.Session()
-
-    q = session.query(info_map.Reaction).filter(info_map.Reaction.type==type_id)
-    q_reaction = q.one_or_none()
-    if q_reaction is None:
+    row = info_catalog.load().reaction_by_type.get(type_id)
+    if row is None:
         return None
 
-    outputs = []
-    inputs = []
-    for row in q_reaction.materials:
-        reaction_mat = ReactionMaterial(
-            type=row.material_id,
-            name=row.material.name,
-            amount=row.quantity
-            )
-
-        if row.is_input:
-            inputs.append(reaction_mat)
-        else:
-            outputs.append(reaction_mat)
+    return _reaction(row)
 
-    reaction = Reaction(
-        type=q_reaction.type,
-        name=q_reaction.name,
-        inputs=inputs,
-        outputs=outputs) 
 
-    return reaction
-
-
-def info_equipment_get():
+@static_responses.cache.cached
+def info_equipment_get(fields=None, limit=None, after=None):
     """
     info_equipment_get
     Gets **array** of all equipment information. 
+    :param fields: Equipment fields to include (default: all).
+    :type fields: List[str]
+    :param limit: Maximum number of equipment types to return.
+    :type limit: int
+    :param after: Only return equipment with a greater &#x60;type_id&#x60;.
+    :type after: int
 
     :rtype: List[EquipmentInfo]
     """
-    equipment = _equipment_by_group()
-    return equipment, 200
+    catalog = info_catalog.load()
+    return _listing(catalog.equipment, catalog.sorted_equipment, _equipment_info,
+        EQUIPMENT_FIELDS, fields, limit, after)
 
 
+@static_responses.cache.cached
 def info_equipment_reactors_get():
     """
     info_equipment_reactors_get
@@ -215,6 +212,7 @@ def info_equipment_reactors_get():
     return equipment, 200
 
 
+@static_responses.cache.cached
 def info_equipment_silos_get():
     """
     info_equipment_silos_get
@@ -226,6 +224,7 @@ def info_equipment_silos_get():
     return equipment, 200
 
 
+@static_responses.cache.cached
 def info_equipment_type_id_get(type_id):
     """
     ...
@@ -235,21 +234,10 @@ def info_equipment_type_id_get(type_id):
 
     :rtype: EquipmentInfo
     """
-    session = info_map.Session()
+    row = info_catalog.load().equipment_by_type.get(type_id)
 
-    q = session.query(info_map.Equipment).filter(info_map.Equipment.type == type_id)
-    q_equipment = q.one_or_none()
-
-    if q_equipment is not None:
-        equipment = EquipmentInfo(
-            type=q_equipment.type,
-            name=q_equipment.name,
-            group=q_equipment.group_id,
-            capacity=q_equipment.capacity,
-            fitting=EquipmentInfoFitting(
-                cpu=q_equipment.cpu,
-                powergrid=q_equipment.powergrid),
-            allowed_groups=[g.group_id for g in q_equipment.groups])
+    if row is not None:
+        equipment = _equipment_info(row)
 
         return equipment
 
@@ -258,6 +246,7 @@ def info_equipment_type_id_get(type_id):
         return error, 404
 
 
+@static_responses.cache.cached
 def info_materials_booster_get():
     """
     info_materials_booster_get
@@ -269,6 +258,7 @@ def info_materials_booster_get():
     return materials, 200
 
 
+@static_responses.cache.cached
 def info_materials_composites_get():
     """
     info_materials_composites_get
@@ -280,6 +270,7 @@ def info_materials_composites_get():
     return materials, 200
 
 
+@static_responses.cache.cached
 def info_materials_gas_get():
     """
     info_materials_gas_get
@@ -291,17 +282,26 @@ def info_materials_gas_get():
     return materials, 200
 
 
-def info_materials_get():
+@static_responses.cache.cached
+def info_materials_get(fields=None, limit=None, after=None):
     """
     info_materials_get
     Get **array** of information for all materials, or if an array of &#x60;type_ids&#x60; is included, information on only those materials. 
+    :param fields: Material fields to include (default: all).
+    :type fields: List[str]
+    :param limit: Maximum number of materials to return.
+    :type limit: int
+    :param after: Only return materials with a greater &#x60;type_id&#x60;.
+    :type after: int
 
     :rtype: List[MaterialInfo]
     """
-    materials = _material_by_group() # empty means all groups
-    return materials, 200
+    catalog = info_catalog.load()
+    return _listing(catalog.materials, catalog.sorted_materials, _material_info,
+        MATERIAL_FIELDS, fields, limit, after)
 
 
+@static_responses.cache.cached
 def info_materials_groups_get():
     """
     info_materials_groups_get
@@ -309,16 +309,12 @@ def info_materials_groups_get():
 
     :rtype: List[Group]
     """
-    session = info_map.Session()
-
-    mat = aliased(info_map.Material)
-    grp = aliased(info_map.Group)
-
-    q = session.query(mat.group_id,grp.name).join(grp).distinct()
-    groups = [Group(group=row.group_id,name=row.name) for row in q.all()]
+    material_groups = info_catalog.load().material_groups()
+    groups = [Group(group=row.group_id,name=row.name) for row in material_groups]
     return groups, 200
 
 
+@static_responses.cache.cached
 def info_materials_intermediates_get():
     """
     info_materials_intermediates_get
@@ -330,6 +326,7 @@ def info_materials_intermediates_get():
     return materials, 200
 
 
+@static_responses.cache.cached
 def info_materials_polymer_get():
     """
     info_materials_polymer_get
@@ -341,6 +338,7 @@ def info_materials_polymer_get():
     return materials, 200
 
 
+@static_responses.cache.cached
 def info_materials_raw_get():
     """
     info_materials_raw_get
@@ -352,6 +350,7 @@ def info_materials_raw_get():
     return materials, 200
 
 
+@static_responses.cache.cached
 def info_materials_type_id_get(type_id):
     """
     info_materials_type_id_get
@@ -361,22 +360,16 @@ def info_materials_type_id_get(type_id):
 
     :rtype: MaterialInfo
     """
-    session = info_map.Session()
-    q = session.query(info_map.Material).filter(info_map.Material.type == type_id)
-
-    mat = q.one_or_none() # return the only result or `None`
+    mat = info_catalog.load().material_by_type.get(type_id)
 
     if mat is not None:
-        material_info = MaterialInfo(
-            type=mat.type,
-            group=mat.group_id,
-            name=mat.name,
-            volume=mat.volume)
+        material_info = _material_info(mat)
         return material_info, 200
     else:
         error = Error('Type {} Not Found'.format(type_id))
         return error, 404
 
+@static_responses.cache.cached
 def info_reactions_complex_biochemical_get():
     """
     info_reactions_complex_biochemical_get
@@ -388,6 +381,7 @@ def info_reactions_complex_biochemical_get():
     return reactions, 200
 
 
+@static_responses.cache.cached
 def info_reactions_complex_get():
     """
     info_reactions_complex_get
@@ -399,18 +393,27 @@ def info_reactions_complex_get():
     return reactions, 200
 
 
-def info_reactions_get():
+@static_responses.cache.cached
+def info_reactions_get(fields=None, limit=None, after=None):
     """
     info_reactions_get
     Gets **array** of all information for &#x60;reaction&#x60; items that belong to any &#x60;reaction&#x60; group. 
+    :param fields: Reaction fields to include (default: all).
+    :type fields: List[str]
+    :param limit: Maximum number of reactions to return.
+    :type limit: int
+    :param after: Only return reactions with a greater &#x60;type_id&#x60;.
+    :type after: int
 
     :rtype: List[Reaction]
     """
-    reactions = _reaction_by_group()
-    return reactions, 200
+    catalog = info_catalog.load()
+    return _listing(catalog.reactions, catalog.sorted_reactions, _reaction,
+        REACTION_FIELDS, fields, limit, after)
 
 
 
+@static_responses.cache.cached
 def info_reactions_polymer_get():
     """
     info_reactions_polymer_get
@@ -422,6 +425,7 @@ def info_reactions_polymer_get():
     return reactions, 200
 
 
+@static_responses.cache.cached
 def info_reactions_simple_biochemical_get():
     """
     info_reactions_simple_biochemical_get
@@ -433,6 +437,7 @@ def info_reactions_simple_biochemical_get():
     return reactions, 200
 
 
+@static_responses.cache.cached
 def info_reactions_simple_get():
     """
     info_reactions_simple_get
@@ -444,6 +449,7 @@ def info_reactions_simple_get():
     return reactions, 200
 
 
+@static_responses.cache.cached
 def info_reactions_type_id_get(type_id):
     """
     info_reactions_type_id_get
@@ -461,6 +467,7 @@ def info_reactions_type_id_get(type_id):
         return reactions, 200
 
 
+@static_responses.cache.cached
 def info_towers_get():
     """
     info_towers_get
@@ -468,29 +475,12 @@ def info_towers_get():
 
     :rtype: List[TowerInfo]
     """
-    session = info_map.Session()
-
-    q = session.query(info_map.Tower)
-    q_towers = q.all()
-    towers = []
-    for q_tower in q_towers:
-        tower = TowerInfo(
-            type=q_tower.type,
-            fuel_bay=q_tower.fuel_bay,
-            stront_bay=q_tower.stront_bay,
-            name=q_tower.name,
-            storage_mult=q_tower.storage_mult,
-            cpu=q_tower.cpu,
-            powergrid=q_tower.powergrid,
-            fuel_usage=q_tower.fuel_usage,
-            stront_usage=q_tower.stront_usage,
-            fuel_type=q_tower.fuel_type)
-
-        towers.append(tower)
+    towers = [_tower_info(row) for row in info_catalog.load().towers]
 
     return towers, 200
 
 
+@static_responses.cache.cached
 def info_towers_type_id_get(type_id):
     """
     info_towers_type_id_get
@@ -500,26 +490,13 @@ def info_towers_type_id_get(type_id):
 
     :rtype: TowerInfo
     """
-    session = info_map.Session()
-
-    q = session.query(info_map.Tower).filter(info_map.Tower.type==type_id)
-    q_tower = q.one_or_none()
+    row = info_catalog.load().tower_by_type.get(type_id)
 
-    if q_tower is None:
+    if row is None:
         error = Error('Type {} Not Found'.format(type_id))
         return error, 404
     else:
-        tower = TowerInfo(
-            type=q_tower.type,
-            fuel_bay=q_tower.fuel_bay,
-            stront_bay=q_tower.stront_bay,
-            name=q_tower.name,
-            storage_mult=q_tower.storage_mult,
-            cpu=q_tower.cpu,
-            powergrid=q_tower.powergrid,
-            fuel_usage=q_tower.fuel_usage,
-            stront_usage=q_tower.stront_usage,
-            fuel_type=q_tower.fuel_type)
+        tower = _tower_info(row)
 
         return tower, 200
 
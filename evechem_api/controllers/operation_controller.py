@@ -10,6 +10,7 @@ from six import iteritems
 from ..util import deserialize_date, deserialize_datetime
 
 from evechem_api.maps import application_map
+from evechem_api import pagination
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm.exc import NoResultFound
 
@@ -50,6 +51,7 @@ def operation_delete(api_key):
     q_operation = session.query(qOperation).filter(qOperation.id == api_key.operation_id).one()
     session.delete(q_operation)
     session.commit()
+    APIKey.invalidate(operation_id=api_key.operation_id)
 
     return None, 200
 
@@ -81,24 +83,29 @@ def operation_get(api_key):
     return operation, 200
 
 @keycontrol.restricted(requires=['master'])
-def operation_keys_get(api_key):
+def operation_keys_get(api_key, limit=None, after=None):
     """
     operation_keys_get
     Returns &#x60;array&#x60; of operation access sub-keys that exist for this operation. 
     :param api_key: Operation Master Access Key
     :type api_key: str
+    :param limit: Maximum number of keys to return.
+    :type limit: int
+    :param after: Only return keys with a greater &#x60;value&#x60;.
+    :type after: str
 
     :rtype: List[Key]
     """
-    qOperation = application_map.Operation
     qKey = application_map.Key
 
     session = application_map.Session()
-    q_operation = session.query(qOperation).filter(qOperation.id == api_key.operation_id).one()
+    q_keys = session.query(qKey.name, qKey.value, qKey.permission) \
+        .filter(qKey.operation_id == api_key.operation_id)
+    q_keys = pagination.keyset(q_keys, qKey.value, limit, after).all()
 
-    keys = [Key(k.name, k.value, k.permission) for k in q_operation.keys]
+    keys = [Key(k.name, k.value, k.permission) for k in q_keys]
 
-    return keys,200
+    return keys, 200, pagination.next_headers([k.value for k in q_keys], limit)
 
 @keycontrol.restricted(requires=['master'])
 def operation_keys_post(api_key, new_key):
@@ -135,6 +142,7 @@ def operation_keys_post(api_key, new_key):
             operation_id=api_key.operation_id)
         session.add(q_newkey)
         session.commit()
+        APIKey.invalidate(key.value) # in case the value was cached as missing
 
         return key, 200
 
@@ -163,6 +171,7 @@ def operation_keys_sub_key_delete(sub_key, api_key):
     else:
         session.delete(q_key)
         session.commit()
+        APIKey.invalidate(sub_key)
         return None, 200
 
 @keycontrol.restricted(requires=['master'])
@@ -231,6 +240,7 @@ def operation_keys_sub_key_patch(sub_key, api_key, key_update):
         q_key.name = q_key.name if key_update.name is None else key_update.name
         q_key.permission = q_key.permission if key_update.permission is None else key_update.permission
         session.commit()
+        APIKey.invalidate(sub_key)
         return key_update, 200
 
 @keycontrol.restricted(requires=['master'])
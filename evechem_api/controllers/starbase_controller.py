@@ -1,12 +1,15 @@
 import connexion
 from evechem_api.models.equipment import Equipment
 from evechem_api.models.equipment_update import EquipmentUpdate
+from evechem_api.models.equipment_bulk_update import EquipmentBulkUpdate
 from evechem_api.models.error import Error
 from evechem_api.models.new_equipment import NewEquipment
 from evechem_api.models.link import Link
 from evechem_api.models.new_tower import NewTower
 from evechem_api.models.process import Process
+from evechem_api.models.process_graph import ProcessGraph
 from evechem_api.models.tower_details import TowerDetails
+from evechem_api.models.tower_fuel import TowerFuel
 from datetime import date, datetime
 from typing import List, Dict
 from six import iteritems
@@ -15,7 +18,6 @@ from ..util import deserialize_date, deserialize_datetime
 from sqlalchemy import and_, or_
 from sqlalchemy.orm.exc import NoResultFound
 
-import random
 import time
 
 from evechem_api.security.definitions import APIKeyControl, APIKey
@@ -23,6 +25,9 @@ keycontrol = APIKeyControl(key_type=APIKey, key_param='api_key')
 
 from evechem_api.maps import application_map
 from evechem_api.maps import info_map
+from evechem_api.maps import info_catalog
+from evechem_api.maps import ids
+from evechem_api import fuel, pagination, rows
 
 # required access level presets
 AT_LEAST_AUDITOR = ['master','director','manager', 'auditor']
@@ -40,6 +45,57 @@ class ResourceNotFound(Exception):
 class InvalidLinkMaterial(Exception):
     pass
 
+class OwnershipNotFound(Exception):
+    '''Raised by `resolve_owned`.  `resource` names the first level of the
+    tower -> process -> equipment path that does not exist (or does not belong
+    to the key's operation), and `resource_id` the id that was requested.
+    '''
+    def __init__(self, resource, resource_id):
+        super(OwnershipNotFound, self).__init__('{} `{}` not Found'.format(resource, resource_id))
+        self.resource = resource
+        self.resource_id = resource_id
+
+    def error(self):
+        return Error(str(self))
+
+def resolve_owned(session, api_key, tower_id, process_id=None, equipment_id=None):
+    '''resolve_owned(session, api_key, tower_id, process_id, equipment_id)
+
+    Loads a tower owned by `api_key`'s operation and, when given, the process
+    under that tower and the equipment under that process, in a single joined
+    query.  Returns a `(tower, process, equipment)` tuple with `None` for the
+    levels that were not requested.
+
+    Raises `OwnershipNotFound` for the first level that does not match.
+    '''
+    qTower = application_map.Tower
+    qProcess = application_map.Process
+    qEquipment = application_map.Equipment
+
+    q = session.query(qTower)
+    if process_id is not None:
+        q = q.add_entity(qProcess).outerjoin(
+            qProcess, and_(qProcess.tower_id==qTower.id, qProcess.id==process_id))
+        if equipment_id is not None:
+            q = q.add_entity(qEquipment).outerjoin(
+                qEquipment, and_(qEquipment.process_id==qProcess.id, qEquipment.id==equipment_id))
+
+    row = q.filter(and_(qTower.id==tower_id, qTower.op_id==api_key.operation_id)).one_or_none()
+    if row is None:
+        raise OwnershipNotFound('Tower', tower_id)
+
+    if process_id is None:
+        return row, None, None
+
+    row = tuple(row) + (None,) * (3 - len(row))
+    q_tower, q_process, q_equipment = row
+    if q_process is None:
+        raise OwnershipNotFound('Process', process_id)
+    if equipment_id is not None and q_equipment is None:
+        raise OwnershipNotFound('Equipment', equipment_id)
+
+    return q_tower, q_process, q_equipment
+
 class ProcessTree(object):
 
     def __init__(self, equipment):
@@ -55,52 +111,59 @@ class ProcessTree(object):
 
 
     def _in_production_branch(self, node):
-        if type(node) is StorageNode:
-            for child in node.children:
+        '''True if a production node feeds `node` through storage nodes only.
+        Walks every storage branch (iteratively, so deep chains and cycles are safe).
+        '''
+        if type(node) is not StorageNode:
+            return False
+
+        seen = set([node.id])
+        stack = [node]
+        while stack:
+            for child in stack.pop().children:
                 if type(child) is ProductionNode:
                     return True
-                elif type(child) is StorageNode:
-                    return self._in_production_branch(child)
+                elif child.id not in seen:
+                    seen.add(child.id)
+                    stack.append(child)
 
-            return False
+        return False
 
     @classmethod
     def fromId(cls, process_id):
-        qEquipmentInfo = info_map.Equipment
-        info_session = info_map.Session()
-        storage_types = [e.type for e in info_session.query(qEquipmentInfo).filter(qEquipmentInfo.group_id==404).all()]
+        storage_types = info_catalog.load().storage_types
 
-        nodes = {}
-
-        qProcess = application_map.Process
+        qEquipment = application_map.Equipment
+        qLink = application_map.Link
         session = application_map.Session()
 
-        q_process = session.query(qProcess).filter(qProcess.id==process_id).one()
-        for q_equipment in q_process.equipment:
-            if q_equipment.type in storage_types:
+        nodes = {}
+        q_equipment = session.query(qEquipment.id, qEquipment.type, qEquipment.resource) \
+            .filter(qEquipment.process_id==process_id)
+        for equipment_id, equipment_type, resource in q_equipment:
+            if equipment_type in storage_types:
                 Node = StorageNode
             else:
                 Node = ProductionNode
+            nodes[equipment_id] = Node(id=equipment_id, resource=resource)
 
-            nodes[q_equipment.id] = Node(
-                id=q_equipment.id,
-                children=[l.source for l in q_equipment.inputs],
-                parents=[l.target for l in q_equipment.outputs])
+        # one query for every link in the process, instead of inputs/outputs per node
+        q_links = session.query(qLink.source, qLink.target) \
+            .join(qEquipment, qLink.source==qEquipment.id) \
+            .filter(qEquipment.process_id==process_id)
+        for source, target in q_links:
+            if source in nodes and target in nodes:
+                nodes[target].children.append(nodes[source])
+                nodes[source].parents.append(nodes[target])
 
-        # properly link nodes
-        for node_id in nodes:
-            node = nodes[node_id]
-            node.children = [nodes[id] for id in node.children]
-            node.parents = [nodes[id] for id in node.parents]
-
-
-        return cls(equipment=[nodes[id] for id in nodes])
+        return cls(equipment=list(nodes.values()))
 
 class ProcessNode(object):
-    def __init__(self, id, children=[], parents=[]):
+    def __init__(self, id, resource=None, children=None, parents=None):
         self.id = id
-        self.children = children
-        self.parents = parents
+        self.resource = resource
+        self.children = [] if children is None else children
+        self.parents = [] if parents is None else parents
 
 class ProductionNode(ProcessNode):
     pass
@@ -108,10 +171,35 @@ class ProductionNode(ProcessNode):
 class StorageNode(ProcessNode):
     pass
 
-def make_link(source_id, target_id, material_id):
-    '''make_link(source_id, target_id, material_id)
+def refresh_final_outputs(session, q_process):
+    '''refresh_final_outputs(session, q_process)
 
-    creates a link entry with the given parameters.
+    Recomputes the production endpoints of `q_process` and updates its
+    materialized `outputs` rows in place: endpoints that went away are
+    deleted, new ones added and changed materials updated.  Must be called
+    (before committing) whenever equipment or links of the process change.
+    '''
+    qProcessOutput = application_map.ProcessOutput
+
+    session.flush() # the tree is read back from the database
+    tree = ProcessTree.fromId(q_process.id)
+    endpoints = set(tree.production_endpoints())
+    wanted = dict((n.id, n.resource) for n in tree.equipment if n.id in endpoints)
+
+    for q_output in list(q_process.outputs):
+        if q_output.equipment_id not in wanted:
+            q_process.outputs.remove(q_output)
+        else:
+            q_output.material = wanted.pop(q_output.equipment_id)
+    for equipment_id in sorted(wanted):
+        q_process.outputs.append(qProcessOutput(equipment_id=equipment_id, material=wanted[equipment_id]))
+
+    q_process.outputs_stale = False
+
+def make_link(q_source, q_target, material_id):
+    '''make_link(q_source, q_target, material_id)
+
+    creates a link entry between the given equipment rows.  The caller commits.
 
     if either the source or target equipment does not produce/consume 
     the material_id, returns a InvalidLinkMaterial exception.  If a material
@@ -119,116 +207,193 @@ def make_link(source_id, target_id, material_id):
     is replaced with the new one.  This happens silently.
     '''
     qLink = application_map.Link
-    qEquipment = application_map.Equipment
     session = application_map.Session()
 
-
-    source_linkable = available_links(source_id)
-    target_linkable = available_links(target_id, outputs=False)
+    catalog = info_catalog.load()
+    source_linkable = catalog.linkable(q_source.type, q_source.resource)
+    target_linkable = catalog.linkable(q_target.type, q_target.resource, outputs=False)
 
     if material_id in source_linkable and material_id in target_linkable:
         # see if this material has been linked to/from either source or target equipment
+        # (resource repeated in each branch, so sqlite searches an index for both)
         q_link = session.query(qLink).filter(
-            and_(
-                qLink.resource==material_id,
-                or_(
-                    qLink.source==source_id,
-                    qLink.target==target_id))).one_or_none()
+            or_(
+                and_(qLink.resource==material_id, qLink.source==q_source.id),
+                and_(qLink.resource==material_id, qLink.target==q_target.id))).one_or_none()
         if q_link is None:
             # link does not exist, make a new one
             q_link = qLink(
-                source=source_id,
-                target=target_id,
+                source=q_source.id,
+                target=q_target.id,
                 resource=material_id)
             session.add(q_link)
         else:
             # the material was linked already, just modify the old link
-            q_link.source = source_id
-            q_link.target = target_id
-
-        session.commit()
+            q_link.source = q_source.id
+            q_link.target = q_target.id
 
     else:
         raise InvalidLinkMaterial('Not a valid Link Material (must be both an output at source and input at target).')
 
-def available_links(equipment_id, outputs=True):
-    qEquipment = application_map.Equipment
-    qEquipmentInfo = info_map.Equipment
-    qMaterial = info_map.Material
-    qReaction = info_map.Reaction
+def resource_allowed(equipment_type, resource_type):
+    '''resource_allowed(equipment_type, resource_type)
 
-    session = application_map.Session()
-    info_session = info_map.Session()
+    True if equipment of `equipment_type` can hold `resource_type`.  Answered
+    from the info catalog, without queries.
 
-    q_equipment = session.query(qEquipment).filter(qEquipment.id==equipment_id).one()
+    Raises `EquipmentNotFound` or `ResourceNotFound` for unknown types.
+    '''
+    catalog = info_catalog.load()
 
-    # special handle for mining arrays (unlike silos they have no inputs)
-    mining_equipment_type = info_session.query(qEquipmentInfo).filter(qEquipmentInfo.name=='Moon Harvesting Array')
-    if q_equipment.type == mining_equipment_type:
-        if outputs:
-            return [q_equipment.resource]
-        else:
-            return []
+    allowed_groups = catalog.allowed_groups_by_type.get(equipment_type)
+    if allowed_groups is None:
+        raise EquipmentNotFound('Equipment `{}` not valid.'.format(equipment_type))
 
-    resource = q_equipment.resource
-    if resource is None:
-        return []
-    else:
-        q_reaction = info_session.query(qReaction).filter(qReaction.type==resource).one_or_none()
-        if q_reaction is None:
-            q_material = info_session.query(qMaterial).filter(qMaterial.type==resource).one()
-            return [resource]
-        else:
-            if outputs:
-                return [m.material_id for m in q_reaction.outputs]
-            else:
-                return [m.material_id for m in q_reaction.inputs]
+    group_id = catalog.group_by_resource.get(resource_type)
+    if group_id is None:
+        raise ResourceNotFound('Resource `{}` not valid.'.format(resource_type))
 
-def resource_allowed(equipment_type, resource_type):
-    qEquipment = info_map.Equipment
-    qGroup = info_map.Group
-    qMaterial = info_map.Material
-    qReaction = info_map.Reaction
+    return group_id in allowed_groups
 
-    session = info_map.Session()
+def equipment_error(equipment_type, resource_type):
+    '''equipment_error(equipment_type, resource_type)
+
+    Checks an equipment type and the resource put in it against the info
+    catalog, without touching the database.  Returns an error message, or
+    `None` if both are valid (a `None` resource is always valid).
+    '''
+    if equipment_type not in info_catalog.load().equipment_by_type:
+        return 'Equipment of type `{}` not valid.'.format(equipment_type)
+
+    if resource_type is None:
+        return None
 
-    
     try:
-        q_equipment = session.query(qEquipment).filter(qEquipment.type==equipment_type).one()
-    except NoResultFound:
-        raise EquipmentNotFound('Equipment `{}` not valid.'.format(equipment_type))
+        if not resource_allowed(equipment_type, resource_type):
+            return 'Resource `{}` not allowed in equipment of type `{}`.'.format(resource_type, equipment_type)
+    except ResourceNotFound as e:
+        return str(e)
 
-    q_material = session.query(qMaterial).filter(qMaterial.type==resource_type).one_or_none()
-    q_reaction = session.query(qReaction).filter(qReaction.type==resource_type).one_or_none()
+    return None
 
-    if q_material is None:
-        if q_reaction is None:
-            raise ResourceNotFound('Resource `{}` not valid.'.format(resource_type))
-        else:
-            q_resource = q_reaction
-    else:
-        q_resource = q_material
+def equipment_links(session, equipment_ids, inputs=True, outputs=True, as_dicts=False):
+    '''equipment_links(session, equipment_ids, inputs, outputs, as_dicts)
 
-    if q_equipment.groups.filter(qGroup.group_id==q_resource.group_id).one_or_none() is None:
-        return False
-    else:
-        return True
+    Loads the input and/or output `Link` models (or, with `as_dicts`, the
+    dicts they encode to) of many equipment at once, with one query per
+    direction.  Returns `(inputs, outputs)` dicts keyed by equipment id.
+    '''
+    qLink = application_map.Link
+    link_type = dict if as_dicts else Link
+
+    input_links = {}
+    output_links = {}
+    if inputs and len(equipment_ids) > 0:
+        q_links = session.query(qLink.target, qLink.source, qLink.resource) \
+            .filter(qLink.target.in_(equipment_ids)) \
+            .order_by(qLink.target, qLink.source, qLink.resource)
+        for target, source, material in q_links:
+            input_links.setdefault(target, []).append(link_type(source=source, material=material))
+    if outputs and len(equipment_ids) > 0:
+        q_links = session.query(qLink.source, qLink.target, qLink.resource) \
+            .filter(qLink.source.in_(equipment_ids)) \
+            .order_by(qLink.source, qLink.target, qLink.resource)
+        for source, target, material in q_links:
+            output_links.setdefault(source, []).append(link_type(target=target, material=material))
+
+    return input_links, output_links
 
 @keycontrol.restricted(requires=AT_LEAST_AUDITOR)
-def towers_get(api_key):
+def towers_get(api_key, limit=None, after=None):
     """
     towers_get
     Gets summary information for every tower the request is authenticated to see.  This includes &#x60;tower_id&#x60; number, &#x60;type_id&#x60;, fuel status, as well as what the tower is producing at the endpoints of its reaction/mining chains. 
     :param api_key: Operation Access Key
     :type api_key: str
+    :param limit: Maximum number of towers to return.
+    :type limit: int
+    :param after: Only return towers with a greater &#x60;tower_id&#x60;.
+    :type after: int
 
     :rtype: List[int]
     """
-    qOperation = application_map.Operation
+    qTower = application_map.Tower
+    session = application_map.Session()
+
+    q_towers = session.query(qTower.id).filter(qTower.op_id == api_key.operation_id)
+    tower_ids = [row[0] for row in pagination.keyset(q_towers, qTower.id, limit, after)]
+
+    return tower_ids, 200, pagination.next_headers(tower_ids, limit)
+
+@keycontrol.restricted(requires=AT_LEAST_AUDITOR)
+def towers_fuel_get(api_key):
+    """
+    towers_fuel_get
+    Gets fuel and strontium projections for every tower in the operation: current fuel, when it runs out and how much fills the fuel bay. 
+    :param api_key: Operation Access Key
+    :type api_key: str
+
+    :rtype: List[TowerFuel]
+    """
+    session = application_map.Session()
+
+    projections = fuel.project_operation(session, api_key.operation_id)
+    towers = [TowerFuel(**p._asdict()) for p in projections]
+
+    return towers, 200
+
+# TowerDetails fields, in model order
+TOWER_FIELDS = (
+    'cycles_at', 'stront_count', 'fuel_count', 'fuel_last_update', 'id', 'system',
+    'planet', 'moon', 'name', 'online', 'processes', 'sov', 'type')
+
+@keycontrol.restricted(requires=AT_LEAST_AUDITOR)
+def towers_summary_get(api_key, fields=None, limit=None, after=None):
+    """
+    towers_summary_get
+    Gets details for every tower in the operation, ordered by &#x60;tower_id&#x60;.  Replaces a &#x60;/towers/{tower_id}/&#x60; call per tower.
+    :param api_key: Operation Access Key
+    :type api_key: str
+    :param fields: Tower fields to include (default: all).
+    :type fields: List[str]
+    :param limit: Maximum number of towers to return.
+    :type limit: int
+    :param after: Only return towers with a greater &#x60;tower_id&#x60;.
+    :type after: int
+
+    :rtype: List[TowerDetails]
+    """
+    qTower = application_map.Tower
+    qProcess = application_map.Process
     session = application_map.Session()
-    q_operation = session.query(qOperation).filter(qOperation.id == api_key.operation_id).one()
 
-    return [t.id for t in q_operation.towers], 200
+    fields = pagination.selected(fields, TOWER_FIELDS)
+    columns = [f for f in fields if f not in ('id', 'processes')]
+
+    # only the selected columns are loaded, id always is for paging
+    q_towers = session.query(qTower.id, *[getattr(qTower, c) for c in columns]) \
+        .filter(qTower.op_id == api_key.operation_id)
+    q_towers = pagination.keyset(q_towers, qTower.id, limit, after).all()
+    tower_ids = [row[0] for row in q_towers]
+
+    processes = {}
+    if 'processes' in fields and len(tower_ids) > 0:
+        q_processes = session.query(qProcess.tower_id, qProcess.id) \
+            .filter(qProcess.tower_id.in_(tower_ids)) \
+            .order_by(qProcess.tower_id, qProcess.id)
+        for t_id, p_id in q_processes:
+            processes.setdefault(t_id, []).append(p_id)
+
+    towers = []
+    for row in q_towers:
+        values = dict(zip(columns, row[1:]))
+        if 'id' in fields:
+            values['id'] = row[0]
+        if 'processes' in fields:
+            values['processes'] = processes.get(row[0], [])
+        towers.append(rows.build(TowerDetails, values, fields))
+
+    return towers, 200, pagination.next_headers(tower_ids, limit)
 
 @keycontrol.restricted(requires=AT_LEAST_DIRECTOR)
 def towers_post(tower_details, api_key):
@@ -251,6 +416,7 @@ def towers_post(tower_details, api_key):
     qTower = application_map.Tower
     session = application_map.Session()
     newTower = qTower(
+        id=ids.towers.next(session),
         op_id=api_key.operation_id,
         type=tower_details.type,
         name=tower_details.name,
@@ -266,11 +432,8 @@ def towers_post(tower_details, api_key):
 
     session.add(newTower)
     session.commit()
-    newTower.id += random.randint(0,999) # add some uncertainty so that id is not directly tower count
     tower_details.id = newTower.id
 
-    session.commit()
-
     return tower_details, 200
 
 @keycontrol.restricted(requires=AT_LEAST_AUDITOR)
@@ -289,11 +452,10 @@ def towers_tower_id_get(tower_id, api_key):
     qTower = application_map.Tower
     session = application_map.Session()
 
-    # find the tower
-    q_tower = session.query(qTower).filter(qTower.id == tower_id).one_or_none()
-    if q_tower is None or q_tower.op_id != api_key.operation_id:
-        error = Error('Tower `{}` not Found'.format(tower_id))
-        return error, 404
+    try:
+        q_tower, _, _ = resolve_owned(session, api_key, tower_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
     else:
         tower_details = TowerDetails(
             id=q_tower.id,
@@ -327,10 +489,10 @@ def towers_tower_id_delete(tower_id, api_key):
     qTower = application_map.Tower
     session = application_map.Session()
 
-    q_tower = session.query(qTower).filter(qTower.id == tower_id).one_or_none()
-    if q_tower is None or q_tower.op_id != api_key.operation_id:
-        error = Error('Tower `{}` not Found'.format(tower_id))
-        return error, 404
+    try:
+        q_tower, _, _ = resolve_owned(session, api_key, tower_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
     else:
         session.delete(q_tower)
         session.commit()
@@ -356,10 +518,10 @@ def towers_tower_id_patch(tower_id, api_key, tower_update=None):
     qTower = application_map.Tower
     session = application_map.Session()
 
-    q_tower = session.query(qTower).filter(qTower.id == tower_id).one_or_none()
-    if q_tower is None or q_tower.op_id != api_key.operation_id:
-        error = Error('Tower `{}` not Found'.format(tower_id))
-        return error, 404
+    try:
+        q_tower, _, _ = resolve_owned(session, api_key, tower_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
     else:
         if tower_update.type is not None:
             q_tower.type = tower_update.type
@@ -420,18 +582,44 @@ def towers_tower_id_processes_get(tower_id, api_key):
     qTower = application_map.Tower
     session = application_map.Session()
 
-    # find the tower
-    q_tower = session.query(qTower).filter(qTower.id == tower_id).one_or_none()
-    if q_tower is None or q_tower.op_id != api_key.operation_id:
-        error = Error('Tower `{}` not Found'.format(tower_id))
-        return error, 404
+    try:
+        q_tower, _, _ = resolve_owned(session, api_key, tower_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
+
+    qEquipment = application_map.Equipment
+    qProcessOutput = application_map.ProcessOutput
+
+    q_processes = q_tower.processes.all()
+
+    # processes written before outputs were materialized
+    stale = [q_process for q_process in q_processes if q_process.outputs_stale]
+    for q_process in stale:
+        refresh_final_outputs(session, q_process)
+    if len(stale) > 0:
+        session.commit()
+
+    process_ids = [q_process.id for q_process in q_processes]
+    equipment = dict((process_id, []) for process_id in process_ids)
+    final_outputs = dict((process_id, []) for process_id in process_ids)
+    if len(process_ids) > 0:
+        q_equipment = session.query(qEquipment.process_id, qEquipment.id) \
+            .filter(qEquipment.process_id.in_(process_ids))
+        for process_id, equipment_id in q_equipment:
+            equipment[process_id].append(equipment_id)
+
+        q_outputs = session.query(qProcessOutput.process_id, qProcessOutput.material) \
+            .filter(qProcessOutput.process_id.in_(process_ids)) \
+            .order_by(qProcessOutput.process_id, qProcessOutput.equipment_id)
+        for process_id, material in q_outputs:
+            final_outputs[process_id].append(material)
 
     processes = []
-    for q_process in q_tower.processes:
+    for process_id in process_ids:
         processes.append(Process(
-            id=q_process.id,
-            equipment = [e.id for e in q_process.equipment],
-            final_outputs=[]))
+            id=process_id,
+            equipment=equipment[process_id],
+            final_outputs=final_outputs[process_id]))
 
     return processes, 200
 
@@ -451,17 +639,14 @@ def towers_tower_id_processes_post(tower_id, api_key):
     qTower = application_map.Tower
     session = application_map.Session()
 
-    # find the tower
-    q_tower = session.query(qTower).filter(qTower.id == tower_id).one_or_none()
-    if q_tower is None or q_tower.op_id != api_key.operation_id:
-        error = Error('Tower `{}` not Found'.format(tower_id))
-        return error, 404
+    try:
+        q_tower, _, _ = resolve_owned(session, api_key, tower_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
 
-    q_process = qProcess()
+    q_process = qProcess(id=ids.processes.next(session), outputs_stale=False) # no equipment, so no outputs
     q_tower.processes.append(q_process)
     session.commit()
-    q_process.id += random.randint(0,99) # add some uncertainty so that id is not directly count
-    session.commit() # commit the updated id
     process = Process(
         id=q_process.id,
         equipment=[],
@@ -488,31 +673,22 @@ def towers_tower_id_processes_process_id_get(tower_id, process_id, api_key):
     qEquipment = application_map.Equipment
     session = application_map.Session()
 
-    # find the tower
-    q_tower = session.query(qTower).filter(qTower.id == tower_id).one_or_none()
-    if q_tower is None or q_tower.op_id != api_key.operation_id:
-        error = Error('Tower `{}` not Found'.format(tower_id))
-        return error, 404
-
     try:
-        q_process = q_tower.processes.filter(qProcess.id==process_id).one()
-        equipment = [e.id for e in q_process.equipment]
+        q_tower, q_process, _ = resolve_owned(session, api_key, tower_id, process_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
 
-        process_tree = ProcessTree.fromId(q_process.id)
-        endpoints = process_tree.production_endpoints()
-
-        final_outputs = [e.resource for e in q_process.equipment.filter(qEquipment.id.in_(endpoints))]
-        # final_outputs = [e.id for e in endpoints]
-        process = Process(
-            id=q_process.id,
-            equipment=equipment,
-            final_outputs=final_outputs) # not fully implemnted yet
+    if q_process.outputs_stale:
+        refresh_final_outputs(session, q_process)
+        session.commit()
 
-        return process, 200
+    equipment = [e.id for e in q_process.equipment.with_entities(qEquipment.id)]
+    process = Process(
+        id=q_process.id,
+        equipment=equipment,
+        final_outputs=[o.material for o in q_process.outputs])
 
-    except NoResultFound:
-        error = Error('Process `{}` not Found'.format(process_id))
-        return error, 404
+    return process, 200
 
 @keycontrol.restricted(requires=AT_LEAST_DIRECTOR)
 def towers_tower_id_processes_process_id_delete(tower_id, process_id, api_key):
@@ -532,21 +708,14 @@ def towers_tower_id_processes_process_id_delete(tower_id, process_id, api_key):
     qTower = application_map.Tower
     session = application_map.Session()
 
-    # find the tower
-    q_tower = session.query(qTower).filter(qTower.id == tower_id).one_or_none()
-    if q_tower is None or q_tower.op_id != api_key.operation_id:
-        error = Error('Tower `{}` not Found'.format(tower_id))
-        return error, 404
-
     try:
-        q_process = q_tower.processes.filter(qProcess.id==process_id).one()
-        session.delete(q_process)
-        session.commit()
-        return None,200
+        q_tower, q_process, _ = resolve_owned(session, api_key, tower_id, process_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
 
-    except NoResultFound:
-        error = Error('Process `{}` not Found'.format(process_id))
-        return error, 404
+    session.delete(q_process)
+    session.commit()
+    return None,200
 
 @keycontrol.restricted(requires=AT_LEAST_MANAGER)
 def towers_tower_id_processes_process_id_link_post(tower_id, process_id, link, api_key):
@@ -573,34 +742,128 @@ def towers_tower_id_processes_process_id_link_post(tower_id, process_id, link, a
     qProcess = application_map.Process
     session = application_map.Session()
 
-    # find the tower
-    q_tower = session.query(qTower).filter(qTower.id == tower_id).one_or_none()
-    if q_tower is None or q_tower.op_id != api_key.operation_id:
-        error = Error('Tower `{}` not Found'.format(tower_id))
-        return error, 404
-
-    q_process = q_tower.processes.filter(qProcess.id==process_id).one_or_none()
-    if q_process is None or q_process.id != process_id:
-        error = Error('Process `{}` not Found'.format(process_id))
-        return error, 404
-
-    # testing to see if the equipment are even valid
     try:
-        q_source = session.query(qEquipment).filter(and_(qEquipment.id==link.source, qEquipment.process_id==process_id)).one()
-        q_target = session.query(qEquipment).filter(and_(qEquipment.id==link.target, qEquipment.process_id==process_id)).one()
-        make_link(link.source,link.target,link.material)
-
-    except NoResultFound:
+        q_tower, q_process, _ = resolve_owned(session, api_key, tower_id, process_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
+
+    # testing to see if the equipment are even valid, both ends in one query
+    q_ends = session.query(qEquipment).filter(
+        and_(qEquipment.id.in_([link.source, link.target]), qEquipment.process_id==process_id))
+    q_ends = dict((e.id, e) for e in q_ends)
+    if link.source not in q_ends or link.target not in q_ends:
         error = Error('Equipment to link not found.')
         return error, 400
+
+    try:
+        make_link(q_ends[link.source], q_ends[link.target], link.material)
+        refresh_final_outputs(session, q_process)
+        session.commit()
+
     except InvalidLinkMaterial as e:
         return Error(message=str(e)), 400
 
 
 
 
+@keycontrol.restricted(requires=AT_LEAST_DIRECTOR)
+def towers_tower_id_processes_import_post(tower_id, process_graph, api_key):
+    """
+    towers_tower_id_processes_import_post
+    Creates a process from a whole graph of equipment and the links between them, in a single transaction.  Nothing is created if any equipment or link is invalid.
+    :param tower_id: Tower Id number to look under.
+    :type tower_id: int
+    :param process_graph: Equipment and links of the new process.
+    :type process_graph: dict | bytes
+    :param api_key: Operation Access Key
+    :type api_key: str
+
+    :rtype: Process
+    """
+    if connexion.request.is_json:
+        process_graph = ProcessGraph.from_dict(connexion.request.get_json())
+
+    qProcess = application_map.Process
+    qEquipment = application_map.Equipment
+    qLink = application_map.Link
+    session = application_map.Session()
+
+    try:
+        q_tower, _, _ = resolve_owned(session, api_key, tower_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
+
+    # validate every node and link in memory before writing anything
+    catalog = info_catalog.load()
+    nodes = {}
+    for index, node in enumerate(process_graph.equipment):
+        if node.key in nodes:
+            return Error('Equipment {}: key `{}` is used more than once.'.format(index, node.key)), 400
+        message = equipment_error(node.type, node.resource)
+        if message is not None:
+            return Error('Equipment {}: {}'.format(index, message)), 400
+        nodes[node.key] = node
+
+    links = process_graph.links or []
+    linked_from = set()
+    linked_to = set()
+    for index, link in enumerate(links):
+        source = nodes.get(link.source)
+        target = nodes.get(link.target)
+        if source is None or target is None:
+            missing = link.source if source is None else link.target
+            return Error('Link {}: equipment `{}` not in the graph.'.format(index, missing)), 400
+
+        if link.material not in catalog.linkable(source.type, source.resource) \
+                or link.material not in catalog.linkable(target.type, target.resource, outputs=False):
+            message = 'Not a valid Link Material (must be both an output at source and input at target).'
+            return Error('Link {}: {}'.format(index, message)), 400
+
+        # a material slot holds one link at each end
+        if (link.source, link.material) in linked_from or (link.target, link.material) in linked_to:
+            return Error('Link {}: material `{}` is already linked at its source or target.'.format(
+                index, link.material)), 400
+        linked_from.add((link.source, link.material))
+        linked_to.add((link.target, link.material))
+
+    now = int(time.time())
+    q_process = qProcess(id=ids.processes.next(session))
+    q_tower.processes.append(q_process)
+
+    q_nodes = {}
+    equipment_ids = ids.equipment.allocate(session, len(process_graph.equipment))
+    for node, equipment_id in zip(process_graph.equipment, equipment_ids):
+        q_nodes[node.key] = qEquipment(
+            id=equipment_id,
+            last_updated=now,
+            resource=node.resource,
+            contains=node.contains or 0,
+            type=node.type,
+            name=node.name or catalog.equipment_by_type[node.type].name,
+            online=node.online or False)
+        q_process.equipment.append(q_nodes[node.key])
+
+    session.add_all([
+        qLink(source=q_nodes[l.source].id, target=q_nodes[l.target].id, resource=l.material)
+        for l in links])
+    refresh_final_outputs(session, q_process)
+    session.commit()
+
+    process = Process(
+        id=q_process.id,
+        equipment=[q_nodes[node.key].id for node in process_graph.equipment],
+        final_outputs=[o.material for o in q_process.outputs])
+
+    return process, 200
+
+# Equipment fields, in model order
+EQUIPMENT_FIELDS = (
+    'contains', 'id', 'type', 'online', 'inputs', 'last_updated', 'outputs', 'resource', 'name')
+# equipment table columns read by the listing, id first
+EQUIPMENT_COLUMNS = ('id', 'type', 'name', 'resource', 'contains', 'last_updated', 'online')
+
 @keycontrol.restricted(requires=AT_LEAST_AUDITOR)
-def towers_tower_id_processes_process_id_equipment_get(tower_id, process_id, api_key):
+def towers_tower_id_processes_process_id_equipment_get(tower_id, process_id, api_key, fields=None, limit=None, after=None):
     """
     towers_tower_id_processes_process_id_equipment_get
     
@@ -610,40 +873,45 @@ def towers_tower_id_processes_process_id_equipment_get(tower_id, process_id, api
     :type process_id: int
     :param api_key: Operation Access Key
     :type api_key: str
+    :param fields: Equipment fields to include (default: all).
+    :type fields: List[str]
+    :param limit: Maximum number of equipment to return.
+    :type limit: int
+    :param after: Only return equipment with a greater &#x60;equipment_id&#x60;.
+    :type after: int
 
     :rtype: List[Equipment]
     """
     qEquipment = application_map.Equipment
-    qEquipmentInfo = info_map.Equipment
-    qTower = application_map.Tower
-    qProcess = application_map.Process
     session = application_map.Session()
 
-    # find the tower
-    q_tower = session.query(qTower).filter(qTower.id == tower_id).one_or_none()
-    if q_tower is None or q_tower.op_id != api_key.operation_id:
-        error = Error('Tower `{}` not Found'.format(tower_id))
-        return error, 404
-    # find process
-    q_process = q_tower.processes.filter(qProcess.id==process_id).one_or_none()
-    if q_process is None or q_process.id != process_id:
-        error = Error('Process `{}` not Found'.format(process_id))
-        return error, 404
+    try:
+        q_tower, q_process, _ = resolve_owned(session, api_key, tower_id, process_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
+
+    fields = pagination.selected(fields, EQUIPMENT_FIELDS)
+
+    # plain column tuples, no ORM identities
+    q_equipment = session.query(*[getattr(qEquipment, c) for c in EQUIPMENT_COLUMNS]) \
+        .filter(qEquipment.process_id == q_process.id)
+    q_equipment = pagination.keyset(q_equipment, qEquipment.id, limit, after).all()
+    equipment_ids = [row[0] for row in q_equipment]
+
+    # links of the whole page, and only when selected
+    inputs, outputs = equipment_links(
+        session, equipment_ids, 'inputs' in fields, 'outputs' in fields, as_dicts=rows.ENABLED)
 
     equipment = []
-    for e in q_process.equipment:
-        equipment.append(Equipment(
-            id=e.id,
-            type=e.type,
-            name=e.name,
-            resource=e.resource,
-            contains=e.contains,
-            last_updated=e.last_updated,
-            online=e.online,
-            inputs=[Link(source=l.source,material=l.resource) for l in e.inputs],
-            outputs=[Link(target=l.target,material=l.resource) for l in e.outputs])) # need to implement links still
+    for row in q_equipment:
+        values = dict(zip(EQUIPMENT_COLUMNS, row))
+        if 'inputs' in fields:
+            values['inputs'] = inputs.get(row[0], [])
+        if 'outputs' in fields:
+            values['outputs'] = outputs.get(row[0], [])
+        equipment.append(rows.build(Equipment, values, fields))
 
-    return equipment, 200
+    return equipment, 200, pagination.next_headers(equipment_ids, limit)
 
 @keycontrol.restricted(requires=AT_LEAST_MANAGER)
 def towers_tower_id_processes_process_id_equipment_post(tower_id, process_id, equipment, api_key):
@@ -664,14 +932,12 @@ def towers_tower_id_processes_process_id_equipment_post(tower_id, process_id, eq
     if connexion.request.is_json:
         equipment = Equipment.from_dict(connexion.request.get_json())
 
-    try:   
-        # check if equipment type is valid and set the default name
-        info_session = info_map.Session()
-        qEquipmentInfo = info_map.Equipment
-        default_name = info_session.query(qEquipmentInfo).filter(qEquipmentInfo.type==equipment.type).one().name
-    except NoResultFound:
+    # check if equipment type is valid and set the default name
+    equipment_info = info_catalog.load().equipment_by_type.get(equipment.type)
+    if equipment_info is None:
         error = Error('Equipment of type `{}` not valid.'.format(equipment.type))
         return error, 400
+    default_name = equipment_info.name
 
     qEquipment = application_map.Equipment
 
@@ -679,16 +945,10 @@ def towers_tower_id_processes_process_id_equipment_post(tower_id, process_id, eq
     qProcess = application_map.Process
     session = application_map.Session()
 
-    # find the tower
-    q_tower = session.query(qTower).filter(qTower.id == tower_id).one_or_none()
-    if q_tower is None or q_tower.op_id != api_key.operation_id:
-        error = Error('Tower `{}` not Found'.format(tower_id))
-        return error, 404
-
-    q_process = q_tower.processes.filter(qProcess.id==process_id).one_or_none()
-    if q_process is None or q_process.id != process_id:
-        error = Error('Process `{}` not Found'.format(process_id))
-        return error, 404
+    try:
+        q_tower, q_process, _ = resolve_owned(session, api_key, tower_id, process_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
 
     # validate resource
     if equipment.resource is not None:
@@ -712,6 +972,7 @@ def towers_tower_id_processes_process_id_equipment_post(tower_id, process_id, eq
     equipment.outputs = []
 
     q_equipment = qEquipment(
+        id=ids.equipment.next(session),
         last_updated=equipment.last_updated,
         resource=equipment.resource,
         contains=equipment.contains,
@@ -720,15 +981,165 @@ def towers_tower_id_processes_process_id_equipment_post(tower_id, process_id, eq
         online=equipment.online)
 
     q_process.equipment.append(q_equipment)
+    refresh_final_outputs(session, q_process)
     session.commit()
-    q_equipment.id += random.randint(0,49) # add some uncertainty so that id is not directly count
     equipment.id = q_equipment.id
-    session.commit()
 
     
 
     return equipment, 200
 
+@keycontrol.restricted(requires=AT_LEAST_MANAGER)
+def towers_tower_id_processes_process_id_equipment_bulk_post(tower_id, process_id, equipment, api_key):
+    """
+    towers_tower_id_processes_process_id_equipment_bulk_post
+    Adds every equipment in the array to the process in a single transaction.  Nothing is added if any item is invalid.
+    :param tower_id: Tower Id number to look under.
+    :type tower_id: int
+    :param process_id: Process Id number to look under.
+    :type process_id: int
+    :param equipment: 
+    :type equipment: List[NewEquipment]
+    :param api_key: Operation Access Key
+    :type api_key: str
+
+    :rtype: List[Equipment]
+    """
+    if connexion.request.is_json:
+        equipment = [NewEquipment.from_dict(d) for d in connexion.request.get_json()]
+
+    qEquipment = application_map.Equipment
+    session = application_map.Session()
+
+    try:
+        q_tower, q_process, _ = resolve_owned(session, api_key, tower_id, process_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
+
+    # validate the whole array before adding anything
+    catalog = info_catalog.load()
+    for index, item in enumerate(equipment):
+        message = equipment_error(item.type, item.resource)
+        if message is not None:
+            return Error('Equipment {}: {}'.format(index, message)), 400
+
+    now = int(time.time())
+    q_new = []
+    equipment_ids = ids.equipment.allocate(session, len(equipment))
+    for item, equipment_id in zip(equipment, equipment_ids):
+        # set defaults if values not included
+        q_new.append(qEquipment(
+            id=equipment_id,
+            last_updated=now,
+            resource=item.resource,
+            contains=item.contains or 0,
+            type=item.type,
+            name=item.name or catalog.equipment_by_type[item.type].name,
+            online=item.online or False))
+
+    q_process.equipment.extend(q_new)
+    refresh_final_outputs(session, q_process)
+    session.commit()
+
+    created = [
+        Equipment(
+            id=q_equipment.id,
+            type=q_equipment.type,
+            name=q_equipment.name,
+            resource=q_equipment.resource,
+            contains=q_equipment.contains,
+            last_updated=q_equipment.last_updated,
+            online=q_equipment.online,
+            inputs=[],
+            outputs=[])
+        for q_equipment in q_new]
+
+    return created, 200
+
+@keycontrol.restricted(requires=AT_LEAST_MANAGER)
+def towers_tower_id_processes_process_id_equipment_bulk_patch(tower_id, process_id, equipment, api_key):
+    """
+    towers_tower_id_processes_process_id_equipment_bulk_patch
+    Updates every equipment in the array, matched by &#x60;id&#x60;, in a single transaction.  Nothing is changed if any item is invalid.
+    :param tower_id: Tower Id number to look under.
+    :type tower_id: int
+    :param process_id: Process Id number to look under.
+    :type process_id: int
+    :param equipment: 
+    :type equipment: List[EquipmentBulkUpdate]
+    :param api_key: Operation Access Key
+    :type api_key: str
+
+    :rtype: List[Equipment]
+    """
+    if connexion.request.is_json:
+        equipment = [EquipmentBulkUpdate.from_dict(d) for d in connexion.request.get_json()]
+
+    qEquipment = application_map.Equipment
+    session = application_map.Session()
+
+    try:
+        q_tower, q_process, _ = resolve_owned(session, api_key, tower_id, process_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
+
+    equipment_ids = [item.id for item in equipment]
+    q_equipment = session.query(qEquipment) \
+        .filter(and_(qEquipment.process_id == q_process.id, qEquipment.id.in_(equipment_ids))) \
+        .all() if len(equipment_ids) > 0 else []
+    q_by_id = dict((e.id, e) for e in q_equipment)
+
+    # validate the whole array before changing anything
+    for index, item in enumerate(equipment):
+        q_item = q_by_id.get(item.id)
+        if q_item is None:
+            return OwnershipNotFound('Equipment', item.id).error(), 404
+        if item.resource is not None and item.resource != q_item.resource:
+            message = equipment_error(q_item.type, item.resource)
+            if message is not None:
+                return Error('Equipment {}: {}'.format(index, message)), 400
+
+    changed_resource = []
+    for item in equipment:
+        q_item = q_by_id[item.id]
+        q_item.name = item.name or q_item.name
+        if item.resource is not None and item.resource != q_item.resource:
+            q_item.resource = item.resource
+            changed_resource.append(q_item.id)
+        if item.contains is not None:
+            q_item.contains = item.contains
+        if item.last_updated is not None:
+            q_item.last_updated = item.last_updated
+        if item.online is not None:
+            q_item.online = item.online
+
+    # links carried the old resource, drop them in one statement
+    if len(changed_resource) > 0:
+        qLink = application_map.Link
+        session.query(qLink) \
+            .filter(or_(qLink.source.in_(changed_resource), qLink.target.in_(changed_resource))) \
+            .delete(synchronize_session=False)
+
+    refresh_final_outputs(session, q_process)
+    session.commit()
+
+    inputs, outputs = equipment_links(session, list(q_by_id))
+    result = []
+    for item in equipment:
+        q_item = q_by_id[item.id]
+        result.append(Equipment(
+            id=q_item.id,
+            type=q_item.type,
+            name=q_item.name,
+            resource=q_item.resource,
+            contains=q_item.contains,
+            last_updated=q_item.last_updated,
+            online=q_item.online,
+            inputs=inputs.get(q_item.id, []),
+            outputs=outputs.get(q_item.id, [])))
+
+    return result, 200
+
 @keycontrol.restricted(requires=AT_LEAST_MANAGER)
 def towers_tower_id_processes_process_id_equipment_equipment_id_delete(tower_id, process_id, equipment_id, api_key):
     """
@@ -751,24 +1162,13 @@ def towers_tower_id_processes_process_id_equipment_equipment_id_delete(tower_id,
     qProcess = application_map.Process
     session = application_map.Session()
 
-    # find the tower
-    q_tower = session.query(qTower).filter(qTower.id == tower_id).one_or_none()
-    if q_tower is None or q_tower.op_id != api_key.operation_id:
-        error = Error('Tower `{}` not Found'.format(tower_id))
-        return error, 404
-
-    # find process
-    q_process = q_tower.processes.filter(qProcess.id==process_id).one_or_none()
-    if q_process is None or q_process.id != process_id:
-        error = Error('Process `{}` not Found'.format(process_id))
-        return error, 404
-
-    q_equipment = q_process.equipment.filter(qEquipment.id==equipment_id).one_or_none()
-    if q_equipment is None or q_equipment.id != equipment_id:
-        error = Error('Equipment `{}` not Found'.format(equipment_id))
-        return error, 404
+    try:
+        q_tower, q_process, q_equipment = resolve_owned(session, api_key, tower_id, process_id, equipment_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
     
     session.delete(q_equipment)
+    refresh_final_outputs(session, q_process)
     session.commit()
 
     return None, 200
@@ -797,22 +1197,10 @@ def towers_tower_id_processes_process_id_equipment_equipment_id_get(tower_id, pr
     qProcess = application_map.Process
     session = application_map.Session()
 
-    # find the tower
-    q_tower = session.query(qTower).filter(qTower.id == tower_id).one_or_none()
-    if q_tower is None or q_tower.op_id != api_key.operation_id:
-        error = Error('Tower `{}` not Found'.format(tower_id))
-        return error, 404
-
-    # find process
-    q_process = q_tower.processes.filter(qProcess.id==process_id).one_or_none()
-    if q_process is None or q_process.id != process_id:
-        error = Error('Process `{}` not Found'.format(process_id))
-        return error, 404
-
-    q_equipment = q_process.equipment.filter(qEquipment.id==equipment_id).one_or_none()
-    if q_equipment is None or q_equipment.id != equipment_id:
-        error = Error('Equipment `{}` not Found'.format(equipment_id))
-        return error, 404
+    try:
+        q_tower, q_process, q_equipment = resolve_owned(session, api_key, tower_id, process_id, equipment_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
 
     equipment = Equipment(
         id=q_equipment.id,
@@ -854,21 +1242,10 @@ def towers_tower_id_processes_process_id_equipment_equipment_id_patch(tower_id,
     qProcess = application_map.Process
     session = application_map.Session()
 
-    # find the tower
-    q_tower = session.query(qTower).filter(qTower.id == tower_id).one_or_none()
-    if q_tower is None or q_tower.op_id != api_key.operation_id:
-        error = Error('Tower `{}` not Found'.format(tower_id))
-        return error, 404
-    # find process
-    q_process = q_tower.processes.filter(qProcess.id==process_id).one_or_none()
-    if q_process is None or q_process.id != process_id:
-        error = Error('Process `{}` not Found'.format(process_id))
-        return error, 404
-
-    q_equipment = q_process.equipment.filter(qEquipment.id==equipment_id).one_or_none()
-    if q_equipment is None or q_equipment.id != equipment_id:
-        error = Error('Equipment `{}` not Found'.format(equipment_id))
-        return error, 404
+    try:
+        q_tower, q_process, q_equipment = resolve_owned(session, api_key, tower_id, process_id, equipment_id)
+    except OwnershipNotFound as e:
+        return e.error(), 404
 
     q_equipment.name = equipment.name or q_equipment.name
 
@@ -884,6 +1261,7 @@ def towers_tower_id_processes_process_id_equipment_equipment_id_patch(tower_id,
     q_equipment.contains = equipment.contains or q_equipment.resource
     q_equipment.last_updated = equipment.last_updated or q_equipment.last_updated
     q_equipment.online = equipment.online or q_equipment.online
+    refresh_final_outputs(session, q_process)
     session.commit()
     equipment = Equipment(
         id=q_equipment.id,
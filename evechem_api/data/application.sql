@@ -44,6 +44,7 @@ CREATE TABLE `towers` (
 CREATE TABLE "processes" (
 	`id`	INTEGER,
 	`tower_id`	INTEGER,
+	`outputs_stale`	INTEGER NOT NULL DEFAULT 1,
 	PRIMARY KEY(id)
 	FOREIGN KEY(tower_id) REFERENCES towers(id)
 );
@@ -68,6 +69,31 @@ CREATE TABLE "links" (
 	FOREIGN KEY(target) REFERENCES equipment(id)
 );
 
+CREATE TABLE `process_outputs` (
+	`process_id`	INTEGER,
+	`equipment_id`	INTEGER,
+	`material`	INTEGER,
+	PRIMARY KEY(process_id,equipment_id)
+	FOREIGN KEY(process_id) REFERENCES processes(id)
+);
+
+/* Migrations already included in this schema, see migrations/ */
+CREATE TABLE `schema_migrations` (
+	`version`	INTEGER,
+	PRIMARY KEY(version)
+);
+INSERT INTO `schema_migrations` (version) VALUES (1),
+ (2);
+
+/* Secondary indexes, kept in step with migrations/ */
+CREATE INDEX `keys_operation_id` ON `keys` (`operation_id`);
+CREATE INDEX `towers_op_id` ON `towers` (`op_id`);
+CREATE INDEX `processes_tower_id` ON `processes` (`tower_id`);
+CREATE INDEX `equipment_process_id` ON `equipment` (`process_id`);
+CREATE INDEX `links_source` ON `links` (`source`);
+CREATE INDEX `links_resource_source` ON `links` (`resource`, `source`);
+CREATE INDEX `links_resource_target` ON `links` (`resource`, `target`);
+
 
 
 COMMIT;
@@ -0,0 +1,10 @@
+/* Secondary indexes for the filters used by the starbase and operation controllers. */
+CREATE INDEX IF NOT EXISTS `keys_operation_id` ON `keys` (`operation_id`);
+CREATE INDEX IF NOT EXISTS `towers_op_id` ON `towers` (`op_id`);
+CREATE INDEX IF NOT EXISTS `processes_tower_id` ON `processes` (`tower_id`);
+CREATE INDEX IF NOT EXISTS `equipment_process_id` ON `equipment` (`process_id`);
+-- Equipment.outputs joins on source; (target, ...) is already the primary key.
+CREATE INDEX IF NOT EXISTS `links_source` ON `links` (`source`);
+-- make_link looks a material up by resource plus source or target.
+CREATE INDEX IF NOT EXISTS `links_resource_source` ON `links` (`resource`, `source`);
+CREATE INDEX IF NOT EXISTS `links_resource_target` ON `links` (`resource`, `target`);
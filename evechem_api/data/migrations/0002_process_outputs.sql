@@ -0,0 +1,11 @@
+/* Materialized production endpoints of each process, see refresh_final_outputs. */
+CREATE TABLE IF NOT EXISTS `process_outputs` (
+	`process_id`	INTEGER,
+	`equipment_id`	INTEGER,
+	`material`	INTEGER,
+	PRIMARY KEY(process_id,equipment_id)
+	FOREIGN KEY(process_id) REFERENCES processes(id)
+);
+-- existing processes are recomputed the next time they are read; sqlite has no
+-- ADD COLUMN IF NOT EXISTS, so this relies on migrate applying each version once
+ALTER TABLE `processes` ADD COLUMN `outputs_stale` INTEGER NOT NULL DEFAULT 1;
@@ -1,19 +1,81 @@
+import json
+
 from connexion.decorators import produces
 from six import iteritems
 from evechem_api.models.base_model_ import Model
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_fields = {}
+
+def _model_fields(klass):
+    '''`(attribute, json key)` pairs of a model class, read once per class.'''
+    fields = _fields.get(klass)
+    if fields is None:
+        fields = tuple((attr, klass.attribute_map[attr]) for attr in klass.swagger_types)
+        _fields[klass] = fields
+    return fields
+
+def to_primitive(o, include_nulls=False):
+    '''to_primitive(o, include_nulls)
+
+    Flattens a tree of models, lists and dicts into plain dicts and lists in
+    a single pass, so the JSON backend never has to call back into Python
+    for a model.  `None` fields are dropped unless `include_nulls` is set.
+    '''
+    if isinstance(o, Model):
+        dikt = {}
+        for attr, key in _model_fields(type(o)):
+            value = getattr(o, attr)
+            if value is None and not include_nulls:
+                continue
+            dikt[key] = to_primitive(value, include_nulls)
+        return dikt
+    elif isinstance(o, (list, tuple)):
+        return [to_primitive(v, include_nulls) for v in o]
+    elif isinstance(o, dict):
+        return {k: to_primitive(v, include_nulls) for k, v in iteritems(o)}
+    return o
+
 
 class JSONEncoder(produces.JSONEncoder):
     include_nulls = False
 
+    def iterencode(self, o, _one_shot=False):
+        return super(JSONEncoder, self).iterencode(to_primitive(o, self.include_nulls), _one_shot)
+
     def default(self, o):
         if isinstance(o, Model):
-            dikt = {}
-            for attr, _ in iteritems(o.swagger_types):
-                value = getattr(o, attr)
-                if value is None and not self.include_nulls:
-                    continue
-                attr = o.attribute_map[attr]
-                dikt[attr] = value
-            return dikt
-        return produces.JSONEncoder.default(self, o)
\ No newline at end of file
+            return to_primitive(o, self.include_nulls)
+        return produces.JSONEncoder.default(self, o)
+
+
+def dumps(o):
+    '''dumps(o)
+
+    Serializes `o` to indented JSON bytes (with a trailing newline) the way
+    connexion renders a response through `flask.json` with flask's default
+    `JSON_SORT_KEYS` and `JSON_AS_ASCII`: keys sorted, non-ASCII characters
+    escaped.  orjson renders it when installed; since orjson cannot escape
+    non-ASCII text, such output is rendered again by the standard library.
+    '''
+    data = to_primitive(o, JSONEncoder.include_nulls)
+    if orjson is not None:
+        body = orjson.dumps(data, default=JSONEncoder().default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        if _ascii(body):
+            return body + b'\n'
+    # already flattened, so the plain connexion encoder is enough
+    body = json.dumps(data, indent=2, sort_keys=True, ensure_ascii=True, cls=produces.JSONEncoder)
+    return (body + '\n').encode('ascii')
+
+def _ascii(body):
+    try:
+        body.decode('ascii')
+    except UnicodeDecodeError:
+        return False
+    return True
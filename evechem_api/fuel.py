@@ -0,0 +1,109 @@
+# coding: utf-8
+'''Fuel and strontium projection for control towers.
+
+Towers burn `fuel_usage` fuel blocks (25% fewer with a sovereignty bonus) once
+an hour, at minute `cycles_at`.  From the fuel count recorded at
+`fuel_last_update` this projects the current fuel, when the tower runs dry and
+how many blocks fill its fuel bay.  A tower that has already run dry reports
+the time it went offline, with negative `hours_remaining`.  Strontium is only burnt while reinforced,
+so it is reported as the hours of reinforcement it can hold.
+
+Every tower of an operation is projected in one pass over NumPy arrays.
+'''
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from evechem_api.maps import application_map, info_catalog
+
+CYCLE = 3600 # seconds between fuel cycles
+SOV_DISCOUNT = 0.75 # fraction of fuel used with a sovereignty bonus
+
+FuelProjection = namedtuple('FuelProjection', [
+    'tower_id', 'fuel_count', 'fuel_usage', 'hours_remaining', 'empty_at',
+    'refuel_quantity', 'stront_count', 'reinforce_hours'])
+
+
+def _column(rows, index, default, dtype):
+    return np.array([default if row[index] is None else row[index] for row in rows], dtype=dtype)
+
+def project(towers, now=None):
+    '''project(towers, now)
+
+    Projects fuel for a set of towers.
+
+    :param towers: `(id, type, online, sov, cycles_at, fuel_count, fuel_last_update, stront_count)` rows.
+    :param now: epoch seconds to project to (default: current time).
+
+    :rtype: List[FuelProjection]
+    '''
+    now = int(time.time()) if now is None else int(now)
+    if len(towers) == 0:
+        return []
+
+    catalog = info_catalog.load()
+
+    ids = _column(towers, 0, -1, np.int64)
+    types = [row[1] for row in towers]
+    online = _column(towers, 2, False, bool)
+    sov = _column(towers, 3, False, bool)
+    cycles_at = _column(towers, 4, 0, np.int64) % 60
+    fuel_count = _column(towers, 5, 0, np.int64)
+    last_update = _column(towers, 6, now, np.int64)
+    stront_count = _column(towers, 7, 0, np.int64)
+
+    # per type figures, resolved once per distinct tower type
+    type_info = {}
+    for tower_type in set(types):
+        info = catalog.tower_by_type.get(tower_type)
+        if info is None:
+            type_info[tower_type] = (0, 0, 0)
+            continue
+        fuel = catalog.material_by_type.get(info.fuel_type)
+        bay = int(info.fuel_bay // fuel.volume) if fuel is not None and fuel.volume else 0
+        type_info[tower_type] = (info.fuel_usage or 0, info.stront_usage or 0, bay)
+    base_usage, stront_usage, bay = (np.array(c, dtype=np.int64) for c in zip(*[type_info[t] for t in types]))
+
+    usage = np.where(sov, np.ceil(base_usage * SOV_DISCOUNT), base_usage).astype(np.int64)
+
+    # first cycle strictly after the last update, then every CYCLE seconds
+    first_cycle = last_update - last_update % CYCLE + cycles_at * 60
+    first_cycle = np.where(first_cycle <= last_update, first_cycle + CYCLE, first_cycle)
+    burning = online & (usage > 0)
+
+    # the tower goes offline at the first cycle it cannot pay for, so no
+    # more than `paid_cycles` are burnt however long ago the last update was
+    paid_cycles = fuel_count // np.maximum(usage, 1)
+    elapsed_cycles = np.where(now >= first_cycle, (now - first_cycle) // CYCLE + 1, 0)
+    elapsed_cycles = np.where(burning, np.minimum(elapsed_cycles, paid_cycles), 0)
+
+    current = fuel_count - elapsed_cycles * usage
+    # in the past (negative hours) for a tower that has already run dry
+    empty_at = first_cycle + paid_cycles * CYCLE
+    hours_remaining = (empty_at - now) / float(CYCLE)
+    refuel = np.maximum(bay - current, 0)
+    reinforce_hours = stront_count / np.maximum(stront_usage, 1).astype(np.float64)
+
+    return [
+        FuelProjection(
+            tower_id=int(ids[i]),
+            fuel_count=int(current[i]),
+            fuel_usage=int(usage[i]),
+            hours_remaining=float(hours_remaining[i]) if burning[i] else None,
+            empty_at=int(empty_at[i]) if burning[i] else None,
+            refuel_quantity=int(refuel[i]),
+            stront_count=int(stront_count[i]),
+            reinforce_hours=float(reinforce_hours[i]) if stront_usage[i] > 0 else None)
+        for i in range(len(ids))]
+
+def project_operation(session, operation_id, now=None):
+    '''Projects fuel for every tower of an operation with a single query.'''
+    qTower = application_map.Tower
+    q_towers = session.query(
+            qTower.id, qTower.type, qTower.online, qTower.sov, qTower.cycles_at,
+            qTower.fuel_count, qTower.fuel_last_update, qTower.stront_count) \
+        .filter(qTower.op_id == operation_id) \
+        .order_by(qTower.id)
+
+    return project(q_towers.all(), now)
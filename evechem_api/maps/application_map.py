@@ -1,10 +1,12 @@
 # coding: utf-8
-from sqlalchemy import Column, ForeignKey, Integer, Text, create_engine, Boolean
+from sqlalchemy import Column, ForeignKey, Integer, Text, Boolean
 from sqlalchemy.orm import relationship, sessionmaker, backref
 from sqlalchemy.ext.declarative import declarative_base
 
-engine = create_engine('sqlite:///evechem_api/data/application.db')
-Session = sessionmaker(bind=engine)
+from evechem_api.maps.database import READ_WRITE_PRAGMAS, lazy_engine, make_session
+
+get_engine = lazy_engine('EVECHEM_APPLICATION_DB', 'sqlite:///evechem_api/data/application.db', READ_WRITE_PRAGMAS)
+Session = make_session(get_engine)
 
 
 Base = declarative_base()
@@ -71,8 +73,18 @@ class Process(Base):
 
     id = Column(Integer, primary_key=True)
     tower_id = Column(ForeignKey('towers.id'))
+    outputs_stale = Column(Boolean, nullable=False, default=True)
 
     equipment = relationship('Equipment', backref='process', cascade='all, delete-orphan', lazy='dynamic')
+    outputs = relationship('ProcessOutput', cascade='all, delete-orphan', order_by='ProcessOutput.equipment_id')
+
+
+class ProcessOutput(Base):
+    __tablename__ = 'process_outputs'
+
+    process_id = Column(ForeignKey('processes.id'), primary_key=True)
+    equipment_id = Column(Integer, primary_key=True)
+    material = Column(Integer)
 
 
 class Tower(Base):
@@ -0,0 +1,200 @@
+# coding: utf-8
+'''Engine and session factories shared by the table maps.
+
+Each database is configured through environment variables sharing a prefix
+(for example `EVECHEM_APPLICATION_DB`):
+
+    <PREFIX>_URL            SQLAlchemy database URL (sqlite or a server database)
+    <PREFIX>_POOL_SIZE      connections kept open in the pool (default 5)
+    <PREFIX>_MAX_OVERFLOW   extra connections allowed under load (default 10)
+    <PREFIX>_BUSY_TIMEOUT   sqlite only, seconds to wait on a locked database (default 30)
+    <PREFIX>_WAL            sqlite only, `0` keeps the rollback journal instead of
+                            the engine's `journal_mode` pragma
+'''
+import os
+import re
+from threading import Lock
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'migrations')
+
+def _setting(prefix, name, default, cast=str):
+    value = os.environ.get('{}_{}'.format(prefix, name))
+    return default if value is None else cast(value)
+
+# pragmas for a sqlite database that is written to while being read:
+# WAL lets readers proceed alongside a writer, and NORMAL sync is safe in WAL
+READ_WRITE_PRAGMAS = (
+    ('journal_mode', 'WAL'),
+    ('synchronous', 'NORMAL'),
+    ('mmap_size', 256 * 1024 * 1024),
+    ('cache_size', -16 * 1024), # negative is KiB, so 16 MiB per connection
+    ('temp_store', 'MEMORY'),
+    ('foreign_keys', 'ON'),
+)
+
+def _pragma_listener(pragmas):
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas:
+            cursor.execute('PRAGMA {}={}'.format(name, value))
+        cursor.close()
+    return set_pragmas
+
+def make_engine(url, pool_size=5, max_overflow=10, busy_timeout=30, pragmas=()):
+    '''make_engine(url, pool_size, max_overflow, busy_timeout, pragmas)
+
+    Creates an engine with a bounded connection pool.  For sqlite URLs the
+    connections wait up to `busy_timeout` seconds for locks instead of failing
+    with "database is locked", and each new connection runs the given
+    `(name, value)` pragmas.
+    '''
+    if not url.startswith('sqlite'):
+        return create_engine(url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True)
+
+    engine = create_engine(url,
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        # pooled connections are handed to whichever thread checks them out
+        connect_args={'timeout': busy_timeout, 'check_same_thread': False})
+
+    if len(pragmas) > 0:
+        event.listen(engine, 'connect', _pragma_listener(pragmas))
+
+    return engine
+
+def engine_from_env(prefix, default_url, pragmas=()):
+    '''Creates an engine configured from the `prefix` environment variables.'''
+    if _setting(prefix, 'WAL', '1') == '0':
+        pragmas = [(name, value) for name, value in pragmas if name != 'journal_mode']
+
+    return make_engine(
+        _setting(prefix, 'URL', default_url),
+        pool_size=_setting(prefix, 'POOL_SIZE', 5, int),
+        max_overflow=_setting(prefix, 'MAX_OVERFLOW', 10, int),
+        busy_timeout=_setting(prefix, 'BUSY_TIMEOUT', 30, float),
+        pragmas=pragmas)
+
+def lazy_engine(prefix, default_url, pragmas=()):
+    '''lazy_engine(prefix, default_url, pragmas)
+
+    Returns a `get_engine()` function that creates the `engine_from_env`
+    engine on its first call and returns the same engine afterwards, so
+    importing a table map does not open a connection pool.
+    '''
+    engine = []
+    lock = Lock()
+
+    def get_engine():
+        if len(engine) == 0:
+            with lock:
+                if len(engine) == 0:
+                    engine.append(engine_from_env(prefix, default_url, pragmas))
+        return engine[0]
+
+    return get_engine
+
+def make_session(get_engine):
+    '''make_session(get_engine)
+
+    Returns a thread-scoped session registry bound to the engine returned by
+    `get_engine`, which is only called once a session is needed.  Calling the
+    registry returns the current thread's session; `Session.remove()` closes
+    it and is called when each request is torn down.
+    '''
+    factory = sessionmaker()
+
+    def create_session():
+        return factory(bind=get_engine())
+
+    return scoped_session(create_session)
+
+def _statements(script):
+    '''Splits a sql script into statements, dropping comments.'''
+    script = re.sub(r'/\*.*?\*/', '', script, flags=re.DOTALL)
+    script = re.sub(r'--[^\n]*', '', script)
+    return [statement.strip() for statement in script.split(';') if statement.strip()]
+
+def _applied(engine):
+    '''Versions recorded in `schema_migrations`, creating the table if needed.'''
+    with engine.begin() as connection:
+        connection.execute(text('CREATE TABLE IF NOT EXISTS schema_migrations (version INTEGER PRIMARY KEY)'))
+        return set(row[0] for row in connection.execute(text('SELECT version FROM schema_migrations')))
+
+def _apply_sqlite(engine, version, statements):
+    # pysqlite does not open a transaction before DDL, so each CREATE/ALTER
+    # would commit on its own: drive the transaction by hand instead
+    raw = engine.raw_connection()
+    dbapi_connection = getattr(raw, 'driver_connection', None) or raw.connection
+    isolation_level = dbapi_connection.isolation_level
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    try:
+        # takes the write lock up front; another worker migrating waits here
+        # (busy_timeout) and then sees this version as applied
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            cursor.execute('SELECT 1 FROM schema_migrations WHERE version = ?', (version,))
+            if cursor.fetchone() is None:
+                for statement in statements:
+                    cursor.execute(statement)
+                cursor.execute('INSERT INTO schema_migrations (version) VALUES (?)', (version,))
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+        cursor.execute('COMMIT')
+    finally:
+        cursor.close()
+        dbapi_connection.isolation_level = isolation_level
+        raw.close()
+
+def _apply(engine, version, statements):
+    try:
+        with engine.begin() as connection:
+            q_applied = connection.execute(
+                text('SELECT 1 FROM schema_migrations WHERE version = :version'),
+                {'version': version})
+            if q_applied.first() is not None:
+                return
+            for statement in statements:
+                connection.execute(text(statement))
+            connection.execute(
+                text('INSERT INTO schema_migrations (version) VALUES (:version)'),
+                {'version': version})
+    except IntegrityError:
+        # another worker applied this version first
+        pass
+
+def migrate(engine, directory=MIGRATIONS_DIR):
+    '''migrate(engine, directory)
+
+    Applies the `NNNN_description.sql` scripts in `directory` that have not
+    been applied to `engine` yet, in version order, one transaction each.
+    Applied versions are recorded in the `schema_migrations` table.  On
+    sqlite each script runs under `BEGIN IMMEDIATE` and checks
+    `schema_migrations` again once it holds the write lock, so concurrent
+    workers apply every version once, and a failing script leaves nothing
+    behind.
+    '''
+    applied = _applied(engine)
+    apply = _apply_sqlite if engine.dialect.name == 'sqlite' else _apply
+
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith('.sql'):
+            continue
+        version = int(filename.split('_', 1)[0])
+        if version in applied:
+            continue
+
+        with open(os.path.join(directory, filename)) as f:
+            script = f.read()
+        apply(engine, version, _statements(script))
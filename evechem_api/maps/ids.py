@@ -0,0 +1,61 @@
+# coding: utf-8
+'''Non-sequential primary keys for rows exposed through the API.
+
+Tower, process and equipment ids are visible to clients, so they are drawn
+at random instead of counting up (which would reveal how many rows exist).
+Ids are picked before the INSERT and checked against the table in one query,
+so a create is a single write transaction.  They stay below 2**53 so that
+JavaScript clients read them back exactly.
+'''
+import random
+
+from evechem_api.maps import application_map
+
+MAX_ID = 2 ** 53 - 1 # largest integer a JSON double holds exactly
+
+
+class IdExhausted(Exception):
+    pass
+
+class IdAllocator(object):
+    '''Draws unused random ids for the primary key `column`.'''
+
+    def __init__(self, column, max_id=MAX_ID, attempts=8, rng=None):
+        self.column = column
+        self.max_id = max_id
+        self.attempts = attempts
+        self.rng = random.SystemRandom() if rng is None else rng
+
+    def allocate(self, session, count=1):
+        '''allocate(session, count)
+
+        Returns `count` distinct ids not used in the table yet.  Collisions
+        are redrawn, with one query per round.  Raises `IdExhausted` if ids
+        still collide after `attempts` rounds.
+        '''
+        ids = set()
+        for _ in range(self.attempts):
+            candidates = set()
+            while len(ids) + len(candidates) < count:
+                candidate = self.rng.randint(1, self.max_id)
+                if candidate not in ids:
+                    candidates.add(candidate)
+            if len(candidates) == 0:
+                break
+
+            taken = session.query(self.column).filter(self.column.in_(candidates))
+            candidates.difference_update(row[0] for row in taken)
+            ids.update(candidates)
+
+        if len(ids) < count:
+            raise IdExhausted('No free `{}` ids after {} attempts.'.format(self.column, self.attempts))
+        return list(ids)
+
+    def next(self, session):
+        '''A single unused id.'''
+        return self.allocate(session, 1)[0]
+
+
+towers = IdAllocator(application_map.Tower.id)
+processes = IdAllocator(application_map.Process.id)
+equipment = IdAllocator(application_map.Equipment.id)
@@ -0,0 +1,195 @@
+# coding: utf-8
+'''Immutable in-memory copy of the static `info.db` catalog.
+
+The info tables (groups, materials, reactions, equipment, towers) never change
+while the server is running, so they are read once and indexed by type_id and
+group_id.  Info controllers read from the catalog and never touch SQLite.
+'''
+from collections import namedtuple
+from threading import Lock
+from types import MappingProxyType
+
+from sqlalchemy.orm import joinedload, selectinload
+
+from evechem_api.maps import info_map
+from evechem_api.pagination import SortedRows
+
+SILO_GROUP = 404 # equipment that stores rather than produces
+HARVESTER_GROUP = 416 # equipment that outputs the moon material it mines
+
+
+GroupRow = namedtuple('GroupRow', ['group_id', 'name'])
+MaterialRow = namedtuple('MaterialRow', ['type', 'group_id', 'name', 'volume'])
+ReactionIORow = namedtuple('ReactionIORow', ['type', 'name', 'amount'])
+ReactionRow = namedtuple('ReactionRow', ['type', 'group_id', 'name', 'inputs', 'outputs'])
+EquipmentRow = namedtuple('EquipmentRow', [
+    'type', 'group_id', 'name', 'capacity', 'cpu', 'powergrid', 'allowed_groups'])
+TowerRow = namedtuple('TowerRow', [
+    'type', 'fuel_bay', 'stront_bay', 'name', 'storage_mult', 'cpu', 'powergrid',
+    'fuel_usage', 'stront_usage', 'fuel_type'])
+
+
+NO_LINKS = frozenset()
+
+
+def _index_by_group(rows):
+    '''Group rows by their `group_id`, keeping the original row order.'''
+    groups = {}
+    for row in rows:
+        groups.setdefault(row.group_id, []).append(row)
+    return MappingProxyType({g: tuple(r) for g, r in groups.items()})
+
+
+class InfoCatalog(object):
+    '''Read-only view of the info tables.
+
+    Rows are stored as tuples (in table order) and indexed in dicts keyed by
+    type_id and group_id.  Reactions keep their inputs and outputs pre-split.
+    '''
+
+    def __init__(self, groups, materials, reactions, equipment, towers):
+        self.groups = tuple(groups)
+        self.materials = tuple(materials)
+        self.reactions = tuple(reactions)
+        self.equipment = tuple(equipment)
+        self.towers = tuple(towers)
+
+        self.group_by_id = MappingProxyType({g.group_id: g for g in self.groups})
+        self.material_by_type = MappingProxyType({m.type: m for m in self.materials})
+        self.reaction_by_type = MappingProxyType({r.type: r for r in self.reactions})
+        self.equipment_by_type = MappingProxyType({e.type: e for e in self.equipment})
+        self.tower_by_type = MappingProxyType({t.type: t for t in self.towers})
+
+        self.materials_by_group = _index_by_group(self.materials)
+        self.reactions_by_group = _index_by_group(self.reactions)
+        self.equipment_by_group = _index_by_group(self.equipment)
+
+        # type ordered copies for paged listings
+        self.sorted_materials = SortedRows(self.materials, lambda r: r.type)
+        self.sorted_reactions = SortedRows(self.reactions, lambda r: r.type)
+        self.sorted_equipment = SortedRows(self.equipment, lambda r: r.type)
+
+        # resource validation: what groups each equipment takes, and the group
+        # of every resource (materials win over reactions sharing a type)
+        self.allowed_groups_by_type = MappingProxyType(
+            {e.type: frozenset(e.allowed_groups) for e in self.equipment})
+        resource_groups = {r.type: r.group_id for r in self.reactions}
+        resource_groups.update((m.type, m.group_id) for m in self.materials)
+        self.group_by_resource = MappingProxyType(resource_groups)
+
+        self.storage_types = frozenset(e.type for e in self.equipment_by_group.get(SILO_GROUP, ()))
+        self.harvester_types = frozenset(e.type for e in self.equipment_by_group.get(HARVESTER_GROUP, ()))
+
+        # materials that can be linked out of / into equipment holding a
+        # resource: a reaction's outputs / inputs, or a silo's own material
+        link_outputs = {m.type: frozenset([m.type]) for m in self.materials}
+        link_inputs = dict(link_outputs)
+        for r in self.reactions:
+            link_outputs[r.type] = frozenset(m.type for m in r.outputs)
+            link_inputs[r.type] = frozenset(m.type for m in r.inputs)
+        self.link_outputs = MappingProxyType(link_outputs)
+        self.link_inputs = MappingProxyType(link_inputs)
+
+    @staticmethod
+    def _select(rows, by_group, group_ids):
+        '''Return `rows` if no groups are given, else the rows of those groups.'''
+        if len(group_ids) == 0:
+            return rows
+        selected = []
+        for group_id in group_ids:
+            selected.extend(by_group.get(group_id, ()))
+        return tuple(selected)
+
+    def materials_in(self, *group_ids):
+        return self._select(self.materials, self.materials_by_group, group_ids)
+
+    def reactions_in(self, *group_ids):
+        return self._select(self.reactions, self.reactions_by_group, group_ids)
+
+    def equipment_in(self, *group_ids):
+        return self._select(self.equipment, self.equipment_by_group, group_ids)
+
+    def linkable(self, equipment_type, resource, outputs=True):
+        '''linkable(equipment_type, resource, outputs)
+
+        The set of materials equipment of `equipment_type` holding `resource`
+        can be linked out of (or into, when `outputs` is False).
+        '''
+        if resource is None:
+            return NO_LINKS
+        # mining arrays output what they mine and take no inputs
+        if equipment_type in self.harvester_types:
+            return frozenset([resource]) if outputs else NO_LINKS
+        return (self.link_outputs if outputs else self.link_inputs).get(resource, NO_LINKS)
+
+    def material_groups(self):
+        '''Groups that at least one material belongs to.'''
+        return tuple(self.group_by_id[g] for g in self.materials_by_group if g in self.group_by_id)
+
+    @classmethod
+    def from_session(cls, session):
+        '''Build a catalog by reading every info table through `session`.'''
+        groups = [GroupRow(g.group_id, g.name) for g in session.query(info_map.Group)]
+
+        materials = [
+            MaterialRow(m.type, m.group_id, m.name, m.volume)
+            for m in session.query(info_map.Material)]
+
+        # reaction_io rows and their material names are loaded up front, so
+        # the listing costs a constant number of SELECTs regardless of size
+        q_reactions = session.query(info_map.Reaction).options(
+            selectinload(info_map.Reaction.materials)
+            .joinedload(info_map.ReactionMaterial.material))
+
+        reactions = []
+        for r in q_reactions:
+            inputs = []
+            outputs = []
+            for row in r.materials:
+                reaction_mat = ReactionIORow(row.material_id, row.material.name, row.quantity)
+                if row.is_input:
+                    inputs.append(reaction_mat)
+                else:
+                    outputs.append(reaction_mat)
+            reactions.append(ReactionRow(r.type, r.group_id, r.name, tuple(inputs), tuple(outputs)))
+
+        # one pass over allowed_groups instead of a dynamic query per equipment
+        allowed = {}
+        q_allowed = session.query(
+            info_map.t_allowed_groups.c.equipment,
+            info_map.t_allowed_groups.c.resource_group)
+        for equipment_type, group_id in q_allowed:
+            allowed.setdefault(equipment_type, []).append(group_id)
+
+        equipment = [
+            EquipmentRow(
+                e.type, e.group_id, e.name, e.capacity, e.cpu, e.powergrid,
+                tuple(allowed.get(e.type, ())))
+            for e in session.query(info_map.Equipment)]
+
+        towers = [
+            TowerRow(
+                t.type, t.fuel_bay, t.stront_bay, t.name, t.storage_mult, t.cpu,
+                t.powergrid, t.fuel_usage, t.stront_usage, t.fuel_type)
+            for t in session.query(info_map.Tower)]
+
+        return cls(groups, materials, reactions, equipment, towers)
+
+
+_catalog = None
+_catalog_lock = Lock()
+
+def load():
+    '''load()
+
+    Returns the process-wide catalog, reading `info.db` on the first call only.
+    '''
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                try:
+                    _catalog = InfoCatalog.from_session(info_map.Session())
+                finally:
+                    info_map.Session.remove()
+    return _catalog
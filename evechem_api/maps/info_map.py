@@ -1,10 +1,14 @@
 # coding: utf-8
-from sqlalchemy import Column, ForeignKey, PrimaryKeyConstraint, Integer, Numeric, Table, Text, Float, Boolean, create_engine
+from sqlalchemy import Column, ForeignKey, PrimaryKeyConstraint, Integer, Numeric, Table, Text, Float, Boolean
 from sqlalchemy.orm import relationship, sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
-engine = create_engine('sqlite:///evechem_api/data/info.db')
-Session = sessionmaker(bind=engine)
+from evechem_api.maps.database import lazy_engine, make_session
+
+# info.db is never written to: open it read-only and immutable, so sqlite
+# skips locking and change detection entirely
+get_engine = lazy_engine('EVECHEM_INFO_DB', 'sqlite:///file:evechem_api/data/info.db?mode=ro&immutable=1&uri=true')
+Session = make_session(get_engine)
 
 Base = declarative_base()
 metadata = Base.metadata
@@ -1,21 +1,52 @@
 # coding: utf-8
 
 from __future__ import absolute_import
-# import models into model package
-from .equipment import Equipment
-from .equipment_info import EquipmentInfo
-from .equipment_info_fitting import EquipmentInfoFitting
-from .equipment_update import EquipmentUpdate
-from .error import Error
-from .group import Group
-from .link import Link
-from .material_info import MaterialInfo
-from .new_equipment import NewEquipment
-from .new_tower import NewTower
-from .process import Process
-from .reaction import Reaction
-from .reaction_material import ReactionMaterial
-from .tower_details import TowerDetails
-from .tower_info import TowerInfo
-from .key import Key
-from .key_update import KeyUpdate
+import sys
+from importlib import import_module
+
+# model name -> module defining it; each module is imported the first time
+# its model is looked up, so importing one model does not load all of them
+_modules = {
+    'Equipment': 'equipment',
+    'EquipmentInfo': 'equipment_info',
+    'EquipmentInfoFitting': 'equipment_info_fitting',
+    'EquipmentUpdate': 'equipment_update',
+    'EquipmentBulkUpdate': 'equipment_bulk_update',
+    'Error': 'error',
+    'Group': 'group',
+    'Link': 'link',
+    'MaterialInfo': 'material_info',
+    'NewEquipment': 'new_equipment',
+    'NewTower': 'new_tower',
+    'Process': 'process',
+    'ProcessGraph': 'process_graph',
+    'ProcessGraphLink': 'process_graph_link',
+    'ProcessGraphNode': 'process_graph_node',
+    'Reaction': 'reaction',
+    'ReactionMaterial': 'reaction_material',
+    'TowerDetails': 'tower_details',
+    'TowerFuel': 'tower_fuel',
+    'TowerInfo': 'tower_info',
+    'Key': 'key',
+    'KeyUpdate': 'key_update',
+}
+
+__all__ = list(_modules)
+
+def _load(name):
+    model = getattr(import_module('.' + _modules[name], __name__), name)
+    globals()[name] = model
+    return model
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name in _modules:
+            return _load(name)
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_modules))
+else:
+    # module level __getattr__ needs python 3.7, import everything up front
+    for _name in _modules:
+        _load(_name)
@@ -7,6 +7,9 @@ T = TypeVar('T')
 
 
 class Model(object):
+    # models keep their fields in `__slots__`, so instances have no `__dict__`
+    __slots__ = ()
+
     # swaggerTypes: The key is attribute name and the value is attribute type.
     swagger_types = {}
 
@@ -66,7 +69,9 @@ class Model(object):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) is not type(other):
+            return False
+        return all(getattr(self, attr) == getattr(other, attr) for attr in self.swagger_types)
 
     def __ne__(self, other):
         """
@@ -13,6 +13,32 @@ class Equipment(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_contains', '_id', '_type', '_online', '_inputs', '_last_updated', '_outputs', '_resource', '_name')
+
+    swagger_types = {
+        'contains': int,
+        'id': int,
+        'type': int,
+        'online': bool,
+        'inputs': List[Link],
+        'last_updated': int,
+        'outputs': List[Link],
+        'resource': int,
+        'name': str
+    }
+
+    attribute_map = {
+        'contains': 'contains',
+        'id': 'id',
+        'type': 'type',
+        'online': 'online',
+        'inputs': 'inputs',
+        'last_updated': 'last_updated',
+        'outputs': 'outputs',
+        'resource': 'resource',
+        'name': 'name'
+    }
+
     def __init__(self, contains: int=None, id: int=None, type: int=None, online: bool=None, inputs: List[Link]=None, last_updated: int=None, outputs: List[Link]=None, resource: int=None, name: str=None):
         """
         Equipment - a model defined in Swagger
@@ -36,30 +62,6 @@ class Equipment(Model):
         :param name: The name of this Equipment.
         :type name: str
         """
-        self.swagger_types = {
-            'contains': int,
-            'id': int,
-            'type': int,
-            'online': bool,
-            'inputs': List[Link],
-            'last_updated': int,
-            'outputs': List[Link],
-            'resource': int,
-            'name': str
-        }
-
-        self.attribute_map = {
-            'contains': 'contains',
-            'id': 'id',
-            'type': 'type',
-            'online': 'online',
-            'inputs': 'inputs',
-            'last_updated': 'last_updated',
-            'outputs': 'outputs',
-            'resource': 'resource',
-            'name': 'name'
-        }
-
         self._contains = contains
         self._id = id
         self._type = type
@@ -0,0 +1,200 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from .base_model_ import Model
+from datetime import date, datetime
+from typing import List, Dict
+from ..util import deserialize_model
+
+
+class EquipmentBulkUpdate(Model):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    __slots__ = ('_id', '_contains', '_last_updated', '_online', '_resource', '_name')
+
+    swagger_types = {
+        'id': int,
+        'contains': int,
+        'last_updated': int,
+        'online': bool,
+        'resource': int,
+        'name': str
+    }
+
+    attribute_map = {
+        'id': 'id',
+        'contains': 'contains',
+        'last_updated': 'last_updated',
+        'online': 'online',
+        'resource': 'resource',
+        'name': 'name'
+    }
+
+    def __init__(self, id: int=None, contains: int=None, last_updated: int=None, online: bool=None, resource: int=None, name: str=None):
+        """
+        EquipmentBulkUpdate - a model defined in Swagger
+
+        :param id: The id of this EquipmentBulkUpdate.
+        :type id: int
+        :param contains: The contains of this EquipmentBulkUpdate.
+        :type contains: int
+        :param last_updated: The last_updated of this EquipmentBulkUpdate.
+        :type last_updated: int
+        :param online: The online of this EquipmentBulkUpdate.
+        :type online: bool
+        :param resource: The resource of this EquipmentBulkUpdate.
+        :type resource: int
+        :param name: The name of this EquipmentBulkUpdate.
+        :type name: str
+        """
+        self._id = id
+        self._contains = contains
+        self._last_updated = last_updated
+        self._online = online
+        self._resource = resource
+        self._name = name
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'EquipmentBulkUpdate':
+        """
+        Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The equipment_bulk_update of this EquipmentBulkUpdate.
+        :rtype: EquipmentBulkUpdate
+        """
+        return deserialize_model(dikt, cls)
+
+    @property
+    def id(self) -> int:
+        """
+        Gets the id of this EquipmentBulkUpdate.
+        Id of the equipment to update.
+
+        :return: The id of this EquipmentBulkUpdate.
+        :rtype: int
+        """
+        return self._id
+
+    @id.setter
+    def id(self, id: int):
+        """
+        Sets the id of this EquipmentBulkUpdate.
+        Id of the equipment to update.
+
+        :param id: The id of this EquipmentBulkUpdate.
+        :type id: int
+        """
+        if id is None:
+            raise ValueError("Invalid value for `id`, must not be `None`")
+
+        self._id = id
+
+    @property
+    def contains(self) -> int:
+        """
+        Gets the contains of this EquipmentBulkUpdate.
+
+        :return: The contains of this EquipmentBulkUpdate.
+        :rtype: int
+        """
+        return self._contains
+
+    @contains.setter
+    def contains(self, contains: int):
+        """
+        Sets the contains of this EquipmentBulkUpdate.
+
+        :param contains: The contains of this EquipmentBulkUpdate.
+        :type contains: int
+        """
+
+        self._contains = contains
+
+    @property
+    def last_updated(self) -> int:
+        """
+        Gets the last_updated of this EquipmentBulkUpdate.
+
+        :return: The last_updated of this EquipmentBulkUpdate.
+        :rtype: int
+        """
+        return self._last_updated
+
+    @last_updated.setter
+    def last_updated(self, last_updated: int):
+        """
+        Sets the last_updated of this EquipmentBulkUpdate.
+
+        :param last_updated: The last_updated of this EquipmentBulkUpdate.
+        :type last_updated: int
+        """
+
+        self._last_updated = last_updated
+
+    @property
+    def online(self) -> bool:
+        """
+        Gets the online of this EquipmentBulkUpdate.
+
+        :return: The online of this EquipmentBulkUpdate.
+        :rtype: bool
+        """
+        return self._online
+
+    @online.setter
+    def online(self, online: bool):
+        """
+        Sets the online of this EquipmentBulkUpdate.
+
+        :param online: The online of this EquipmentBulkUpdate.
+        :type online: bool
+        """
+
+        self._online = online
+
+    @property
+    def resource(self) -> int:
+        """
+        Gets the resource of this EquipmentBulkUpdate.
+
+        :return: The resource of this EquipmentBulkUpdate.
+        :rtype: int
+        """
+        return self._resource
+
+    @resource.setter
+    def resource(self, resource: int):
+        """
+        Sets the resource of this EquipmentBulkUpdate.
+
+        :param resource: The resource of this EquipmentBulkUpdate.
+        :type resource: int
+        """
+
+        self._resource = resource
+
+    @property
+    def name(self) -> str:
+        """
+        Gets the name of this EquipmentBulkUpdate.
+
+        :return: The name of this EquipmentBulkUpdate.
+        :rtype: str
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        """
+        Sets the name of this EquipmentBulkUpdate.
+
+        :param name: The name of this EquipmentBulkUpdate.
+        :type name: str
+        """
+
+        self._name = name
+
@@ -13,6 +13,30 @@ class EquipmentInfo(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_allowed_groups', '_capacity', '_current_resource', '_fitting', '_group', '_id', '_name', '_type')
+
+    swagger_types = {
+        'allowed_groups': List[int],
+        'capacity': float,
+        'current_resource': int,
+        'fitting': EquipmentInfoFitting,
+        'group': int,
+        'id': int,
+        'name': str,
+        'type': int
+    }
+
+    attribute_map = {
+        'allowed_groups': 'allowed_groups',
+        'capacity': 'capacity',
+        'current_resource': 'current_resource',
+        'fitting': 'fitting',
+        'group': 'group',
+        'id': 'id',
+        'name': 'name',
+        'type': 'type'
+    }
+
     def __init__(self, allowed_groups: List[int]=None, capacity: float=None, current_resource: int=None, fitting: EquipmentInfoFitting=None, group: int=None, id: int=None, name: str=None, type: int=None):
         """
         EquipmentInfo - a model defined in Swagger
@@ -34,28 +58,6 @@ class EquipmentInfo(Model):
         :param type: The type of this EquipmentInfo.
         :type type: int
         """
-        self.swagger_types = {
-            'allowed_groups': List[int],
-            'capacity': float,
-            'current_resource': int,
-            'fitting': EquipmentInfoFitting,
-            'group': int,
-            'id': int,
-            'name': str,
-            'type': int
-        }
-
-        self.attribute_map = {
-            'allowed_groups': 'allowed_groups',
-            'capacity': 'capacity',
-            'current_resource': 'current_resource',
-            'fitting': 'fitting',
-            'group': 'group',
-            'id': 'id',
-            'name': 'name',
-            'type': 'type'
-        }
-
         self._allowed_groups = allowed_groups
         self._capacity = capacity
         self._current_resource = current_resource
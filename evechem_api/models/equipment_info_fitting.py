@@ -12,6 +12,18 @@ class EquipmentInfoFitting(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_cpu', '_powergrid')
+
+    swagger_types = {
+        'cpu': float,
+        'powergrid': float
+    }
+
+    attribute_map = {
+        'cpu': 'cpu',
+        'powergrid': 'powergrid'
+    }
+
     def __init__(self, cpu: float=None, powergrid: float=None):
         """
         EquipmentInfoFitting - a model defined in Swagger
@@ -21,16 +33,6 @@ class EquipmentInfoFitting(Model):
         :param powergrid: The powergrid of this EquipmentInfoFitting.
         :type powergrid: float
         """
-        self.swagger_types = {
-            'cpu': float,
-            'powergrid': float
-        }
-
-        self.attribute_map = {
-            'cpu': 'cpu',
-            'powergrid': 'powergrid'
-        }
-
         self._cpu = cpu
         self._powergrid = powergrid
 
@@ -13,6 +13,24 @@ class EquipmentUpdate(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_contains', '_last_updated', '_online', '_resource', '_name')
+
+    swagger_types = {
+        'contains': int,
+        'last_updated': int,
+        'online': bool,
+        'resource': int,
+        'name': str
+    }
+
+    attribute_map = {
+        'contains': 'contains',
+        'last_updated': 'last_updated',
+        'online': 'online',
+        'resource': 'resource',
+        'name': 'name'
+    }
+
     def __init__(self, contains: int=None, last_updated: int=None, online: bool=None, resource: int=None, name: str=None):
         """
         EquipmentUpdate - a model defined in Swagger
@@ -30,22 +48,6 @@ class EquipmentUpdate(Model):
         :param resource: The resource of this EquipmentUpdate.
         :type resource: int
         """
-        self.swagger_types = {
-            'contains': int,
-            'last_updated': int,
-            'online': bool,
-            'resource': int,
-            'name': str,
-        }
-
-        self.attribute_map = {
-            'contains': 'contains',
-            'last_updated': 'last_updated',
-            'online': 'online',
-            'resource': 'resource',
-            'name': 'name'
-        }
-
         self._contains = contains
         self._last_updated = last_updated
         self._online = online
@@ -12,6 +12,16 @@ class Error(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_message',)
+
+    swagger_types = {
+        'message': str
+    }
+
+    attribute_map = {
+        'message': 'message'
+    }
+
     def __init__(self, message: str=None):
         """
         Error - a model defined in Swagger
@@ -19,14 +29,6 @@ class Error(Model):
         :param message: The message of this Error.
         :type message: str
         """
-        self.swagger_types = {
-            'message': str
-        }
-
-        self.attribute_map = {
-            'message': 'message'
-        }
-
         self._message = message
 
     @classmethod
@@ -12,6 +12,18 @@ class Group(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_group', '_name')
+
+    swagger_types = {
+        'group': int,
+        'name': str
+    }
+
+    attribute_map = {
+        'group': 'group',
+        'name': 'name'
+    }
+
     def __init__(self, group: int=None, name: str=None):
         """
         Group - a model defined in Swagger
@@ -21,16 +33,6 @@ class Group(Model):
         :param name: The name of this Group.
         :type name: str
         """
-        self.swagger_types = {
-            'group': int,
-            'name': str
-        }
-
-        self.attribute_map = {
-            'group': 'group',
-            'name': 'name'
-        }
-
         self._group = group
         self._name = name
 
@@ -12,6 +12,20 @@ class Key(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_name', '_value', '_permission')
+
+    swagger_types = {
+        'name': str,
+        'value': str,
+        'permission': str
+    }
+
+    attribute_map = {
+        'name': 'name',
+        'value': 'value',
+        'permission': 'permission'
+    }
+
     def __init__(self, name: str=None, value: str=None, permission: str=None):
         """
         Key - a model defined in Swagger
@@ -23,18 +37,6 @@ class Key(Model):
         :param permission: The permission of this Key.
         :type permission: str
         """
-        self.swagger_types = {
-            'name': str,
-            'value': str,
-            'permission': str
-        }
-
-        self.attribute_map = {
-            'name': 'name',
-            'value': 'value',
-            'permission': 'permission'
-        }
-
         self._name = name
         self._value = value
         self._permission = permission
@@ -12,6 +12,18 @@ class KeyUpdate(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_name', '_permission')
+
+    swagger_types = {
+        'name': str,
+        'permission': str
+    }
+
+    attribute_map = {
+        'name': 'name',
+        'permission': 'permission'
+    }
+
     def __init__(self, name: str=None, permission: str=None):
         """
         KeyUpdate - a model defined in Swagger
@@ -21,16 +33,6 @@ class KeyUpdate(Model):
         :param permission: The permission of this KeyUpdate.
         :type permission: str
         """
-        self.swagger_types = {
-            'name': str,
-            'permission': str
-        }
-
-        self.attribute_map = {
-            'name': 'name',
-            'permission': 'permission'
-        }
-
         self._name = name
         self._permission = permission
 
@@ -12,6 +12,20 @@ class Link(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_target', '_source', '_material')
+
+    swagger_types = {
+        'target': int,
+        'source': int,
+        'material': int
+    }
+
+    attribute_map = {
+        'target': 'target',
+        'source': 'source',
+        'material': 'material'
+    }
+
     def __init__(self, target: int=None, source: int=None, material: int=None):
         """
         Link - a model defined in Swagger
@@ -23,18 +37,6 @@ class Link(Model):
         :param material: The material of this Link.
         :type material: int
         """
-        self.swagger_types = {
-            'target': int,
-            'source': int,
-            'material': int
-        }
-
-        self.attribute_map = {
-            'target': 'target',
-            'source': 'source',
-            'material': 'material'
-        }
-
         self._target = target
         self._source = source
         self._material = material
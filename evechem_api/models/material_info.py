@@ -12,6 +12,22 @@ class MaterialInfo(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_group', '_name', '_type', '_volume')
+
+    swagger_types = {
+        'group': int,
+        'name': str,
+        'type': int,
+        'volume': float
+    }
+
+    attribute_map = {
+        'group': 'group',
+        'name': 'name',
+        'type': 'type',
+        'volume': 'volume'
+    }
+
     def __init__(self, group: int=None, name: str=None, type: int=None, volume: float=None):
         """
         MaterialInfo - a model defined in Swagger
@@ -25,20 +41,6 @@ class MaterialInfo(Model):
         :param volume: The volume of this MaterialInfo.
         :type volume: float
         """
-        self.swagger_types = {
-            'group': int,
-            'name': str,
-            'type': int,
-            'volume': float
-        }
-
-        self.attribute_map = {
-            'group': 'group',
-            'name': 'name',
-            'type': 'type',
-            'volume': 'volume'
-        }
-
         self._group = group
         self._name = name
         self._type = type
@@ -12,6 +12,24 @@ class NewEquipment(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_contains', '_name', '_online', '_resource', '_type')
+
+    swagger_types = {
+        'contains': int,
+        'name': str,
+        'online': bool,
+        'resource': int,
+        'type': int
+    }
+
+    attribute_map = {
+        'contains': 'contains',
+        'name': 'name',
+        'online': 'online',
+        'resource': 'resource',
+        'type': 'type'
+    }
+
     def __init__(self, contains: int=None, name: str=None, online: bool=None, resource: int=None, type: int=None):
         """
         NewEquipment - a model defined in Swagger
@@ -27,22 +45,6 @@ class NewEquipment(Model):
         :param type: The type of this NewEquipment.
         :type type: int
         """
-        self.swagger_types = {
-            'contains': int,
-            'name': str,
-            'online': bool,
-            'resource': int,
-            'type': int
-        }
-
-        self.attribute_map = {
-            'contains': 'contains',
-            'name': 'name',
-            'online': 'online',
-            'resource': 'resource',
-            'type': 'type'
-        }
-
         self._contains = contains
         self._name = name
         self._online = online
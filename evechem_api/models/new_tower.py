@@ -12,6 +12,36 @@ class NewTower(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_cycles_at', '_stront_count', '_fuel_count', '_fuel_last_udpate', '_name', '_system', '_planet', '_moon', '_online', '_sov', '_type')
+
+    swagger_types = {
+        'cycles_at': int,
+        'stront_count': int,
+        'fuel_count': int,
+        'fuel_last_udpate': int,
+        'name': str,
+        'system': str,
+        'planet': int,
+        'moon': int,
+        'online': bool,
+        'sov': bool,
+        'type': int
+    }
+
+    attribute_map = {
+        'cycles_at': 'cycles_at',
+        'stront_count': 'stront_count',
+        'fuel_count': 'fuel_count',
+        'fuel_last_udpate': 'fuel_last_udpate',
+        'name':'name',
+        'system': 'system',
+        'planet': 'planet',
+        'moon': 'moon',
+        'online': 'online',
+        'sov': 'sov',
+        'type': 'type'
+    }
+
     def __init__(self, cycles_at: int=None, fuel_count: int=None, fuel_last_udpate: int=None, name: str=None, system: str=None, planet: int=None, moon: int=None, online: bool=None, sov: bool=None, type: int=None):
         """
         NewTower - a model defined in Swagger
@@ -37,34 +67,6 @@ class NewTower(Model):
         :param type: The type of this NewTower.
         :type type: int
         """
-        self.swagger_types = {
-            'cycles_at': int,
-            'stront_count': int,
-            'fuel_count': int,
-            'fuel_last_udpate': int,
-            'name': str,
-            'system': str,
-            'planet': int,
-            'moon': int,
-            'online': bool,
-            'sov': bool,
-            'type': int
-        }
-
-        self.attribute_map = {
-            'cycles_at': 'cycles_at',
-            'stront_count': 'stront_count',
-            'fuel_count': 'fuel_count',
-            'fuel_last_udpate': 'fuel_last_udpate',
-            'name':'name',
-            'system': 'system',
-            'planet': 'planet',
-            'moon': 'moon',
-            'online': 'online',
-            'sov': 'sov',
-            'type': 'type'
-        }
-
         self._cycles_at = cycles_at
         self._stront_count = stront_count
         self._fuel_count = fuel_count
@@ -12,6 +12,24 @@ class Operation(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_master_key', '_name', '_public_name', '_tower_count', '_sub_key_count')
+
+    swagger_types = {
+        'master_key': str,
+        'name': str,
+        'public_name': str,
+        'tower_count': int,
+        'sub_key_count': int
+    }
+
+    attribute_map = {
+        'master_key': 'master_key',
+        'name': 'name',
+        'public_name': 'public_name',
+        'tower_count': 'tower_count',
+        'sub_key_count': 'sub_key_count'
+    }
+
     def __init__(self, master_key: str=None, name: str=None, public_name: str=None, tower_count: int=None, sub_key_count: int=None):
         """
         Operation - a model defined in Swagger
@@ -27,22 +45,6 @@ class Operation(Model):
         :param sub_key_count: The sub_key_count of this Operation.
         :type sub_key_count: int
         """
-        self.swagger_types = {
-            'master_key': str,
-            'name': str,
-            'public_name': str,
-            'tower_count': int,
-            'sub_key_count': int
-        }
-
-        self.attribute_map = {
-            'master_key': 'master_key',
-            'name': 'name',
-            'public_name': 'public_name',
-            'tower_count': 'tower_count',
-            'sub_key_count': 'sub_key_count'
-        }
-
         self._master_key = master_key
         self._name = name
         self._public_name = public_name
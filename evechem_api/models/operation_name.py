@@ -12,6 +12,18 @@ class OperationName(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_name', '_public_name')
+
+    swagger_types = {
+        'name': str,
+        'public_name': str
+    }
+
+    attribute_map = {
+        'name': 'name',
+        'public_name': 'public_name'
+    }
+
     def __init__(self, name: str=None, public_name: str=None):
         """
         OperationName - a model defined in Swagger
@@ -21,16 +33,6 @@ class OperationName(Model):
         :param public_name: The public_name of this OperationName.
         :type public_name: str
         """
-        self.swagger_types = {
-            'name': str,
-            'public_name': str
-        }
-
-        self.attribute_map = {
-            'name': 'name',
-            'public_name': 'public_name'
-        }
-
         self._name = name
         self._public_name = public_name
 
@@ -13,6 +13,20 @@ class Process(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_equipment', '_final_outputs', '_id')
+
+    swagger_types = {
+        'equipment': List[int],
+        'final_outputs': List[int],
+        'id': float
+    }
+
+    attribute_map = {
+        'equipment': 'equipment',
+        'final_outputs': 'final_outputs',
+        'id': 'id'
+    }
+
     def __init__(self, equipment: List[int]=None, final_outputs: List[int]=None, id: float=None):
         """
         Process - a model defined in Swagger
@@ -24,18 +38,6 @@ class Process(Model):
         :param id: The id of this Process.
         :type id: float
         """ 
-        self.swagger_types = {
-            'equipment': List[int],
-            'final_outputs': List[int],
-            'id': float
-        }
-
-        self.attribute_map = {
-            'equipment': 'equipment',
-            'final_outputs': 'final_outputs',
-            'id': 'id'
-        }
-
         self._equipment = equipment
         self._final_outputs = final_outputs
         self._id = id
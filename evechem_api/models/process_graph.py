@@ -0,0 +1,96 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from evechem_api.models.process_graph_link import ProcessGraphLink
+from evechem_api.models.process_graph_node import ProcessGraphNode
+from .base_model_ import Model
+from datetime import date, datetime
+from typing import List, Dict
+from ..util import deserialize_model
+
+
+class ProcessGraph(Model):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    __slots__ = ('_equipment', '_links')
+
+    swagger_types = {
+        'equipment': List[ProcessGraphNode],
+        'links': List[ProcessGraphLink]
+    }
+
+    attribute_map = {
+        'equipment': 'equipment',
+        'links': 'links'
+    }
+
+    def __init__(self, equipment: List[ProcessGraphNode]=None, links: List[ProcessGraphLink]=None):
+        """
+        ProcessGraph - a model defined in Swagger
+
+        :param equipment: The equipment of this ProcessGraph.
+        :type equipment: List[ProcessGraphNode]
+        :param links: The links of this ProcessGraph.
+        :type links: List[ProcessGraphLink]
+        """
+        self._equipment = equipment
+        self._links = links
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'ProcessGraph':
+        """
+        Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The process_graph of this ProcessGraph.
+        :rtype: ProcessGraph
+        """
+        return deserialize_model(dikt, cls)
+
+    @property
+    def equipment(self) -> List[ProcessGraphNode]:
+        """
+        Gets the equipment of this ProcessGraph.
+
+        :return: The equipment of this ProcessGraph.
+        :rtype: List[ProcessGraphNode]
+        """
+        return self._equipment
+
+    @equipment.setter
+    def equipment(self, equipment: List[ProcessGraphNode]):
+        """
+        Sets the equipment of this ProcessGraph.
+
+        :param equipment: The equipment of this ProcessGraph.
+        :type equipment: List[ProcessGraphNode]
+        """
+        if equipment is None:
+            raise ValueError("Invalid value for `equipment`, must not be `None`")
+
+        self._equipment = equipment
+
+    @property
+    def links(self) -> List[ProcessGraphLink]:
+        """
+        Gets the links of this ProcessGraph.
+
+        :return: The links of this ProcessGraph.
+        :rtype: List[ProcessGraphLink]
+        """
+        return self._links
+
+    @links.setter
+    def links(self, links: List[ProcessGraphLink]):
+        """
+        Sets the links of this ProcessGraph.
+
+        :param links: The links of this ProcessGraph.
+        :type links: List[ProcessGraphLink]
+        """
+
+        self._links = links
+
@@ -0,0 +1,130 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from .base_model_ import Model
+from datetime import date, datetime
+from typing import List, Dict
+from ..util import deserialize_model
+
+
+class ProcessGraphLink(Model):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    __slots__ = ('_source', '_target', '_material')
+
+    swagger_types = {
+        'source': str,
+        'target': str,
+        'material': int
+    }
+
+    attribute_map = {
+        'source': 'source',
+        'target': 'target',
+        'material': 'material'
+    }
+
+    def __init__(self, source: str=None, target: str=None, material: int=None):
+        """
+        ProcessGraphLink - a model defined in Swagger
+
+        :param source: The source of this ProcessGraphLink.
+        :type source: str
+        :param target: The target of this ProcessGraphLink.
+        :type target: str
+        :param material: The material of this ProcessGraphLink.
+        :type material: int
+        """
+        self._source = source
+        self._target = target
+        self._material = material
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'ProcessGraphLink':
+        """
+        Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The process_graph_link of this ProcessGraphLink.
+        :rtype: ProcessGraphLink
+        """
+        return deserialize_model(dikt, cls)
+
+    @property
+    def source(self) -> str:
+        """
+        Gets the source of this ProcessGraphLink.
+        `key` of the equipment that is the source of this link.
+
+        :return: The source of this ProcessGraphLink.
+        :rtype: str
+        """
+        return self._source
+
+    @source.setter
+    def source(self, source: str):
+        """
+        Sets the source of this ProcessGraphLink.
+        `key` of the equipment that is the source of this link.
+
+        :param source: The source of this ProcessGraphLink.
+        :type source: str
+        """
+        if source is None:
+            raise ValueError("Invalid value for `source`, must not be `None`")
+
+        self._source = source
+
+    @property
+    def target(self) -> str:
+        """
+        Gets the target of this ProcessGraphLink.
+        `key` of the equipment that is the target of this link.
+
+        :return: The target of this ProcessGraphLink.
+        :rtype: str
+        """
+        return self._target
+
+    @target.setter
+    def target(self, target: str):
+        """
+        Sets the target of this ProcessGraphLink.
+        `key` of the equipment that is the target of this link.
+
+        :param target: The target of this ProcessGraphLink.
+        :type target: str
+        """
+        if target is None:
+            raise ValueError("Invalid value for `target`, must not be `None`")
+
+        self._target = target
+
+    @property
+    def material(self) -> int:
+        """
+        Gets the material of this ProcessGraphLink.
+        type_id of the linked material.
+
+        :return: The material of this ProcessGraphLink.
+        :rtype: int
+        """
+        return self._material
+
+    @material.setter
+    def material(self, material: int):
+        """
+        Sets the material of this ProcessGraphLink.
+        type_id of the linked material.
+
+        :param material: The material of this ProcessGraphLink.
+        :type material: int
+        """
+        if material is None:
+            raise ValueError("Invalid value for `material`, must not be `None`")
+
+        self._material = material
+
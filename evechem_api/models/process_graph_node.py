@@ -0,0 +1,202 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from .base_model_ import Model
+from datetime import date, datetime
+from typing import List, Dict
+from ..util import deserialize_model
+
+
+class ProcessGraphNode(Model):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    __slots__ = ('_key', '_type', '_name', '_resource', '_contains', '_online')
+
+    swagger_types = {
+        'key': str,
+        'type': int,
+        'name': str,
+        'resource': int,
+        'contains': int,
+        'online': bool
+    }
+
+    attribute_map = {
+        'key': 'key',
+        'type': 'type',
+        'name': 'name',
+        'resource': 'resource',
+        'contains': 'contains',
+        'online': 'online'
+    }
+
+    def __init__(self, key: str=None, type: int=None, name: str=None, resource: int=None, contains: int=None, online: bool=None):
+        """
+        ProcessGraphNode - a model defined in Swagger
+
+        :param key: The key of this ProcessGraphNode.
+        :type key: str
+        :param type: The type of this ProcessGraphNode.
+        :type type: int
+        :param name: The name of this ProcessGraphNode.
+        :type name: str
+        :param resource: The resource of this ProcessGraphNode.
+        :type resource: int
+        :param contains: The contains of this ProcessGraphNode.
+        :type contains: int
+        :param online: The online of this ProcessGraphNode.
+        :type online: bool
+        """
+        self._key = key
+        self._type = type
+        self._name = name
+        self._resource = resource
+        self._contains = contains
+        self._online = online
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'ProcessGraphNode':
+        """
+        Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The process_graph_node of this ProcessGraphNode.
+        :rtype: ProcessGraphNode
+        """
+        return deserialize_model(dikt, cls)
+
+    @property
+    def key(self) -> str:
+        """
+        Gets the key of this ProcessGraphNode.
+        Name the links of this graph use to refer to this equipment.
+
+        :return: The key of this ProcessGraphNode.
+        :rtype: str
+        """
+        return self._key
+
+    @key.setter
+    def key(self, key: str):
+        """
+        Sets the key of this ProcessGraphNode.
+        Name the links of this graph use to refer to this equipment.
+
+        :param key: The key of this ProcessGraphNode.
+        :type key: str
+        """
+        if key is None:
+            raise ValueError("Invalid value for `key`, must not be `None`")
+
+        self._key = key
+
+    @property
+    def type(self) -> int:
+        """
+        Gets the type of this ProcessGraphNode.
+
+        :return: The type of this ProcessGraphNode.
+        :rtype: int
+        """
+        return self._type
+
+    @type.setter
+    def type(self, type: int):
+        """
+        Sets the type of this ProcessGraphNode.
+
+        :param type: The type of this ProcessGraphNode.
+        :type type: int
+        """
+        if type is None:
+            raise ValueError("Invalid value for `type`, must not be `None`")
+
+        self._type = type
+
+    @property
+    def name(self) -> str:
+        """
+        Gets the name of this ProcessGraphNode.
+
+        :return: The name of this ProcessGraphNode.
+        :rtype: str
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        """
+        Sets the name of this ProcessGraphNode.
+
+        :param name: The name of this ProcessGraphNode.
+        :type name: str
+        """
+
+        self._name = name
+
+    @property
+    def resource(self) -> int:
+        """
+        Gets the resource of this ProcessGraphNode.
+
+        :return: The resource of this ProcessGraphNode.
+        :rtype: int
+        """
+        return self._resource
+
+    @resource.setter
+    def resource(self, resource: int):
+        """
+        Sets the resource of this ProcessGraphNode.
+
+        :param resource: The resource of this ProcessGraphNode.
+        :type resource: int
+        """
+
+        self._resource = resource
+
+    @property
+    def contains(self) -> int:
+        """
+        Gets the contains of this ProcessGraphNode.
+
+        :return: The contains of this ProcessGraphNode.
+        :rtype: int
+        """
+        return self._contains
+
+    @contains.setter
+    def contains(self, contains: int):
+        """
+        Sets the contains of this ProcessGraphNode.
+
+        :param contains: The contains of this ProcessGraphNode.
+        :type contains: int
+        """
+
+        self._contains = contains
+
+    @property
+    def online(self) -> bool:
+        """
+        Gets the online of this ProcessGraphNode.
+
+        :return: The online of this ProcessGraphNode.
+        :rtype: bool
+        """
+        return self._online
+
+    @online.setter
+    def online(self, online: bool):
+        """
+        Sets the online of this ProcessGraphNode.
+
+        :param online: The online of this ProcessGraphNode.
+        :type online: bool
+        """
+
+        self._online = online
+
@@ -13,6 +13,22 @@ class Reaction(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_type', '_name', '_outputs', '_inputs')
+
+    swagger_types = {
+        'type': int,
+        'name': str,
+        'outputs': List[ReactionMaterial],
+        'inputs': List[ReactionMaterial]
+    }
+
+    attribute_map = {
+        'type': 'type',
+        'name': 'name',
+        'outputs': 'outputs',
+        'inputs': 'inputs'
+    }
+
     def __init__(self, type: int=None, name: str=None, outputs: List[ReactionMaterial]=None, inputs: List[ReactionMaterial]=None ):
         """
         Reaction - a model defined in Swagger
@@ -26,22 +42,6 @@ class Reaction(Model):
         :param type: The type of this Reaction.
         :type type: int
         """
-        self.swagger_types = {
-            'type': int,
-            'name': str,
-            'outputs': List[ReactionMaterial],
-            'inputs': List[ReactionMaterial]          
-            
-            
-        }
-
-        self.attribute_map = {
-            'type': 'type',
-            'name': 'name',
-            'outputs': 'outputs',
-            'inputs': 'inputs'
-        }
-
         self._inputs = inputs
         self._name = name
         self._outputs = outputs
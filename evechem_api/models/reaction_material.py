@@ -12,6 +12,20 @@ class ReactionMaterial(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_type', '_name', '_amount')
+
+    swagger_types = {
+        'type': int,
+        'name': str,
+        'amount': int
+    }
+
+    attribute_map = {
+        'type': 'type',
+        'name': 'name',
+        'amount': 'amount'
+    }
+
     def __init__(self, type: int=None, name: str=None, amount: int=None, ):
         """
         ReactionMaterial - a model defined in Swagger
@@ -23,18 +37,6 @@ class ReactionMaterial(Model):
         :param name: The name of this ReactionMaterial.
         :type name: str
         """
-        self.swagger_types = {
-            'type': int,
-            'name': str,
-            'amount': int
-        }
-
-        self.attribute_map = {
-            'type': 'type',
-            'name': 'name',
-            'amount': 'amount'            
-        }
-
         self._type = type
         self._name = name
         self._amount = amount
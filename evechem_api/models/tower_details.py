@@ -12,6 +12,40 @@ class TowerDetails(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_cycles_at', '_stront_count', '_fuel_count', '_fuel_last_update', '_id', '_system', '_planet', '_moon', '_name', '_online', '_processes', '_sov', '_type')
+
+    swagger_types = {
+        'cycles_at': int,
+        'stront_count': int,
+        'fuel_count': int,
+        'fuel_last_update': int,
+        'id': int,
+        'system': str,
+        'planet': int,
+        'moon': int,
+        'name': str,
+        'online': bool,
+        'processes': List[int],
+        'sov': bool,
+        'type': int
+    }
+
+    attribute_map = {
+        'cycles_at': 'cycles_at',
+        'stront_count': 'stront_count',
+        'fuel_count': 'fuel_count',
+        'fuel_last_update': 'fuel_last_update',
+        'id': 'id',
+        'system': 'system',
+        'planet': 'planet',
+        'moon': 'moon',
+        'name': 'name',
+        'online': 'online',
+        'processes': 'processes',
+        'sov': 'sov',
+        'type': 'type'
+    }
+
     def __init__(self, cycles_at: int=None, stront_count: int=None, fuel_count: int=None, fuel_last_update: int=None, id: int=None, system: str=None, planet: int=None, moon: int=None, name: str=None, online: bool=None, processes: List[int]=None, sov: bool=None, type: int=None):
         """
         TowerDetails - a model defined in Swagger
@@ -43,38 +77,6 @@ class TowerDetails(Model):
         :param type: The type of this TowerDetails.
         :type type: int
         """
-        self.swagger_types = {
-            'cycles_at': int,
-            'stront_count': int,
-            'fuel_count': int,
-            'fuel_last_update': int,
-            'id': int,
-            'system': str,
-            'planet': int,
-            'moon': int,
-            'name': str,
-            'online': bool,
-            'processes': List[int],
-            'sov': bool,
-            'type': int
-        }
-
-        self.attribute_map = {
-            'cycles_at': 'cycles_at',
-            'stront_count': 'stront_count',
-            'fuel_count': 'fuel_count',
-            'fuel_last_update': 'fuel_last_update',
-            'id': 'id',
-            'system': 'system',
-            'planet': 'planet',
-            'moon': 'moon',
-            'name': 'name',
-            'online': 'online',
-            'processes': 'processes',
-            'sov': 'sov',
-            'type': 'type'
-        }
-
         self._cycles_at = cycles_at
         self._stront_count = stront_count
         self._fuel_count = fuel_count
@@ -0,0 +1,260 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from .base_model_ import Model
+from datetime import date, datetime
+from typing import List, Dict
+from ..util import deserialize_model
+
+
+class TowerFuel(Model):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    __slots__ = ('_tower_id', '_fuel_count', '_fuel_usage', '_hours_remaining', '_empty_at', '_refuel_quantity', '_stront_count', '_reinforce_hours')
+
+    swagger_types = {
+        'tower_id': int,
+        'fuel_count': int,
+        'fuel_usage': int,
+        'hours_remaining': float,
+        'empty_at': int,
+        'refuel_quantity': int,
+        'stront_count': int,
+        'reinforce_hours': float
+    }
+
+    attribute_map = {
+        'tower_id': 'tower_id',
+        'fuel_count': 'fuel_count',
+        'fuel_usage': 'fuel_usage',
+        'hours_remaining': 'hours_remaining',
+        'empty_at': 'empty_at',
+        'refuel_quantity': 'refuel_quantity',
+        'stront_count': 'stront_count',
+        'reinforce_hours': 'reinforce_hours'
+    }
+
+    def __init__(self, tower_id: int=None, fuel_count: int=None, fuel_usage: int=None, hours_remaining: float=None, empty_at: int=None, refuel_quantity: int=None, stront_count: int=None, reinforce_hours: float=None):
+        """
+        TowerFuel - a model defined in Swagger
+
+        :param tower_id: The tower_id of this TowerFuel.
+        :type tower_id: int
+        :param fuel_count: The fuel_count of this TowerFuel.
+        :type fuel_count: int
+        :param fuel_usage: The fuel_usage of this TowerFuel.
+        :type fuel_usage: int
+        :param hours_remaining: The hours_remaining of this TowerFuel.
+        :type hours_remaining: float
+        :param empty_at: The empty_at of this TowerFuel.
+        :type empty_at: int
+        :param refuel_quantity: The refuel_quantity of this TowerFuel.
+        :type refuel_quantity: int
+        :param stront_count: The stront_count of this TowerFuel.
+        :type stront_count: int
+        :param reinforce_hours: The reinforce_hours of this TowerFuel.
+        :type reinforce_hours: float
+        """
+        self._tower_id = tower_id
+        self._fuel_count = fuel_count
+        self._fuel_usage = fuel_usage
+        self._hours_remaining = hours_remaining
+        self._empty_at = empty_at
+        self._refuel_quantity = refuel_quantity
+        self._stront_count = stront_count
+        self._reinforce_hours = reinforce_hours
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'TowerFuel':
+        """
+        Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The tower_fuel of this TowerFuel.
+        :rtype: TowerFuel
+        """
+        return deserialize_model(dikt, cls)
+
+    @property
+    def tower_id(self) -> int:
+        """
+        Gets the tower_id of this TowerFuel.
+
+        :return: The tower_id of this TowerFuel.
+        :rtype: int
+        """
+        return self._tower_id
+
+    @tower_id.setter
+    def tower_id(self, tower_id: int):
+        """
+        Sets the tower_id of this TowerFuel.
+
+        :param tower_id: The tower_id of this TowerFuel.
+        :type tower_id: int
+        """
+
+        self._tower_id = tower_id
+
+    @property
+    def fuel_count(self) -> int:
+        """
+        Gets the fuel_count of this TowerFuel.
+        Projected fuel blocks in the fuel bay now. 
+
+        :return: The fuel_count of this TowerFuel.
+        :rtype: int
+        """
+        return self._fuel_count
+
+    @fuel_count.setter
+    def fuel_count(self, fuel_count: int):
+        """
+        Sets the fuel_count of this TowerFuel.
+        Projected fuel blocks in the fuel bay now. 
+
+        :param fuel_count: The fuel_count of this TowerFuel.
+        :type fuel_count: int
+        """
+
+        self._fuel_count = fuel_count
+
+    @property
+    def fuel_usage(self) -> int:
+        """
+        Gets the fuel_usage of this TowerFuel.
+        Fuel blocks used per hour, after any sovereignty discount. 
+
+        :return: The fuel_usage of this TowerFuel.
+        :rtype: int
+        """
+        return self._fuel_usage
+
+    @fuel_usage.setter
+    def fuel_usage(self, fuel_usage: int):
+        """
+        Sets the fuel_usage of this TowerFuel.
+        Fuel blocks used per hour, after any sovereignty discount. 
+
+        :param fuel_usage: The fuel_usage of this TowerFuel.
+        :type fuel_usage: int
+        """
+
+        self._fuel_usage = fuel_usage
+
+    @property
+    def hours_remaining(self) -> float:
+        """
+        Gets the hours_remaining of this TowerFuel.
+        Hours until the tower runs out of fuel, `null` if it is not burning fuel. 
+
+        :return: The hours_remaining of this TowerFuel.
+        :rtype: float
+        """
+        return self._hours_remaining
+
+    @hours_remaining.setter
+    def hours_remaining(self, hours_remaining: float):
+        """
+        Sets the hours_remaining of this TowerFuel.
+        Hours until the tower runs out of fuel, `null` if it is not burning fuel. 
+
+        :param hours_remaining: The hours_remaining of this TowerFuel.
+        :type hours_remaining: float
+        """
+
+        self._hours_remaining = hours_remaining
+
+    @property
+    def empty_at(self) -> int:
+        """
+        Gets the empty_at of this TowerFuel.
+        Epoch time of the first cycle the tower cannot pay for. 
+
+        :return: The empty_at of this TowerFuel.
+        :rtype: int
+        """
+        return self._empty_at
+
+    @empty_at.setter
+    def empty_at(self, empty_at: int):
+        """
+        Sets the empty_at of this TowerFuel.
+        Epoch time of the first cycle the tower cannot pay for. 
+
+        :param empty_at: The empty_at of this TowerFuel.
+        :type empty_at: int
+        """
+
+        self._empty_at = empty_at
+
+    @property
+    def refuel_quantity(self) -> int:
+        """
+        Gets the refuel_quantity of this TowerFuel.
+        Fuel blocks needed to fill the fuel bay. 
+
+        :return: The refuel_quantity of this TowerFuel.
+        :rtype: int
+        """
+        return self._refuel_quantity
+
+    @refuel_quantity.setter
+    def refuel_quantity(self, refuel_quantity: int):
+        """
+        Sets the refuel_quantity of this TowerFuel.
+        Fuel blocks needed to fill the fuel bay. 
+
+        :param refuel_quantity: The refuel_quantity of this TowerFuel.
+        :type refuel_quantity: int
+        """
+
+        self._refuel_quantity = refuel_quantity
+
+    @property
+    def stront_count(self) -> int:
+        """
+        Gets the stront_count of this TowerFuel.
+
+        :return: The stront_count of this TowerFuel.
+        :rtype: int
+        """
+        return self._stront_count
+
+    @stront_count.setter
+    def stront_count(self, stront_count: int):
+        """
+        Sets the stront_count of this TowerFuel.
+
+        :param stront_count: The stront_count of this TowerFuel.
+        :type stront_count: int
+        """
+
+        self._stront_count = stront_count
+
+    @property
+    def reinforce_hours(self) -> float:
+        """
+        Gets the reinforce_hours of this TowerFuel.
+        Hours of reinforcement the strontium bay can hold. 
+
+        :return: The reinforce_hours of this TowerFuel.
+        :rtype: float
+        """
+        return self._reinforce_hours
+
+    @reinforce_hours.setter
+    def reinforce_hours(self, reinforce_hours: float):
+        """
+        Sets the reinforce_hours of this TowerFuel.
+        Hours of reinforcement the strontium bay can hold. 
+
+        :param reinforce_hours: The reinforce_hours of this TowerFuel.
+        :type reinforce_hours: float
+        """
+
+        self._reinforce_hours = reinforce_hours
+
@@ -12,6 +12,34 @@ class TowerInfo(Model):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    __slots__ = ('_type', '_fuel_bay', '_stront_bay', '_name', '_storage_mult', '_cpu', '_powergrid', '_fuel_usage', '_stront_usage', '_fuel_type')
+
+    swagger_types = {
+        'type': int,
+        'fuel_bay': int,
+        'stront_bay': int,
+        'name': str,
+        'storage_mult': float,
+        'cpu': float,
+        'powergrid': float,
+        'fuel_usage': int,
+        'stront_usage': int,
+        'fuel_type': int
+    }
+
+    attribute_map = {
+        'type': 'type',
+        'fuel_bay': 'fuel_bay',
+        'stront_bay': 'stront_bay',
+        'name': 'name',
+        'storage_mult': 'storage_mult',
+        'cpu': 'cpu',
+        'powergrid': 'powergrid',
+        'fuel_usage': 'fuel_usage',
+        'stront_usage': 'stront_usage',
+        'fuel_type': 'fuel_type'
+    }
+
     def __init__(self, type: int=None, fuel_bay: int=None, stront_bay: int=None, name: str=None, storage_mult: float=None, cpu: float=None, powergrid: float=None, fuel_usage: int=None, stront_usage: int=None, fuel_type: int=None):
         """
         TowerInfo - a model defined in Swagger
@@ -37,32 +65,6 @@ class TowerInfo(Model):
         :param fuel_type: The fuel_type of this TowerInfo.
         :type fuel_type: int
         """
-        self.swagger_types = {
-            'type': int,
-            'fuel_bay': int,
-            'stront_bay': int,
-            'name': str,
-            'storage_mult': float,
-            'cpu': float,
-            'powergrid': float,
-            'fuel_usage': int,
-            'stront_usage': int,
-            'fuel_type': int
-        }
-
-        self.attribute_map = {
-            'type': 'type',
-            'fuel_bay': 'fuel_bay',
-            'stront_bay': 'stront_bay',
-            'name': 'name',
-            'storage_mult': 'storage_mult',
-            'cpu': 'cpu',
-            'powergrid': 'powergrid',
-            'fuel_usage': 'fuel_usage',
-            'stront_usage': 'stront_usage',
-            'fuel_type': 'fuel_type'
-        }
-
         self._type = type
         self._fuel_bay = fuel_bay
         self._stront_bay = stront_bay
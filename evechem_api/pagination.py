@@ -0,0 +1,56 @@
+# coding: utf-8
+'''Keyset pagination and field selection for list endpoints.
+
+Pages are ordered by a unique key (a row id, a type id or a key value).  A request
+passes `limit` and the last key it has seen as `after`; when a page is full
+the response carries the key to continue from in the `X-Next-After` header.
+Unlike offsets, a keyset page costs the same however deep into the list it is.
+
+`keyset` pages a query; `SortedRows` pages an in-memory sequence such as the
+info catalog.
+'''
+import bisect
+
+NEXT_HEADER = 'X-Next-After'
+
+
+def keyset(query, column, limit=None, after=None):
+    '''keyset(query, column, limit, after)
+
+    Orders `query` by `column` and restricts it to the page after `after`.
+    '''
+    query = query.order_by(column)
+    if after is not None:
+        query = query.filter(column > after)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+class SortedRows(object):
+    '''Rows sorted once by `key`, paged with a binary search.'''
+
+    def __init__(self, rows, key):
+        self.rows = tuple(sorted(rows, key=key))
+        self.keys = tuple(key(row) for row in self.rows)
+
+    def page(self, limit=None, after=None):
+        '''The rows after the key `after`, at most `limit` of them.'''
+        start = 0 if after is None else bisect.bisect_right(self.keys, after)
+        stop = len(self.rows) if limit is None else start + limit
+        return self.rows[start:stop]
+
+def paged(limit, after):
+    '''True if the request asked for a page rather than the whole list.'''
+    return limit is not None or after is not None
+
+def next_headers(keys, limit):
+    '''Response headers pointing at the next page, given the keys of this one.'''
+    if limit is None or len(keys) < limit:
+        return {}
+    return {NEXT_HEADER: str(keys[-1])}
+
+def selected(fields, available):
+    '''The requested `fields` in `available` order, or all of them if none were requested.'''
+    if not fields:
+        return tuple(available)
+    return tuple(f for f in available if f in fields)
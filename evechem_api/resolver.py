@@ -0,0 +1,62 @@
+# coding: utf-8
+'''Operation resolver that imports controllers on first use.
+
+Connexion normally imports every controller module (and through them every
+model) while `add_api` reads the spec.  `LazyResolver` hands connexion a
+stand-in for each operation instead; the controller module is imported the
+first time one of its operations is called, so a worker only pays for the
+controllers it actually serves.
+'''
+import inspect
+from importlib.util import find_spec
+from threading import Lock
+
+from connexion.resolver import Resolver
+from connexion.utils import get_function_from_name
+
+
+def deferred(name):
+    '''deferred(name)
+
+    Returns a function calling the controller `name` (a dotted path), which
+    is only imported on the first call.  A controller module that does not
+    exist still fails at startup with an `ImportError`.  Connexion sees a
+    `**kwargs` signature and passes every request parameter, so the arguments
+    are narrowed to the ones the controller accepts before it is called.
+    '''
+    module, _, function_name = name.rpartition('.')
+    if find_spec(module) is None:
+        raise ImportError('No module named {!r}'.format(module))
+
+    loaded = []
+    lock = Lock()
+
+    def load():
+        if len(loaded) == 0:
+            with lock:
+                if len(loaded) == 0:
+                    function = get_function_from_name(name)
+                    parameters = inspect.signature(function).parameters.values()
+                    if any(p.kind == p.VAR_KEYWORD for p in parameters):
+                        accepted = None
+                    else:
+                        accepted = frozenset(p.name for p in parameters)
+                    loaded.append((function, accepted))
+        return loaded[0]
+
+    def call(*args, **kwargs):
+        function, accepted = load()
+        if accepted is not None:
+            kwargs = {k: v for k, v in kwargs.items() if k in accepted}
+        return function(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = function_name
+    call.__module__ = module
+    return call
+
+
+class LazyResolver(Resolver):
+    '''Resolves operation ids to `deferred` controllers.'''
+
+    def __init__(self):
+        super(LazyResolver, self).__init__(function_resolver=deferred)
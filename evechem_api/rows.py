@@ -0,0 +1,25 @@
+# coding: utf-8
+'''Direct row-to-dict rendering for read-only listings.
+
+Hot listings can skip the `Model` objects: column values are turned straight
+into the dicts the encoder would have produced from the models, with the same
+keys in the same order and `None` fields left out, so the JSON is byte for
+byte the same.  Set `EVECHEM_ROW_DICTS=0` to build models instead, for
+example to compare the two paths.
+'''
+import os
+
+ENABLED = os.environ.get('EVECHEM_ROW_DICTS', '1') != '0'
+
+
+def build(model, values, fields):
+    '''build(model, values, fields)
+
+    Returns the selected `fields` of the `values` dict as a plain dict when
+    the direct path is enabled, otherwise as a `model` instance.  `fields`
+    must be in the model's field order; fields missing from `values` are
+    left out.
+    '''
+    if ENABLED:
+        return {f: values[f] for f in fields if values.get(f) is not None}
+    return model(**{f: values[f] for f in fields if f in values})
@@ -0,0 +1,74 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+
+class KeyCache(object):
+	'''In-process cache of key lookups.
+
+	Found keys are kept in a bounded LRU with a short time-to-live, so a
+	change in the key store is picked up within `ttl` seconds even without an
+	explicit invalidation.  Keys that were not found are kept in a separate,
+	smaller LRU (`negative_ttl`), so repeated guesses at bad keys do not reach
+	the database, and cannot push valid keys out of the cache.
+	'''
+	def __init__(self, max_size=1024, ttl=30, negative_size=4096, negative_ttl=10, clock=time.monotonic):
+		self.max_size = max_size
+		self.ttl = ttl
+		self.negative_size = negative_size
+		self.negative_ttl = negative_ttl
+		self.clock = clock
+
+		self._found = OrderedDict()
+		self._missing = OrderedDict()
+		self._lock = Lock()
+
+	def get(self, value):
+		'''get(value)
+		Returns a `(hit, key)` tuple.  `key` is None for a cached miss.
+		'''
+		now = self.clock()
+		with self._lock:
+			for entries in (self._found, self._missing):
+				entry = entries.get(value)
+				if entry is None:
+					continue
+				expires, key = entry
+				if expires <= now:
+					del entries[value]
+					continue
+				entries.move_to_end(value)
+				return True, key
+		return False, None
+
+	def put(self, value, key):
+		'''put(value, key)
+		Caches the result of looking up `value`.  Pass `None` for a key that
+		was not found.
+		'''
+		if key is None:
+			entries, size, ttl = self._missing, self.negative_size, self.negative_ttl
+		else:
+			entries, size, ttl = self._found, self.max_size, self.ttl
+
+		with self._lock:
+			entries[value] = (self.clock() + ttl, key)
+			entries.move_to_end(value)
+			while len(entries) > size:
+				entries.popitem(last=False)
+
+	def invalidate(self, value):
+		'''Drops any cached result for `value`.'''
+		with self._lock:
+			self._found.pop(value, None)
+			self._missing.pop(value, None)
+
+	def invalidate_where(self, predicate):
+		'''Drops every cached key for which `predicate(key)` is true.'''
+		with self._lock:
+			for value in [v for v, (_, key) in self._found.items() if predicate(key)]:
+				del self._found[value]
+
+	def clear(self):
+		with self._lock:
+			self._found.clear()
+			self._missing.clear()
@@ -1,5 +1,8 @@
+import os
+
 from .base import BaseKey, BaseKeyControl
 from .exceptions import KeyNotFound
+from .cache import KeyCache
 from evechem_api.maps import application_map
 
 from evechem_api.models import Error
@@ -17,8 +20,27 @@ class APIKey(BaseKey):
 		self.operation_id = operation_id
 		self.name = name
 
+	# shared by every restricted controller, see `invalidate` for revocations.
+	# EVECHEM_KEY_CACHE_TTL bounds how long another worker process can keep
+	# accepting a revoked key; 0 turns the cache off.
+	cache = KeyCache(
+		ttl=float(os.environ.get('EVECHEM_KEY_CACHE_TTL', 30)),
+		negative_ttl=float(os.environ.get('EVECHEM_KEY_CACHE_NEGATIVE_TTL', 10)))
+
 	@classmethod
 	def lookup(cls, key_value):
+		hit, key = cls.cache.get(key_value)
+		if not hit:
+			key = cls._query(key_value)
+			cls.cache.put(key_value, key)
+
+		if key is not None:
+			return key
+		else:
+			raise KeyNotFound("Key {} was not found.".format(key_value))
+
+	@classmethod
+	def _query(cls, key_value):
 		qKey = application_map.Key
 		session = application_map.Session()
 		q = session.query(qKey).filter(qKey.value == key_value)
@@ -32,7 +54,22 @@ class APIKey(BaseKey):
 				)
 			return key
 		else:
-			raise KeyNotFound("Key {} was not found.".format(key_value))
+			return None
+
+	@classmethod
+	def invalidate(cls, key_value=None, operation_id=None):
+		'''invalidate(key_value, operation_id)
+		Drops cached lookups for a single key value and/or every key of an
+		operation.  Must be called whenever a key is deleted or its permission
+		changes.  Only the cache of this process is cleared: here the change
+		takes effect on the next request, but other worker processes keep
+		their cached lookup for up to `EVECHEM_KEY_CACHE_TTL` seconds (30 by
+		default).  Set it to 0 where revocations must apply at once everywhere.
+		'''
+		if key_value is not None:
+			cls.cache.invalidate(key_value)
+		if operation_id is not None:
+			cls.cache.invalidate_where(lambda key: key.operation_id == operation_id)
 
 class APIKeyControl(BaseKeyControl):
 
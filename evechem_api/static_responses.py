@@ -0,0 +1,126 @@
+# coding: utf-8
+'''Pre-rendered responses for endpoints whose output never changes at runtime.
+
+The `/info/...` routes only read the static catalog, so the JSON body of each
+route is rendered once, tagged with a strong ETag and kept alongside a gzip
+copy.  Requests are answered from those bytes (or with a 304 when the client
+already holds the current ETag) instead of rebuilding and re-encoding models.
+'''
+import functools
+import gzip
+import hashlib
+import inspect
+from threading import Lock
+
+import connexion
+import flask
+
+from . import encoder
+
+
+class StaticResponse(object):
+    '''Serialized body of a single controller result.'''
+
+    def __init__(self, data, status=200, headers=None):
+        self.status = status
+        self.headers = dict(headers or {})
+        self.body = encoder.dumps(data)
+        self.gzip_body = gzip.compress(self.body)
+
+        digest = hashlib.sha1(self.body).hexdigest()
+        self.etag = digest
+        # a different encoding of the same body is a different representation
+        self.gzip_etag = digest + '-gzip'
+
+    def respond(self, request):
+        '''respond(request)
+
+        Builds a `flask.Response` for `request`, honouring `If-None-Match` and
+        `Accept-Encoding`.
+        '''
+        use_gzip = request.accept_encodings['gzip'] > 0
+        etag = self.gzip_etag if use_gzip else self.etag
+
+        # If-None-Match uses the weak comparison (RFC 7232, 3.2)
+        if request.if_none_match.contains_weak(self.etag) or request.if_none_match.contains_weak(self.gzip_etag):
+            response = flask.Response(status=304)
+        else:
+            response = flask.Response(
+                self.gzip_body if use_gzip else self.body,
+                status=self.status,
+                mimetype='application/json')
+            if use_gzip:
+                response.headers['Content-Encoding'] = 'gzip'
+            response.headers.extend(self.headers)
+
+        response.set_etag(etag)
+        response.vary.add('Accept-Encoding')
+        return response
+
+
+class StaticResponseCache(object):
+    '''Keeps one `StaticResponse` per controller call.
+
+    Only successful (200) results are kept, so lookups of unknown type ids do
+    not grow the cache.  Paged and projected listings are keyed by their
+    `limit`/`after`/`fields` arguments; once `max_size` responses are held,
+    new argument combinations are rendered per request instead of stored.
+    '''
+
+    def __init__(self, max_size=4096):
+        self.max_size = max_size
+        self._responses = {}
+        self._controllers = []
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(controller, args, kwargs):
+        # array query parameters arrive as lists
+        items = tuple(sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in kwargs.items()))
+        return (controller.__name__, args, items)
+
+    def _render(self, controller, args, kwargs):
+        key = self._key(controller, args, kwargs)
+        response = self._responses.get(key)
+        if response is not None:
+            return response, None
+
+        result = controller(*args, **kwargs)
+        if not isinstance(result, tuple):
+            result = (result, 200)
+        if result[1] != 200:
+            return None, result
+
+        response = StaticResponse(*result)
+        with self._lock:
+            if len(self._responses) < self.max_size:
+                response = self._responses.setdefault(key, response)
+        return response, None
+
+    def cached(self, controller):
+        '''Decorator serving `controller` from pre-rendered bytes.'''
+        self._controllers.append(controller)
+
+        @functools.wraps(controller)
+        def cached_controller(*args, **kwargs):
+            response, result = self._render(controller, args, kwargs)
+            if response is None:
+                return result
+            return response.respond(connexion.request)
+
+        return cached_controller
+
+    def warm(self):
+        '''warm()
+
+        Renders every registered controller whose parameters are all optional.
+        '''
+        for controller in self._controllers:
+            parameters = inspect.signature(controller).parameters.values()
+            if all(p.default is not p.empty for p in parameters):
+                self._render(controller, (), {})
+
+
+cache = StaticResponseCache()
@@ -0,0 +1,233 @@
+# coding: utf-8
+'''Production-chain throughput projection.
+
+Projects hourly material flow through the equipment and links of one or more
+processes: how fast every link moves material, how fast every silo fills or
+drains, when it will be full or empty, and which reactors are held back by
+their inputs.  Hours are `None` for a silo that never fills (or empties), as
+is the demand of a link into a silo, which takes whatever it is given.
+
+All links are solved together with NumPy arrays.  Catalog lookups (reaction
+quantities, silo capacities, material volumes) are done by `searchsorted` over
+sorted key arrays, so projecting an operation with hundreds of towers costs a
+handful of vector operations rather than a Python loop per node.
+'''
+import time
+from collections import namedtuple
+from threading import Lock
+
+import numpy as np
+
+from evechem_api.maps import application_map, info_catalog
+
+SILO_GROUP = 404 # Silo
+HARVESTER_GROUP = 416 # Moon Mining
+REACTOR_GROUP = 438 # Mobile Reactor
+
+HARVEST_RATE = 100 # units of moon material mined per hour
+
+LinkFlow = namedtuple('LinkFlow', ['source', 'target', 'material', 'rate', 'demand'])
+SiloProjection = namedtuple('SiloProjection', [
+    'equipment_id', 'material', 'contains', 'capacity', 'rate',
+    'hours_until_full', 'hours_until_empty'])
+Projection = namedtuple('Projection', ['flows', 'silos', 'bottlenecks'])
+
+
+def _io_key(reaction, material):
+    '''Packs (reaction, material) type ids into a single int64 key.'''
+    return (np.asarray(reaction, dtype=np.int64) << 32) | np.asarray(material, dtype=np.int64)
+
+def _sorted_table(keys, *columns):
+    order = np.argsort(keys, kind='stable')
+    return (np.asarray(keys)[order],) + tuple(np.asarray(c)[order] for c in columns)
+
+def _lookup(keys, values, query, default):
+    '''Vectorized `dict.get` over a sorted key array.'''
+    query = np.asarray(query, dtype=keys.dtype)
+    if len(keys) == 0:
+        return np.full(query.shape, default, dtype=np.result_type(values, type(default)))
+    idx = np.clip(np.searchsorted(keys, query), 0, len(keys) - 1)
+    return np.where(keys[idx] == query, values[idx], default)
+
+
+class CatalogArrays(object):
+    '''The parts of the info catalog used by the projection, as sorted arrays.'''
+
+    def __init__(self, catalog):
+        self.equipment_types, self.equipment_groups, self.equipment_capacity = _sorted_table(
+            np.array([e.type for e in catalog.equipment], dtype=np.int64),
+            np.array([e.group_id for e in catalog.equipment], dtype=np.int64),
+            np.array([e.capacity or 0 for e in catalog.equipment], dtype=np.float64))
+
+        self.material_types, self.material_volume = _sorted_table(
+            np.array([m.type for m in catalog.materials], dtype=np.int64),
+            np.array([m.volume or np.nan for m in catalog.materials], dtype=np.float64))
+
+        self.reaction_types, self.reaction_input_counts = _sorted_table(
+            np.array([r.type for r in catalog.reactions], dtype=np.int64),
+            np.array([len(r.inputs) for r in catalog.reactions], dtype=np.int64))
+
+        inputs = [(r.type, m.type, m.amount) for r in catalog.reactions for m in r.inputs]
+        outputs = [(r.type, m.type, m.amount) for r in catalog.reactions for m in r.outputs]
+        self.input_keys, self.input_amounts = self._io_table(inputs)
+        self.output_keys, self.output_amounts = self._io_table(outputs)
+
+    @staticmethod
+    def _io_table(rows):
+        if len(rows) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+        reaction, material, amount = zip(*rows)
+        return _sorted_table(_io_key(reaction, material), np.array(amount, dtype=np.float64))
+
+
+_arrays = None
+_arrays_lock = Lock()
+
+def catalog_arrays():
+    '''Returns the `CatalogArrays` for the static catalog, built on first use.'''
+    global _arrays
+    if _arrays is None:
+        with _arrays_lock:
+            if _arrays is None:
+                _arrays = CatalogArrays(info_catalog.load())
+    return _arrays
+
+
+def _finite(value):
+    '''`value` as a float, or `None` for "never" (infinite), which JSON cannot encode.'''
+    return float(value) if np.isfinite(value) else None
+
+def _column(rows, index, default, dtype):
+    return np.array([default if row[index] is None else row[index] for row in rows], dtype=dtype)
+
+def project(equipment, links, now=None):
+    '''project(equipment, links, now)
+
+    Projects throughput for a set of equipment and the links between them.
+
+    :param equipment: `(id, type, resource, contains, last_updated, online, storage_mult)` rows.
+    :param links: `(source, target, material)` rows.
+    :param now: epoch seconds to project contents to (default: current time).
+
+    :rtype: Projection
+    '''
+    now = time.time() if now is None else now
+    arrays = catalog_arrays()
+
+    if len(equipment) == 0:
+        return Projection(flows=[], silos=[], bottlenecks=[])
+
+    ids = _column(equipment, 0, -1, np.int64)
+    types = _column(equipment, 1, -1, np.int64)
+    resource = _column(equipment, 2, -1, np.int64)
+    contains = _column(equipment, 3, 0, np.float64)
+    last_updated = _column(equipment, 4, now, np.float64)
+    online = _column(equipment, 5, False, bool)
+    storage_mult = _column(equipment, 6, 1, np.float64)
+    n = len(ids)
+
+    group = _lookup(arrays.equipment_types, arrays.equipment_groups, types, -1)
+    is_silo = group == SILO_GROUP
+    is_harvester = group == HARVESTER_GROUP
+    is_reactor = group == REACTOR_GROUP
+
+    # map link endpoints to equipment indexes, dropping links that leave the set
+    order = np.argsort(ids)
+    sorted_ids = ids[order]
+    if len(links) > 0:
+        source = np.array([l[0] for l in links], dtype=np.int64)
+        target = np.array([l[1] for l in links], dtype=np.int64)
+        material = np.array([l[2] for l in links], dtype=np.int64)
+    else:
+        source = target = material = np.zeros(0, dtype=np.int64)
+    src = order[np.clip(np.searchsorted(sorted_ids, source), 0, n - 1)]
+    tgt = order[np.clip(np.searchsorted(sorted_ids, target), 0, n - 1)]
+    known = (ids[src] == source) & (ids[tgt] == target)
+    source, target, material, src, tgt = source[known], target[known], material[known], src[known], tgt[known]
+
+    # a reactor only runs with every input material linked in
+    input_amount = _lookup(arrays.input_keys, arrays.input_amounts, _io_key(resource[tgt], material), 0.0)
+    feeds_input = is_reactor[tgt] & (input_amount > 0)
+    fed = np.unique(_io_key(tgt[feeds_input], material[feeds_input]))
+    linked_inputs = np.bincount((fed >> 32).astype(np.int64), minlength=n)
+    required_inputs = _lookup(arrays.reaction_types, arrays.reaction_input_counts, resource, 0)
+    runs = online & (is_harvester | (is_reactor & (required_inputs > 0) & (linked_inputs >= required_inputs)))
+
+    # what each source can push and each target can take per hour
+    output_amount = _lookup(arrays.output_keys, arrays.output_amounts, _io_key(resource[src], material), 0.0)
+    supply = np.where(
+        is_silo[src], np.inf, np.where(
+        is_harvester[src] & (resource[src] == material), HARVEST_RATE, output_amount))
+    supply = np.where(runs[src] | is_silo[src], supply, 0.0)
+
+    demand = np.where(is_silo[tgt], np.inf, np.where(runs[tgt], input_amount, 0.0))
+
+    rate = np.minimum(supply, demand)
+    rate[~np.isfinite(rate)] = 0.0 # silo to silo links are not driven by anything
+
+    # silo levels
+    net = np.bincount(tgt, weights=rate, minlength=n) - np.bincount(src, weights=rate, minlength=n)
+    volume = _lookup(arrays.material_types, arrays.material_volume, resource, np.nan)
+    capacity = np.floor(
+        _lookup(arrays.equipment_types, arrays.equipment_capacity, types, 0.0) * storage_mult / volume)
+    elapsed = np.maximum(now - last_updated, 0) / 3600.0
+    current = np.clip(contains + net * elapsed, 0, capacity)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hours_full = np.where(net > 0, (capacity - current) / net, np.inf)
+        hours_empty = np.where(net < 0, current / -net, np.inf)
+
+    # reactors missing an input, fed less than they consume, or fed from an empty silo
+    starved_link = (demand > rate) & ~is_silo[tgt]
+    empty_source = is_silo[src] & (hours_empty[src] == 0)
+    starved = np.zeros(n, dtype=bool)
+    starved[tgt[(starved_link | empty_source) & is_reactor[tgt] & online[tgt]]] = True
+    starved |= is_reactor & online & ~runs
+
+    silo_index = np.flatnonzero(is_silo & np.isfinite(capacity))
+    silos = [
+        SiloProjection(int(ids[i]), int(resource[i]), float(current[i]), float(capacity[i]),
+            float(net[i]), _finite(hours_full[i]), _finite(hours_empty[i]))
+        for i in silo_index]
+    flows = [
+        LinkFlow(int(s), int(t), int(m), float(r), _finite(d))
+        for s, t, m, r, d in zip(source, target, material, rate, demand)]
+
+    return Projection(flows=flows, silos=silos, bottlenecks=sorted(int(i) for i in ids[starved]))
+
+
+def _project_query(session, equipment_filter, now):
+    qEquipment = application_map.Equipment
+    qProcess = application_map.Process
+    qTower = application_map.Tower
+    qLink = application_map.Link
+
+    catalog = info_catalog.load()
+
+    q_equipment = session.query(
+            qEquipment.id, qEquipment.type, qEquipment.resource, qEquipment.contains,
+            qEquipment.last_updated, qEquipment.online, qTower.type) \
+        .join(qProcess, qEquipment.process_id==qProcess.id) \
+        .join(qTower, qProcess.tower_id==qTower.id) \
+        .filter(equipment_filter)
+
+    equipment = []
+    for row in q_equipment:
+        tower = catalog.tower_by_type.get(row[6])
+        equipment.append(tuple(row[:6]) + (tower.storage_mult if tower is not None else 1,))
+
+    q_links = session.query(qLink.source, qLink.target, qLink.resource) \
+        .join(qEquipment, qLink.source==qEquipment.id) \
+        .join(qProcess, qEquipment.process_id==qProcess.id) \
+        .join(qTower, qProcess.tower_id==qTower.id) \
+        .filter(equipment_filter)
+
+    return project(equipment, q_links.all(), now)
+
+def project_processes(session, process_ids, now=None):
+    '''Projects every equipment of the given processes in one call.'''
+    return _project_query(session, application_map.Process.id.in_(process_ids), now)
+
+def project_operation(session, operation_id, now=None):
+    '''Projects every equipment of every tower in an operation in one call.'''
+    return _project_query(session, application_map.Tower.op_id == operation_id, now)
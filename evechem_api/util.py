@@ -1,7 +1,17 @@
-from typing import GenericMeta
 from datetime import datetime, date
+from threading import RLock
 from six import integer_types, iteritems
 
+try:
+    from typing import get_args, get_origin
+except ImportError: # python < 3.8
+    def get_origin(tp):
+        # python 3.6 keeps the builtin in `__extra__`, 3.7 in `__origin__`
+        return getattr(tp, '__extra__', None) or getattr(tp, '__origin__', None)
+
+    def get_args(tp):
+        return getattr(tp, '__args__', None) or ()
+
 
 def _deserialize(data, klass):
     """
@@ -15,21 +25,107 @@ def _deserialize(data, klass):
     if data is None:
         return None
 
+    return _converter(klass)(data)
+
+
+_converters = {}
+_converters_lock = RLock() # reentrant, building a model builds its field types
+# converters of the build in progress, only touched with the lock held and
+# published to `_converters` once the outermost build has finished
+_pending = {}
+
+def _converter(klass):
+    """
+    Returns the function that deserializes (non-null) data into `klass`.
+    It is built on the first request for each type and cached.
+
+    :param klass: class literal or `typing` generic.
+
+    :return: function.
+    """
+    try:
+        return _converters[klass]
+    except KeyError:
+        pass
+
+    with _converters_lock:
+        converter = _converters.get(klass) or _pending.get(klass)
+        if converter is not None:
+            return converter
+
+        outermost = len(_pending) == 0
+        # models may refer to themselves, so a forwarding function stands in
+        # while the real one is built
+        built = []
+        _pending[klass] = lambda data: built[0](data)
+        try:
+            built.append(_build_converter(klass))
+        except Exception:
+            if outermost:
+                _pending.clear()
+            raise
+        _pending[klass] = built[0]
+
+        if outermost:
+            _converters.update(_pending)
+            _pending.clear()
+    return built[0]
+
+
+def _build_converter(klass):
     if klass in integer_types or klass in (float, str, bool):
-        return _deserialize_primitive(data, klass)
+        return lambda data: _deserialize_primitive(data, klass)
     elif klass == object:
-        return _deserialize_object(data)
+        return _deserialize_object
     elif klass == date:
-        return deserialize_date(data)
+        return deserialize_date
     elif klass == datetime:
-        return deserialize_datetime(data)
-    elif type(klass) == GenericMeta:
-        if klass.__extra__ == list:
-            return _deserialize_list(data, klass.__args__[0])
-        if klass.__extra__ == dict:
-            return _deserialize_dict(data, klass.__args__[1])
+        return deserialize_datetime
+
+    origin = get_origin(klass)
+    if origin is list:
+        item = _converter(get_args(klass)[0])
+        return lambda data: [None if v is None else item(v) for v in data]
+    elif origin is dict:
+        value = _converter(get_args(klass)[1])
+        return lambda data: {k: None if v is None else value(v) for k, v in iteritems(data)}
     else:
-        return deserialize_model(data, klass)
+        return _compile_model(klass)
+
+
+def _compile_model(klass):
+    """
+    Generates a straight-line deserializer for the model `klass`: one
+    `in` test, conversion and property assignment per field, with the field
+    converters bound as locals.
+
+    :param klass: class literal.
+
+    :return: function.
+    """
+    if not klass.swagger_types:
+        return _deserialize_object
+
+    namespace = {'klass': klass}
+    lines = [
+        'def deserialize(data):',
+        '    instance = klass()',
+        '    if not isinstance(data, dict):',
+        '        return instance',
+    ]
+    for index, (attr, attr_type) in enumerate(iteritems(klass.swagger_types)):
+        namespace['convert_{}'.format(index)] = _converter(attr_type)
+        key = klass.attribute_map[attr]
+        lines.extend([
+            '    if {!r} in data:'.format(key),
+            '        value = data[{!r}]'.format(key),
+            '        instance.{} = None if value is None else convert_{}(value)'.format(attr, index),
+        ])
+    lines.append('    return instance')
+
+    code = compile('\n'.join(lines), '<deserialize {}>'.format(klass.__name__), 'exec')
+    exec(code, namespace)
+    return namespace['deserialize']
 
 
 def _deserialize_primitive(data, klass):
@@ -103,19 +199,7 @@ def deserialize_model(data, klass):
     :param klass: class literal.
     :return: model object.
     """
-    instance = klass()
-
-    if not instance.swagger_types:
-        return data
-
-    for attr, attr_type in iteritems(instance.swagger_types):
-        if data is not None \
-                and instance.attribute_map[attr] in data \
-                and isinstance(data, (list, dict)):
-            value = data[instance.attribute_map[attr]]
-            setattr(instance, attr, _deserialize(value, attr_type))
-
-    return instance
+    return _converter(klass)(data)
 
 
 def _deserialize_list(data, boxed_type):
@@ -0,0 +1,10 @@
+# coding: utf-8
+import os
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'evechem_api', 'data')
+
+
+def load_script(connection, name):
+    '''Runs the sql script `name` from evechem_api/data on `connection`.'''
+    with open(os.path.join(DATA_DIR, name)) as f:
+        connection.executescript(f.read())
@@ -0,0 +1,19 @@
+# coding: utf-8
+import sqlite3
+
+import pytest
+
+from . import load_script
+
+
+@pytest.fixture
+def info_db(tmp_path):
+    '''Path of a sqlite file loaded with info.sql.'''
+    path = str(tmp_path / 'info.db')
+    connection = sqlite3.connect(path)
+    try:
+        load_script(connection, 'info.sql')
+        connection.commit()
+    finally:
+        connection.close()
+    return path
@@ -0,0 +1,40 @@
+# coding: utf-8
+import json
+
+import pytest
+
+from evechem_api import encoder
+from evechem_api.models.equipment import Equipment
+from evechem_api.models.link import Link
+
+EQUIPMENT = [
+    Equipment(id=1, type=14343, name='Silo', resource=16634, contains=100, online=True,
+        inputs=[Link(source=2, material=16634)], outputs=[]),
+    Equipment(id=2, type=16221, name='Harvester \u00e9\u2013\U0001f680', resource=16634,
+        inputs=[], outputs=[Link(target=1, material=16634)]),
+]
+
+
+def flask_dumps(o):
+    '''A connexion response body: flask.json with its default settings.'''
+    return json.dumps(o, indent=2, sort_keys=True, ensure_ascii=True, cls=encoder.JSONEncoder) + '\n'
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def backend(request, monkeypatch):
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(encoder, 'orjson', None)
+    return request.param
+
+
+def test_dumps_matches_connexion_responses(backend):
+    assert encoder.dumps(EQUIPMENT).decode('ascii') == flask_dumps(EQUIPMENT)
+
+def test_dumps_sorts_keys(backend):
+    keys = [line.split('"')[1] for line in encoder.dumps(EQUIPMENT[0]).decode('ascii').splitlines() if line.startswith('  "')]
+    assert keys == sorted(keys)
+
+def test_dumps_escapes_non_ascii(backend):
+    body = encoder.dumps({'name': '\u00e9'})
+    assert body == b'{\n  "name": "\\u00e9"\n}\n'
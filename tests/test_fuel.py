@@ -0,0 +1,93 @@
+# coding: utf-8
+import pytest
+
+from evechem_api import fuel
+from evechem_api.maps import info_catalog
+
+TOWER_TYPE = 1
+FUEL_TYPE = 2
+# 40 blocks an hour, 400 strontium an hour, a 140000 m3 bay of 5 m3 blocks
+TOWER = info_catalog.TowerRow(TOWER_TYPE, 140000, 50000, 'Tower', 1, 5000, 750000, 40, 400, FUEL_TYPE)
+FUEL = info_catalog.MaterialRow(FUEL_TYPE, 1136, 'Fuel Block', 5)
+BAY = 140000 // 5
+
+LAST_UPDATE = 1500000000
+# cycles run on the hour (minute 0); the first one after LAST_UPDATE
+FIRST_CYCLE = 1500001200
+
+
+class Catalog(object):
+    tower_by_type = {TOWER_TYPE: TOWER}
+    material_by_type = {FUEL_TYPE: FUEL}
+
+@pytest.fixture(autouse=True)
+def catalog(monkeypatch):
+    monkeypatch.setattr(info_catalog, 'load', lambda: Catalog())
+
+def tower(online=True, sov=False, fuel_count=400, last_update=LAST_UPDATE, stront_count=800):
+    return (7, TOWER_TYPE, online, sov, 0, fuel_count, last_update, stront_count)
+
+def project_one(row, now):
+    projections = fuel.project([row], now)
+    assert len(projections) == 1
+    return projections[0]
+
+
+def test_online_tower_burns_each_cycle():
+    # three cycles burnt: FIRST_CYCLE and the two after it
+    p = project_one(tower(), FIRST_CYCLE + 2 * fuel.CYCLE)
+
+    assert p.fuel_count == 400 - 3 * 40
+    assert p.fuel_usage == 40
+    assert p.empty_at == FIRST_CYCLE + 10 * fuel.CYCLE
+    assert p.hours_remaining == 8.0
+    assert p.refuel_quantity == BAY - 280
+    assert p.reinforce_hours == 2.0
+
+def test_no_cycle_before_the_first():
+    p = project_one(tower(), FIRST_CYCLE - 1)
+
+    assert p.fuel_count == 400
+    assert p.empty_at == FIRST_CYCLE + 10 * fuel.CYCLE
+
+def test_offline_tower_burns_nothing():
+    p = project_one(tower(online=False), FIRST_CYCLE + 2 * fuel.CYCLE)
+
+    assert p.fuel_count == 400
+    assert p.hours_remaining is None
+    assert p.empty_at is None
+    assert p.refuel_quantity == BAY - 400
+
+def test_sov_tower_uses_discounted_fuel():
+    p = project_one(tower(sov=True, fuel_count=300), FIRST_CYCLE + 2 * fuel.CYCLE)
+
+    assert p.fuel_usage == 30
+    assert p.fuel_count == 300 - 3 * 30
+    assert p.empty_at == FIRST_CYCLE + 10 * fuel.CYCLE
+    assert p.hours_remaining == 8.0
+
+def test_depleted_tower_stops_at_its_last_paid_cycle():
+    # not enough fuel for a single cycle, last updated ten days ago
+    now = LAST_UPDATE + 10 * 24 * 3600
+    p = project_one(tower(fuel_count=10), now)
+
+    assert p.fuel_count == 10
+    assert p.empty_at == FIRST_CYCLE
+    assert p.hours_remaining <= 0
+    assert p.hours_remaining == (FIRST_CYCLE - now) / float(fuel.CYCLE)
+
+def test_tower_that_ran_dry_keeps_the_remainder():
+    # pays for two cycles, then goes offline with 20 blocks left
+    now = FIRST_CYCLE + 100 * fuel.CYCLE
+    p = project_one(tower(fuel_count=100), now)
+
+    assert p.fuel_count == 20
+    assert p.empty_at == FIRST_CYCLE + 2 * fuel.CYCLE
+    assert p.hours_remaining < 0
+
+def test_towers_are_projected_together():
+    now = FIRST_CYCLE + 2 * fuel.CYCLE
+    rows = [tower(), tower(online=False), tower(sov=True, fuel_count=300), tower(fuel_count=10)]
+    together = fuel.project(rows, now)
+
+    assert together == [project_one(row, now) for row in rows]
@@ -0,0 +1,71 @@
+# coding: utf-8
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from evechem_api.controllers import info_controller
+from evechem_api.maps import info_catalog
+
+# groups, materials, reactions, reaction_io (select-in, material names
+# joined), allowed_groups, equipment and towers
+LOAD_STATEMENTS = 7
+
+REACTION_LISTINGS = [
+    info_controller.info_reactions_get,
+    info_controller.info_reactions_complex_get,
+    info_controller.info_reactions_complex_biochemical_get,
+    info_controller.info_reactions_polymer_get,
+    info_controller.info_reactions_simple_get,
+    info_controller.info_reactions_simple_biochemical_get,
+]
+
+
+@pytest.fixture
+def engine(info_db):
+    engine = create_engine('sqlite:///' + info_db)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def statements(engine):
+    '''Every SQL statement executed on `engine`.'''
+    executed = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+    event.listen(engine, 'before_cursor_execute', record)
+    yield executed
+    event.remove(engine, 'before_cursor_execute', record)
+
+@pytest.fixture
+def catalog(engine, statements, monkeypatch):
+    session = sessionmaker(bind=engine)()
+    try:
+        catalog = info_catalog.InfoCatalog.from_session(session)
+    finally:
+        session.close()
+    monkeypatch.setattr(info_catalog, '_catalog', catalog)
+    return catalog
+
+
+def test_load_statement_count(catalog, statements, info_db):
+    # independent of the number of reactions and reaction_io rows
+    assert len(statements) == LOAD_STATEMENTS
+
+    connection = sqlite3.connect(info_db)
+    try:
+        (io_rows,), = connection.execute('SELECT count(*) FROM reaction_io')
+    finally:
+        connection.close()
+    assert sum(len(r.inputs) + len(r.outputs) for r in catalog.reactions) == io_rows
+
+@pytest.mark.parametrize('listing', REACTION_LISTINGS, ids=lambda f: f.__name__)
+def test_reaction_listings_issue_no_statements(catalog, statements, listing):
+    del statements[:]
+    # the undecorated controller, without the static response cache
+    result = listing.__wrapped__()
+
+    assert statements == []
+    reactions = result[0] if isinstance(result, tuple) else result
+    assert len(reactions) > 0
@@ -0,0 +1,79 @@
+# coding: utf-8
+import pytest
+
+from evechem_api.security.cache import KeyCache
+from evechem_api.security.definitions import APIKey
+from evechem_api.security.exceptions import KeyNotFound
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_found_keys_expire_after_ttl():
+    clock = Clock()
+    cache = KeyCache(ttl=30, clock=clock)
+    cache.put('key', 'found')
+
+    clock.now = 29
+    assert cache.get('key') == (True, 'found')
+    clock.now = 30
+    assert cache.get('key') == (False, None)
+
+def test_zero_ttl_disables_caching():
+    cache = KeyCache(ttl=0, negative_ttl=0, clock=Clock())
+    cache.put('key', 'found')
+    cache.put('missing', None)
+
+    assert cache.get('key') == (False, None)
+    assert cache.get('missing') == (False, None)
+
+def test_invalidate_drops_found_and_missing():
+    cache = KeyCache(clock=Clock())
+    cache.put('key', 'found')
+    cache.put('missing', None)
+    cache.invalidate('key')
+    cache.invalidate('missing')
+
+    assert cache.get('key') == (False, None)
+    assert cache.get('missing') == (False, None)
+
+def test_least_recently_used_key_is_evicted():
+    cache = KeyCache(max_size=2, clock=Clock())
+    cache.put('recent', 'recent key')
+    cache.put('stale', 'stale key')
+    assert cache.get('recent') == (True, 'recent key')
+    cache.put('new', 'new key')
+
+    assert cache.get('stale') == (False, None)
+    assert cache.get('recent') == (True, 'recent key')
+    assert cache.get('new') == (True, 'new key')
+
+def test_missing_keys_are_bounded_separately():
+    cache = KeyCache(max_size=2, negative_size=2, clock=Clock())
+    cache.put('key', 'found')
+    for value in ('guess 1', 'guess 2', 'guess 3'):
+        cache.put(value, None)
+
+    assert cache.get('guess 1') == (False, None)
+    assert cache.get('guess 2') == (True, None)
+    assert cache.get('guess 3') == (True, None)
+    assert cache.get('key') == (True, 'found')
+
+def test_repeated_miss_is_answered_from_cache(monkeypatch):
+    queried = []
+    def query(key_value):
+        queried.append(key_value)
+        return None
+    monkeypatch.setattr(APIKey, 'cache', KeyCache(clock=Clock()))
+    monkeypatch.setattr(APIKey, '_query', staticmethod(query))
+
+    for _ in range(3):
+        with pytest.raises(KeyNotFound):
+            APIKey.lookup('guess')
+
+    assert queried == ['guess']
@@ -0,0 +1,105 @@
+# coding: utf-8
+import sqlite3
+import threading
+
+import pytest
+
+from evechem_api.maps import database
+
+from . import load_script
+
+
+def tables(path):
+    connection = sqlite3.connect(path)
+    try:
+        return set(row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'"))
+    finally:
+        connection.close()
+
+def versions(path):
+    connection = sqlite3.connect(path)
+    try:
+        return set(row[0] for row in connection.execute('SELECT version FROM schema_migrations'))
+    finally:
+        connection.close()
+
+def stale_applied(monkeypatch):
+    '''Makes migrate start from an empty view of schema_migrations.'''
+    applied = database._applied
+    def stale(engine):
+        applied(engine)
+        return set()
+    monkeypatch.setattr(database, '_applied', stale)
+
+@pytest.fixture
+def engine_at(tmp_path):
+    engines = []
+    def engine_at(path):
+        engine = database.make_engine('sqlite:///' + path)
+        engines.append(engine)
+        return engine
+    yield engine_at
+    for engine in engines:
+        engine.dispose()
+
+
+def test_failing_script_leaves_nothing_behind(tmp_path, engine_at):
+    migrations = tmp_path / 'migrations'
+    migrations.mkdir()
+    (migrations / '0001_first.sql').write_text('CREATE TABLE t0(a);')
+    (migrations / '0002_broken.sql').write_text('CREATE TABLE t1(a); CREATE TABLE bogus(;')
+    path = str(tmp_path / 'application.db')
+
+    with pytest.raises(Exception):
+        database.migrate(engine_at(path), str(migrations))
+
+    assert 't0' in tables(path)
+    assert 't1' not in tables(path)
+    assert versions(path) == {1}
+
+# the tables the migrations alter, as they were before version 1
+BASE_SCHEMA = '''
+CREATE TABLE keys (value TEXT PRIMARY KEY, permission TEXT, operation_id INTEGER, name TEXT);
+CREATE TABLE towers (id INTEGER PRIMARY KEY, op_id INTEGER);
+CREATE TABLE processes (id INTEGER PRIMARY KEY, tower_id INTEGER);
+CREATE TABLE equipment (id INTEGER PRIMARY KEY, process_id INTEGER);
+CREATE TABLE links (target INTEGER, source INTEGER, resource INTEGER, PRIMARY KEY(target, source, resource));
+'''
+
+def test_stale_applied_versions_are_skipped(tmp_path, engine_at, monkeypatch):
+    # a worker that read schema_migrations before another worker committed
+    path = str(tmp_path / 'application.db')
+    connection = sqlite3.connect(path)
+    load_script(connection, 'application.sql')
+    connection.close()
+    stale_applied(monkeypatch)
+
+    # re-running 0002 would fail on its ALTER TABLE ADD COLUMN
+    database.migrate(engine_at(path))
+
+    assert versions(path) == {1, 2}
+
+def test_concurrent_workers_apply_each_version_once(tmp_path, engine_at, monkeypatch):
+    path = str(tmp_path / 'application.db')
+    connection = sqlite3.connect(path)
+    connection.executescript(BASE_SCHEMA)
+    connection.close()
+    # both workers find nothing applied and race for every version
+    stale_applied(monkeypatch)
+
+    engines = [engine_at(path), engine_at(path)]
+    errors = []
+    def worker(engine):
+        try:
+            database.migrate(engine)
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target=worker, args=(engine,)) for engine in engines]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert versions(path) == {1, 2}
+    assert 'process_outputs' in tables(path)
@@ -0,0 +1,140 @@
+# coding: utf-8
+import os
+import re
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from evechem_api.controllers import operation_controller, starbase_controller
+from evechem_api.maps import application_map, info_catalog
+from evechem_api.security.cache import KeyCache
+from evechem_api.security.definitions import APIKey
+
+from . import load_script
+
+MASTER_KEY = 'query-plan-master-key'
+TOWER, PROCESS = 1, 10
+HARVESTER, SILO = 100, 101
+GAS = 16634 # Atmospheric Gases
+
+# an operation with one tower whose harvester feeds a silo; a second
+# operation so the filters have something to filter out
+SEED = '''
+INSERT INTO operations (id, name, public_name) VALUES (1, 'plans', 'plans'), (2, 'other', 'other');
+INSERT INTO keys (value, permission, operation_id, name) VALUES
+    ('{key}', 'master', 1, 'master'), ('other-key', 'master', 2, 'master');
+INSERT INTO towers (id, op_id, type, name, online, sov, cycles_at, stront_count, fuel_count, fuel_last_update) VALUES
+    ({tower}, 1, 12235, 'tower', 1, 0, 0, 0, 10000, 0), (2, 2, 12235, 'other', 1, 0, 0, 0, 10000, 0);
+INSERT INTO processes (id, tower_id) VALUES ({process}, {tower}), (20, 2);
+INSERT INTO equipment (id, type, name, process_id, last_updated, resource, contains, online) VALUES
+    ({harvester}, 16221, 'harvester', {process}, 0, {gas}, 0, 1),
+    ({silo}, 14343, 'silo', {process}, 0, {gas}, 0, 1);
+INSERT INTO links (target, source, resource) VALUES ({silo}, {harvester}, {gas});
+'''.format(key=MASTER_KEY, tower=TOWER, process=PROCESS, harvester=HARVESTER, silo=SILO, gas=GAS)
+
+# the read endpoints, paged where they page
+CONTROLLERS = {
+    'towers_get': lambda: starbase_controller.towers_get(api_key=MASTER_KEY, limit=10, after=0),
+    'towers_summary_get': lambda: starbase_controller.towers_summary_get(api_key=MASTER_KEY, limit=10, after=0),
+    'towers_fuel_get': lambda: starbase_controller.towers_fuel_get(api_key=MASTER_KEY),
+    'towers_tower_id_get': lambda: starbase_controller.towers_tower_id_get(TOWER, api_key=MASTER_KEY),
+    'processes_get': lambda: starbase_controller.towers_tower_id_processes_get(TOWER, api_key=MASTER_KEY),
+    'process_get': lambda: starbase_controller.towers_tower_id_processes_process_id_get(
+        TOWER, PROCESS, api_key=MASTER_KEY),
+    'equipment_get': lambda: starbase_controller.towers_tower_id_processes_process_id_equipment_get(
+        TOWER, PROCESS, api_key=MASTER_KEY, limit=10, after=0),
+    'equipment_id_get': lambda: starbase_controller.towers_tower_id_processes_process_id_equipment_equipment_id_get(
+        TOWER, PROCESS, SILO, api_key=MASTER_KEY),
+    'operation_keys_get': lambda: operation_controller.operation_keys_get(api_key=MASTER_KEY, limit=10, after=''),
+}
+
+# make_link's filter with the OR nested inside the resource condition
+MAKE_LINK_COMBINED = 'SELECT * FROM links WHERE resource = ? AND (source = ? OR target = ?)'
+
+
+def query_plan(path, statement, parameters):
+    connection = sqlite3.connect(path)
+    try:
+        return [row[-1] for row in connection.execute('EXPLAIN QUERY PLAN ' + statement, parameters)]
+    finally:
+        connection.close()
+
+@pytest.fixture(params=['schema', 'migrated'])
+def application_db(request, tmp_path):
+    '''Path of a seeded application.db, with the indexes of application.sql
+    as shipped or rebuilt by the migrations.'''
+    path = str(tmp_path / 'application.db')
+    connection = sqlite3.connect(path)
+    try:
+        load_script(connection, 'application.sql')
+        if request.param == 'migrated':
+            indexes = connection.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL").fetchall()
+            for name, in indexes:
+                connection.execute('DROP INDEX `{}`'.format(name))
+            load_script(connection, os.path.join('migrations', '0001_secondary_indexes.sql'))
+        connection.executescript(SEED)
+        connection.commit()
+    finally:
+        connection.close()
+    return path
+
+@pytest.fixture
+def selects(application_db, info_db, monkeypatch):
+    '''Every SELECT the application tables run, with its parameters.'''
+    engine = create_engine('sqlite:///' + application_db)
+    executed = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            executed.append((statement, parameters))
+    event.listen(engine, 'before_cursor_execute', record)
+
+    session = scoped_session(sessionmaker(bind=engine))
+    info_engine = create_engine('sqlite:///' + info_db)
+    monkeypatch.setattr(application_map, 'Session', session)
+    monkeypatch.setattr(APIKey, 'cache', KeyCache())
+    monkeypatch.setattr(info_catalog, '_catalog',
+        info_catalog.InfoCatalog.from_session(sessionmaker(bind=info_engine)()))
+    yield executed
+    session.remove()
+    engine.dispose()
+    info_engine.dispose()
+
+
+@pytest.mark.parametrize('name', sorted(CONTROLLERS))
+def test_controller_queries_use_indexes(application_db, selects, name):
+    response = CONTROLLERS[name]()
+    assert response[1] == 200, response
+    application_map.Session.remove()
+
+    assert selects
+    for statement, parameters in selects:
+        plan = query_plan(application_db, statement, parameters)
+        assert not any(re.match(r'SCAN (?!CONSTANT ROW)', step) for step in plan), (statement, plan)
+        assert any(step.startswith('SEARCH') for step in plan), (statement, plan)
+
+def test_make_link_searches_both_branches(application_db, selects):
+    qEquipment = application_map.Equipment
+    session = application_map.Session()
+    harvester, silo = session.query(qEquipment).filter(qEquipment.id.in_([HARVESTER, SILO])).order_by(qEquipment.id)
+    del selects[:]
+
+    starbase_controller.make_link(harvester, silo, GAS)
+    session.rollback()
+
+    (statement, parameters), = selects
+    plan = query_plan(application_db, statement, parameters)
+    assert 'MULTI-INDEX OR' in plan, plan
+    searches = [step for step in plan if step.startswith('SEARCH links')]
+    assert len(searches) == 2, plan
+    assert 'source=?' in searches[0], plan
+    assert 'target=?' in searches[1], plan
+
+def test_make_link_combined_filter_uses_resource_prefix_only(application_db):
+    # why make_link repeats `resource` in each branch: with the OR nested
+    # inside, only the resource column of an index is searched
+    plan = query_plan(application_db, MAKE_LINK_COMBINED, (GAS, HARVESTER, SILO))
+
+    assert len(plan) == 1
+    assert re.match(r'SEARCH links USING INDEX links_resource_\w+ \(resource=\?\)$', plan[0]), plan
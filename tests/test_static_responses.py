@@ -0,0 +1,28 @@
+# coding: utf-8
+import flask
+import pytest
+from werkzeug.test import EnvironBuilder
+
+from evechem_api.static_responses import StaticResponse
+
+
+def request(**headers):
+    return flask.Request(EnvironBuilder(path='/info/towers/', headers=headers).get_environ())
+
+@pytest.fixture
+def static():
+    return StaticResponse({'towers': [12235]})
+
+
+@pytest.mark.parametrize('if_none_match', ['"{}"', 'W/"{}"', '"{}-gzip"', 'W/"{}-gzip"', '*'])
+def test_current_etag_is_not_modified(static, if_none_match):
+    response = static.respond(request(**{'If-None-Match': if_none_match.format(static.etag)}))
+
+    assert response.status_code == 304
+    assert response.get_data() == b''
+
+def test_other_etag_gets_the_body(static):
+    response = static.respond(request(**{'If-None-Match': 'W/"stale"'}))
+
+    assert response.status_code == 200
+    assert response.get_data() == static.body
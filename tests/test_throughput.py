@@ -0,0 +1,102 @@
+# coding: utf-8
+import pytest
+
+from evechem_api import throughput
+from evechem_api.maps.info_catalog import EquipmentRow, MaterialRow, ReactionIORow, ReactionRow
+
+GAS = 1 # moon material, 1 m3
+PRODUCT = 2 # reaction output, 2 m3
+REACTION = 100 # 50 GAS -> 20 PRODUCT an hour
+
+HARVESTER_TYPE = 10
+SILO_TYPE = 11
+REACTOR_TYPE = 12
+
+NOW = 1500000000
+
+HARVESTER, SILO_IN, REACTOR, SILO_OUT = 1, 2, 3, 4
+LINKS = [(HARVESTER, SILO_IN, GAS), (SILO_IN, REACTOR, GAS), (REACTOR, SILO_OUT, PRODUCT)]
+
+
+class Catalog(object):
+    materials = [MaterialRow(GAS, 427, 'Gas', 1.0), MaterialRow(PRODUCT, 428, 'Product', 2.0)]
+    reactions = [ReactionRow(REACTION, 436, 'Reaction',
+        (ReactionIORow(GAS, 'Gas', 50),), (ReactionIORow(PRODUCT, 'Product', 20),))]
+    equipment = [
+        EquipmentRow(HARVESTER_TYPE, throughput.HARVESTER_GROUP, 'Harvester', 1, 0, 0, ()),
+        EquipmentRow(SILO_TYPE, throughput.SILO_GROUP, 'Silo', 1000, 0, 0, ()),
+        EquipmentRow(REACTOR_TYPE, throughput.REACTOR_GROUP, 'Reactor', 1, 0, 0, ()),
+    ]
+
+@pytest.fixture(autouse=True)
+def catalog(monkeypatch):
+    monkeypatch.setattr(throughput, '_arrays', throughput.CatalogArrays(Catalog()))
+
+def chain(harvester_online=True, silo_in=0, silo_out=100, updated=NOW):
+    '''harvester -> silo -> reactor -> silo'''
+    return [
+        (HARVESTER, HARVESTER_TYPE, GAS, 0, updated, harvester_online, 1),
+        (SILO_IN, SILO_TYPE, GAS, silo_in, updated, True, 1),
+        (REACTOR, REACTOR_TYPE, REACTION, 0, updated, True, 1),
+        (SILO_OUT, SILO_TYPE, PRODUCT, silo_out, updated, True, 1),
+    ]
+
+def by_id(silos):
+    return {s.equipment_id: s for s in silos}
+
+
+def test_link_rates():
+    projection = throughput.project(chain(), LINKS, NOW)
+
+    assert projection.flows == [
+        # a silo takes whatever it is given
+        throughput.LinkFlow(HARVESTER, SILO_IN, GAS, throughput.HARVEST_RATE, None),
+        throughput.LinkFlow(SILO_IN, REACTOR, GAS, 50.0, 50.0),
+        throughput.LinkFlow(REACTOR, SILO_OUT, PRODUCT, 20.0, None),
+    ]
+    assert projection.bottlenecks == []
+
+def test_silo_fill_hours():
+    silos = by_id(throughput.project(chain(), LINKS, NOW).silos)
+
+    # 100 in, 50 out, 1000 units of 1 m3
+    assert silos[SILO_IN].rate == 50.0
+    assert silos[SILO_IN].capacity == 1000.0
+    assert silos[SILO_IN].hours_until_full == 20.0
+    assert silos[SILO_IN].hours_until_empty is None
+    # 20 in, 500 units of 2 m3, 100 held
+    assert silos[SILO_OUT].capacity == 500.0
+    assert silos[SILO_OUT].hours_until_full == 20.0
+    assert silos[SILO_OUT].hours_until_empty is None
+
+def test_contents_projected_to_now():
+    silos = by_id(throughput.project(chain(updated=NOW - 2 * 3600), LINKS, NOW).silos)
+
+    assert silos[SILO_IN].contains == 100.0
+    assert silos[SILO_IN].hours_until_full == 18.0
+    assert silos[SILO_OUT].contains == 140.0
+
+def test_silo_empty_hours_and_bottleneck():
+    # the harvester is offline, so the reactor drains its input silo
+    projection = throughput.project(chain(harvester_online=False, silo_in=100), LINKS, NOW)
+    silos = by_id(projection.silos)
+
+    assert silos[SILO_IN].rate == -50.0
+    assert silos[SILO_IN].hours_until_empty == 2.0
+    assert silos[SILO_IN].hours_until_full is None
+    assert projection.bottlenecks == []
+
+    # two hours later the silo is empty and holds the reactor back
+    projection = throughput.project(chain(harvester_online=False, silo_in=100), LINKS, NOW + 2 * 3600)
+    assert by_id(projection.silos)[SILO_IN].hours_until_empty == 0.0
+    assert projection.bottlenecks == [REACTOR]
+
+def test_reactor_without_input_is_a_bottleneck():
+    projection = throughput.project(chain(), [LINKS[0], LINKS[2]], NOW)
+    silos = by_id(projection.silos)
+
+    assert projection.bottlenecks == [REACTOR]
+    assert projection.flows[1].rate == 0.0
+    assert silos[SILO_OUT].rate == 0.0
+    assert silos[SILO_OUT].hours_until_full is None
+    assert silos[SILO_OUT].hours_until_empty is None
@@ -0,0 +1,52 @@
+# coding: utf-8
+import threading
+import time
+from typing import List
+
+from evechem_api import util
+
+
+class Node(object):
+    '''A self-referencing model, like `Process` and its children.'''
+    swagger_types = {}
+    attribute_map = {'name': 'name', 'children': 'children'}
+
+Node.swagger_types = {'name': str, 'children': List[Node]}
+
+
+def test_self_referencing_model():
+    node = util.deserialize_model({'name': 'a', 'children': [{'name': 'b', 'children': []}]}, Node)
+
+    assert node.name == 'a'
+    assert node.children[0].name == 'b'
+    assert node.children[0].children == []
+
+def test_concurrent_first_use(monkeypatch):
+    # keep the first thread building while the second one asks for the same type
+    compile_model = util._compile_model
+    def slow_compile(klass):
+        time.sleep(0.05)
+        return compile_model(klass)
+    monkeypatch.setattr(util, '_compile_model', slow_compile)
+    monkeypatch.setattr(util, '_converters', {})
+
+    class Link(object):
+        swagger_types = {'source': int, 'target': int}
+        attribute_map = {'source': 'source', 'target': 'target'}
+
+    results = []
+    errors = []
+    def deserialize():
+        try:
+            results.append(util.deserialize_model({'source': 1, 'target': 2}, Link))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=deserialize) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert [(link.source, link.target) for link in results] == [(1, 2), (1, 2)]